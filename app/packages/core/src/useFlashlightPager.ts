@@ -57,8 +57,17 @@ const useFlashlightPager = (
   );
 
   const pager = useMemo(() => {
+    // the last cursor of each page, which allows the server to paginate by
+    // key rather than by offset where possible
+    const cursors = new Map<number, string>();
+
     return async (pageNumber: number) => {
       const variables = page(pageNumber, PAGE_SIZE);
+      const after = cursors.get(pageNumber - 1);
+      if (after) {
+        variables.after = after;
+      }
+
       const zoomValue = await zoom();
       return new Promise<Response<number>>((resolve) => {
         const subscription = fetchQuery<foq.paginateSamplesQuery>(
@@ -75,6 +84,10 @@ const useFlashlightPager = (
               zoomValue
             );
 
+            const edges = data.samples.edges;
+            edges.length &&
+              cursors.set(pageNumber, edges[edges.length - 1].cursor);
+
             subscription.unsubscribe();
             !pageNumber && setIsEmpty(!items.length);
 
@@ -25,16 +25,116 @@ export async function fetchPlot({
   labelField,
   slices,
 }) {
-  const res = await getFetchFunction()("POST", "/embeddings/plot", {
-    datasetName,
-    brainKey,
-    view,
-    labelField,
-    slices,
-  });
-  return handleErrors(res);
+  const res = await getFetchFunction()(
+    "POST",
+    "/embeddings/plot",
+    {
+      datasetName,
+      brainKey,
+      view,
+      labelField,
+      slices,
+      format: "binary",
+    },
+    "arrayBuffer"
+  );
+  return handleErrors(decodePlot(res as ArrayBuffer));
 }
 
+const PLOT_MAGIC = "FOEP";
+const HEX = Array.from({ length: 256 }, (_, i) =>
+  i.toString(16).padStart(2, "0")
+);
+
+/**
+ * Decodes the binary format returned by `/embeddings/plot` into traces whose
+ * coordinates are stored in typed arrays
+ */
+function decodePlot(buffer: ArrayBuffer) {
+  const bytes = new Uint8Array(buffer);
+  const decoder = new TextDecoder();
+  if (decoder.decode(bytes.subarray(0, 4)) !== PLOT_MAGIC) {
+    // errors are returned as JSON
+    return JSON.parse(decoder.decode(bytes));
+  }
+
+  const headerLength = new DataView(buffer).getUint32(4, true);
+  const { count, has_sample_ids, labels_type, categories, ...info } =
+    JSON.parse(decoder.decode(bytes.subarray(8, 8 + headerLength)));
+
+  let offset = 8 + headerLength;
+  const points = new Float32Array(buffer, offset, 2 * count);
+  offset += 8 * count;
+
+  const readIds = () => {
+    const ids = new Array<string>(count);
+    for (let i = 0; i < count; i++) {
+      let id = "";
+      for (let j = 0; j < 12; j++) {
+        id += HEX[bytes[offset + 12 * i + j]];
+      }
+      ids[i] = id;
+    }
+    offset += 12 * count;
+    return ids;
+  };
+
+  const ids = readIds();
+  const sampleIds = has_sample_ids ? readIds() : ids;
+
+  let getLabel: (i: number) => string | number | null = () => null;
+  if (labels_type === "float") {
+    const values = new Float32Array(buffer, offset, count);
+    getLabel = (i) => (Number.isNaN(values[i]) ? null : values[i]);
+  } else if (labels_type === "codes") {
+    const codes = new Int32Array(buffer, offset, count);
+    getLabel = (i) => (codes[i] < 0 ? null : categories[codes[i]]);
+  }
+
+  // group points into one trace per category, sized in a first pass so that
+  // each trace's coordinates can be written directly into typed arrays
+  const keys = new Array<string>(count);
+  const sizes: { [key: string]: number } = {};
+  for (let i = 0; i < count; i++) {
+    const key = info.style === "categorical" ? String(getLabel(i)) : "points";
+    keys[i] = key;
+    sizes[key] = (sizes[key] || 0) + 1;
+  }
+
+  const traces: { [key: string]: PlotTrace } = {};
+  const filled: { [key: string]: number } = {};
+  for (const [key, size] of Object.entries(sizes)) {
+    traces[key] = {
+      x: new Float32Array(size),
+      y: new Float32Array(size),
+      ids: new Array<string>(size),
+      sampleIds: new Array<string>(size),
+      labels: new Array<string | number | null>(size),
+    };
+    filled[key] = 0;
+  }
+
+  for (let i = 0; i < count; i++) {
+    const trace = traces[keys[i]];
+    const j = filled[keys[i]]++;
+    trace.x[j] = points[2 * i];
+    trace.y[j] = points[2 * i + 1];
+    trace.ids[j] = ids[i];
+    trace.sampleIds[j] = sampleIds[i];
+    trace.labels[j] = getLabel(i);
+  }
+
+  return { ...info, traces };
+}
+
+export type PlotTrace = {
+  x: Float32Array;
+  y: Float32Array;
+  ids: string[];
+  sampleIds: string[];
+  labels: (string | number | null)[];
+};
+
 function handleErrors(res) {
   if (!res || !res.error) {
     return res;
@@ -1,9 +1,9 @@
-import { findIndexByKeyValue } from "./findIndexByKeyValue";
+import { PlotTrace } from "./fetch";
 
-export function getPointIndex(trace, id) {
-  let idx = findIndexByKeyValue(trace, "id", id);
-  if (idx === undefined || idx === null) {
-    idx = findIndexByKeyValue(trace, "sample_id", id);
+export function getPointIndex(trace: PlotTrace, id: string) {
+  let idx = trace.ids.indexOf(id);
+  if (idx < 0) {
+    idx = trace.sampleIds.indexOf(id);
   }
-  return idx;
+  return idx < 0 ? null : idx;
 }
@@ -42,9 +42,9 @@ export function tracesToData(
       );
 
       return {
-        x: trace.map((d) => d.points[0]),
-        y: trace.map((d) => d.points[1]),
-        ids: trace.map((d) => d.id),
+        x: trace.x,
+        y: trace.y,
+        ids: trace.ids,
         type: "scattergl",
         mode: "markers",
         marker: {
@@ -54,7 +54,7 @@ export function tracesToData(
             ? color.toCSSRGBString()
             : isUncolored
             ? null
-            : trace.map((d) => d.label),
+            : trace.labels,
           size: 6,
           colorbar:
             isCategorical || isUncolored
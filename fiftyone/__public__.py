@@ -15,6 +15,8 @@ app_config = _foc.load_app_config()
 
 from .core.aggregations import (
     Aggregation,
+    ApproxHistogram,
+    ApproxQuantiles,
     Bounds,
     Count,
     CountValues,
@@ -117,6 +119,7 @@ from .core.models import (
     apply_model,
     compute_embeddings,
     compute_patch_embeddings,
+    get_embeddings,
     load_model,
     Model,
     ModelConfig,
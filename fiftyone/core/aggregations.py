@@ -30,6 +30,8 @@ import fiftyone.core.utils as fou
 
 logger = logging.getLogger(__name__)
 
+_SKETCH_BATCH_SIZE = 100000
+
 
 class Aggregation(object):
     """Abstract base class for all aggregations.
@@ -129,6 +131,14 @@ class Aggregation(object):
         """
         return False
 
+    @property
+    def _is_streaming(self):
+        """Whether the aggregation has big results that should be passed to
+        :meth:`parse_result` directly as a database cursor, rather than being
+        loaded into memory first.
+        """
+        return False
+
     def to_mongo(self, sample_collection, context=None):
         """Returns the MongoDB aggregation pipeline for this aggregation.
 
@@ -270,6 +280,351 @@ class AggregationError(Exception):
     """An error raised during the execution of an :class:`Aggregation`."""
 
 
+class ApproxHistogram(Aggregation):
+    """Computes an approximate histogram of the numeric field values in a
+    collection in a single pass.
+
+    Unlike :class:`HistogramValues`, which requires a separate
+    :class:`Bounds` computation when bin edges are generated automatically,
+    this aggregation streams the field values from the database once and
+    summarizes them in a :class:`fiftyone.core.utils.KLLSketch`, so it uses
+    bounded memory regardless of the size of the collection.
+
+    When ``bins`` is a sequence of edges or a ``range`` is provided, the
+    returned counts are exact. Otherwise, the bin edges are computed from the
+    exact bounds of the values and the counts are estimated from the sketch,
+    with an error of roughly ``1.65 / k`` times the total count per bin edge.
+
+    ``None``-valued fields are ignored.
+
+    This aggregation is typically applied to *numeric* field types (or lists
+    of such types):
+
+    -   :class:`fiftyone.core.fields.IntField`
+    -   :class:`fiftyone.core.fields.FloatField`
+
+    Examples::
+
+        import numpy as np
+
+        import fiftyone as fo
+
+        samples = []
+        for idx in range(100):
+            samples.append(
+                fo.Sample(
+                    filepath="/path/to/image%d.png" % idx,
+                    numeric_field=np.random.randn(),
+                    numeric_list_field=list(np.random.randn(10)),
+                )
+            )
+
+        dataset = fo.Dataset()
+        dataset.add_samples(samples)
+
+        #
+        # Compute an approximate histogram of a numeric field
+        #
+
+        aggregation = fo.ApproxHistogram("numeric_field", bins=50)
+        counts, edges, other = dataset.aggregate(aggregation)
+
+        #
+        # Compute an approximate histogram of a numeric list field
+        #
+
+        aggregation = fo.ApproxHistogram("numeric_list_field", bins=50)
+        counts, edges, other = dataset.aggregate(aggregation)
+
+    Args:
+        field_or_expr: a field name, ``embedded.field.name``,
+            :class:`fiftyone.core.expressions.ViewExpression`, or
+            `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+            defining the field or expression to aggregate
+        expr (None): a :class:`fiftyone.core.expressions.ViewExpression` or
+            `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+            to apply to ``field_or_expr`` (which must be a field) before
+            aggregating
+        bins (None): can be either an integer number of bins to generate or a
+            monotonically increasing sequence specifying the bin edges to use.
+            By default, 10 bins are created. If ``bins`` is an integer and no
+            ``range`` is specified, bin edges are automatically computed from
+            the bounds of the field
+        range (None): a ``(lower, upper)`` tuple specifying a range in which to
+            generate equal-width bins. Only applicable when ``bins`` is an
+            integer or ``None``
+        k (200): the accuracy parameter of the underlying
+            :class:`fiftyone.core.utils.KLLSketch`
+        safe (False): whether to ignore nan/inf values when dealing with
+            floating point values
+    """
+
+    def __init__(
+        self,
+        field_or_expr,
+        expr=None,
+        bins=None,
+        range=None,
+        k=200,
+        safe=False,
+    ):
+        super().__init__(field_or_expr, expr=expr, safe=safe)
+        self._bins = bins
+        self._range = range
+        self._k = k
+
+        self._num_bins = None
+        self._edges = None
+        self._big_field = None
+
+        self._parse_args()
+
+    def _kwargs(self):
+        return [
+            ["field_or_expr", self._field_name],
+            ["expr", self._expr],
+            ["bins", self._bins],
+            ["range", self._range],
+            ["k", self._k],
+            ["safe", self._safe],
+        ]
+
+    @property
+    def _has_big_result(self):
+        return True
+
+    @property
+    def _is_streaming(self):
+        return True
+
+    def default_result(self):
+        """Returns the default result for this aggregation.
+
+        Returns:
+            a tuple of
+
+            -   **counts**: ``[]``
+            -   **edges**: ``[]``
+            -   **other**: ``0``
+        """
+        return [], [], 0
+
+    def parse_result(self, d):
+        """Parses the output of :meth:`to_mongo`.
+
+        Args:
+            d: an iterable of result dicts
+
+        Returns:
+            a tuple of
+
+            -   **counts**: a list of counts in each bin
+            -   **edges**: an increasing list of bin edges of length
+                ``len(counts) + 1``. Note that each bin is treated as having an
+                inclusive lower boundary and exclusive upper boundary,
+                ``[lower, upper)``, including the rightmost bin
+            -   **other**: the number of items outside the bins
+        """
+        if self._edges is not None:
+            return self._parse_result_edges(d)
+
+        sketch = _build_sketch(d, self._big_field, self._k)
+        if sketch.n == 0:
+            return self.default_result()
+
+        edges = np.linspace(sketch.min, sketch.max + 1e-6, self._num_bins + 1)
+        ranks = np.round(sketch.ranks(edges)).astype(int)
+        counts = np.diff(ranks)
+
+        return counts.tolist(), edges.tolist(), 0
+
+    def to_mongo(self, sample_collection, big_field="values", context=None):
+        self._big_field = big_field
+        return _make_sketch_pipeline(
+            sample_collection,
+            self._field_name,
+            self._expr,
+            self._safe,
+            big_field,
+            context,
+        )
+
+    def _parse_args(self):
+        if self._bins is None:
+            bins = 10
+        elif etau.is_container(self._bins):
+            bins = list(self._bins)
+        else:
+            bins = int(self._bins)
+
+        if not etau.is_numeric(bins):
+            # User-provided bin edges
+            self._edges = bins
+        elif self._range is not None:
+            # Linearly-spaced bins within `range`
+            self._edges = list(
+                np.linspace(self._range[0], self._range[1], bins + 1)
+            )
+        else:
+            # Compute bin edges from the sketch
+            self._num_bins = bins
+
+    def _parse_result_edges(self, d):
+        edges = np.asarray(self._edges, dtype=float)
+        num_bins = len(edges) - 1
+
+        counts = np.zeros(num_bins, dtype=int)
+        total = 0
+        for batch in fou.iter_batches(d, _SKETCH_BATCH_SIZE):
+            values = np.array(
+                [di[self._big_field] for di in batch], dtype=float
+            )
+            inds = np.searchsorted(edges, values, side="right") - 1
+            inds = inds[(inds >= 0) & (inds < num_bins)]
+            counts += np.bincount(inds, minlength=num_bins)
+            total += len(values)
+
+        other = total - int(counts.sum())
+
+        return counts.tolist(), list(self._edges), other
+
+
+class ApproxQuantiles(Aggregation):
+    """Computes approximate quantile(s) of the numeric field values of a
+    collection.
+
+    Unlike :class:`Quantiles`, which gathers all field values into a single
+    document on the database server, this aggregation streams the field
+    values from the database and summarizes them in a
+    :class:`fiftyone.core.utils.KLLSketch`, so it uses bounded memory and
+    can be applied to collections of any size.
+
+    The returned quantiles have a normalized rank error of about ``1.65 / k``
+    with high probability. The ``0`` and ``1`` quantiles are exact.
+
+    ``None``-valued fields are ignored.
+
+    This aggregation is typically applied to *numeric* field types (or lists of
+    such types):
+
+    -   :class:`fiftyone.core.fields.IntField`
+    -   :class:`fiftyone.core.fields.FloatField`
+
+    Examples::
+
+        import fiftyone as fo
+        import fiftyone.zoo as foz
+
+        dataset = foz.load_zoo_dataset("quickstart")
+
+        #
+        # Compute the approximate quantiles of a numeric list field
+        #
+
+        aggregation = fo.ApproxQuantiles(
+            "predictions.detections.confidence", [0.1, 0.5, 0.9]
+        )
+        quantiles = dataset.aggregate(aggregation)
+        print(quantiles)  # the quantiles
+
+        #
+        # Use a larger sketch for more accurate quantiles
+        #
+
+        aggregation = fo.ApproxQuantiles(
+            "predictions.detections.confidence", 0.5, k=1000
+        )
+        median = dataset.aggregate(aggregation)
+        print(median)  # the median
+
+    Args:
+        field_or_expr: a field name, ``embedded.field.name``,
+            :class:`fiftyone.core.expressions.ViewExpression`, or
+            `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+            defining the field or expression to aggregate
+        quantiles: the quantile or iterable of quantiles to compute. Each
+            quantile must be a numeric value in ``[0, 1]``
+        expr (None): a :class:`fiftyone.core.expressions.ViewExpression` or
+            `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+            to apply to ``field_or_expr`` (which must be a field) before
+            aggregating
+        k (200): the accuracy parameter of the underlying
+            :class:`fiftyone.core.utils.KLLSketch`
+        safe (False): whether to ignore nan/inf values when dealing with
+            floating point values
+    """
+
+    def __init__(self, field_or_expr, quantiles, expr=None, k=200, safe=False):
+        quantiles_list, is_scalar = Quantiles._parse_quantiles(quantiles)
+
+        super().__init__(field_or_expr, expr=expr, safe=safe)
+        self._quantiles = quantiles
+        self._k = k
+
+        self._quantiles_list = quantiles_list
+        self._is_scalar = is_scalar
+        self._big_field = None
+
+    def _kwargs(self):
+        return [
+            ["field_or_expr", self._field_name],
+            ["quantiles", self._quantiles],
+            ["expr", self._expr],
+            ["k", self._k],
+            ["safe", self._safe],
+        ]
+
+    @property
+    def _has_big_result(self):
+        return True
+
+    @property
+    def _is_streaming(self):
+        return True
+
+    def default_result(self):
+        """Returns the default result for this aggregation.
+
+        Returns:
+            ``None`` or ``[None, None, None]``
+        """
+        if self._is_scalar:
+            return None
+
+        return [None] * len(self._quantiles_list)
+
+    def parse_result(self, d):
+        """Parses the output of :meth:`to_mongo`.
+
+        Args:
+            d: an iterable of result dicts
+
+        Returns:
+            the quantile or list of quantiles
+        """
+        sketch = _build_sketch(d, self._big_field, self._k)
+        if sketch.n == 0:
+            return self.default_result()
+
+        quantiles = sketch.quantiles(self._quantiles_list).tolist()
+
+        if self._is_scalar:
+            return quantiles[0]
+
+        return quantiles
+
+    def to_mongo(self, sample_collection, big_field="values", context=None):
+        self._big_field = big_field
+        return _make_sketch_pipeline(
+            sample_collection,
+            self._field_name,
+            self._expr,
+            self._safe,
+            big_field,
+            context,
+        )
+
+
 class Bounds(Aggregation):
     """Computes the bounds of a numeric field of a collection.
 
@@ -2731,6 +3086,37 @@ def _make_extract_values_pipeline(
     ]
 
 
+def _make_sketch_pipeline(
+    sample_collection, field_name, expr, safe, big_field, context
+):
+    path, pipeline, _, _, _ = _parse_field_and_expr(
+        sample_collection,
+        field_name,
+        expr=expr,
+        safe=safe,
+        context=context,
+    )
+
+    value = "$" + path
+
+    pipeline.extend(
+        [
+            {"$match": {"$expr": {"$isNumber": value}}},
+            {"$project": {"_id": False, big_field: value}},
+        ]
+    )
+
+    return pipeline
+
+
+def _build_sketch(d, big_field, k):
+    sketch = fou.KLLSketch(k=k)
+    for batch in fou.iter_batches(d, _SKETCH_BATCH_SIZE):
+        sketch.update([di[big_field] for di in batch])
+
+    return sketch
+
+
 def _extract_list_values(subfield, expr):
     if subfield:
         map_expr = F(subfield).apply(expr)
@@ -2843,6 +2843,10 @@ class DelegatedLaunchCommand(Command):
 
         # Launch a local service
         fiftyone delegated launch
+
+        # Launch a local service that runs up to 4 operations at a time, at
+        # most 2 of which may run on the same dataset
+        fiftyone delegated launch --num-workers 4 --max-per-dataset 2
     """
 
     @staticmethod
@@ -2854,6 +2858,25 @@ class DelegatedLaunchCommand(Command):
             metavar="TYPE",
             help="the type of service to launch. The default is 'local'",
         )
+        parser.add_argument(
+            "-n",
+            "--num-workers",
+            default=None,
+            type=int,
+            metavar="NUM_WORKERS",
+            help="the number of operations to run concurrently",
+        )
+        parser.add_argument(
+            "-m",
+            "--max-per-dataset",
+            default=None,
+            type=int,
+            metavar="MAX_PER_DATASET",
+            help=(
+                "an optional maximum number of operations to run "
+                "concurrently on the same dataset"
+            ),
+        )
 
     @staticmethod
     def execute(parser, args):
@@ -2865,10 +2888,13 @@ class DelegatedLaunchCommand(Command):
             )
 
         if args.type == "local":
-            _launch_delegated_local()
+            _launch_delegated_local(
+                num_workers=args.num_workers,
+                max_running_per_dataset=args.max_per_dataset,
+            )
 
 
-def _launch_delegated_local():
+def _launch_delegated_local(num_workers=None, max_running_per_dataset=None):
     from fiftyone.core.session.session import _WELCOME_MESSAGE
 
     try:
@@ -2878,7 +2904,11 @@ def _launch_delegated_local():
         print("Delegated operation service running")
         print("\nTo exit, press ctrl + c")
         while True:
-            dos.execute_queued_operations(limit=1, log=True)
+            dos.execute_queued_operations(
+                num_workers=num_workers,
+                max_running_per_dataset=max_running_per_dataset,
+                log=True,
+            )
             time.sleep(0.5)
     except KeyboardInterrupt:
         pass
@@ -314,14 +314,19 @@ class ClipsView(fov.DatasetView):
         self._source_collection.reload()
 
         #
-        # Regenerate the clips dataset
+        # Sync the clips dataset with any changes to the source collection
+        # since it was last generated, or regenerate it from scratch if an
+        # incremental sync is not possible
         #
         # This assumes that calling `load_view()` when the current clips
         # dataset has been deleted will cause a new one to be generated
         #
-        self._clips_dataset.delete()
-        _view = self._clips_stage.load_view(self._source_collection)
-        self._clips_dataset = _view._clips_dataset
+        if not self._clips_stage._sync_dataset(
+            self._source_collection, self._clips_dataset
+        ):
+            self._clips_dataset.delete()
+            _view = self._clips_stage.load_view(self._source_collection)
+            self._clips_dataset = _view._clips_dataset
 
         super().reload()
 
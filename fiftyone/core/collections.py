@@ -6,6 +6,7 @@ Interface for sample collections.
 |
 """
 from collections import defaultdict
+import contextlib
 from copy import copy
 import fnmatch
 import itertools
@@ -18,6 +19,7 @@ import timeit
 import warnings
 
 from bson import ObjectId
+import numpy as np
 from pymongo import InsertOne, UpdateOne, UpdateMany
 
 import eta.core.serial as etas
@@ -185,6 +187,8 @@ class SaveContext(object):
                 self._last_time = timeit.default_timer()
 
     def _save_batch(self):
+        updated = bool(self._sample_ops or self._frame_ops)
+
         if self._sample_ops:
             foo.bulk_write(self._sample_ops, self._sample_coll, ordered=False)
             self._sample_ops.clear()
@@ -193,6 +197,9 @@ class SaveContext(object):
             foo.bulk_write(self._frame_ops, self._frame_coll, ordered=False)
             self._frame_ops.clear()
 
+        if updated:
+            self._dataset._bump_data_version()
+
         if self._reload_parents:
             for sample in self._reload_parents:
                 sample._reload_parents()
@@ -867,6 +874,8 @@ class SampleCollection(object):
         autosave=False,
         batch_size=None,
         batching_strategy=None,
+        prefetch=None,
+        read_only=False,
     ):
         """Returns an iterator over the samples in the collection.
 
@@ -893,6 +902,17 @@ class SampleCollection(object):
                 -   ``"latency"``: a target latency, in seconds, between saves
 
                 By default, ``fo.config.default_batcher`` is used
+            prefetch (None): an optional number of samples to load in a
+                background thread ahead of the caller, which allows database
+                reads and sample construction to overlap with the caller's
+                work. By default, samples are loaded on demand
+            read_only (False): whether to emit read-only
+                :class:`fiftyone.core.sample.SampleRecord` instances, which
+                are backed directly by the samples' database dicts and only
+                deserialize fields when they are accessed, rather than
+                :class:`fiftyone.core.sample.Sample` or
+                :class:`fiftyone.core.sample.SampleView` instances. Cannot be
+                combined with ``autosave``
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.Sample` or
@@ -907,6 +927,7 @@ class SampleCollection(object):
         autosave=False,
         batch_size=None,
         batching_strategy=None,
+        prefetch=None,
     ):
         """Returns an iterator over the groups in the collection.
 
@@ -934,6 +955,10 @@ class SampleCollection(object):
                 -   ``"latency"``: a target latency, in seconds, between saves
 
                 By default, ``fo.config.default_batcher`` is used
+            prefetch (None): an optional number of groups to load in a
+                background thread ahead of the caller, which allows database
+                reads and sample construction to overlap with the caller's
+                work. By default, groups are loaded on demand
 
         Returns:
             an iterator that emits dicts mapping group slice names to
@@ -2867,6 +2892,8 @@ class SampleCollection(object):
         num_workers=None,
         skip_failures=True,
         warn_failures=False,
+        use_processes=False,
+        cache=None,
         progress=None,
     ):
         """Populates the ``metadata`` field of all samples in the collection.
@@ -2874,13 +2901,23 @@ class SampleCollection(object):
         Any samples with existing metadata are skipped, unless
         ``overwrite == True``.
 
+        When a ``cache`` is provided, the metadata of local media is stored on
+        disk keyed by the path, size, and modification time of each file, so
+        that subsequent calls can skip media that has not changed.
+
         Args:
             overwrite (False): whether to overwrite existing metadata
-            num_workers (None): a suggested number of threads to use
+            num_workers (None): a suggested number of threads/processes to use
             skip_failures (True): whether to gracefully continue without
                 raising an error if metadata cannot be computed for a sample
             warn_failures (False): whether to log a warning if metadata cannot
                 be computed for a sample
+            use_processes (False): whether to compute metadata in a process
+                pool rather than a thread pool
+            cache (None): an optional metadata cache to use. Can be True to
+                use the default cache in
+                ``fiftyone.config.default_dataset_dir``, or the path to a
+                cache file to use
             progress (None): whether to render a progress bar (True/False), use
                 the default value ``fiftyone.config.show_progress_bars``
                 (None), or a progress callback function to invoke instead
@@ -2891,6 +2928,8 @@ class SampleCollection(object):
             num_workers=num_workers,
             skip_failures=skip_failures,
             warn_failures=warn_failures,
+            use_processes=use_processes,
+            cache=cache,
             progress=progress,
         )
 
@@ -2930,9 +2969,13 @@ class SampleCollection(object):
                 has logits, ``model.has_logits == True``
             batch_size (None): an optional batch size to use, if the model
                 supports batching
-            num_workers (None): the number of workers for the
-                :class:`torch:torch.utils.data.DataLoader` to use. Only
-                applicable for Torch-based models
+            num_workers (None): the number of workers to use when loading
+                images. Torch-based models use a
+                :class:`torch:torch.utils.data.DataLoader` with this many
+                workers. Other image models decode upcoming batches of images
+                in a thread pool of this size while inference runs, or in the
+                main thread if ``num_workers=0``. Not applicable to video
+                collections
             skip_failures (True): whether to gracefully continue without
                 raising an error if predictions cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
@@ -3004,9 +3047,13 @@ class SampleCollection(object):
                 "frames." prefix is optional
             batch_size (None): an optional batch size to use, if the model
                 supports batching
-            num_workers (None): the number of workers for the
-                :class:`torch:torch.utils.data.DataLoader` to use. Only
-                applicable for Torch-based models
+            num_workers (None): the number of workers to use when loading
+                images. Torch-based models use a
+                :class:`torch:torch.utils.data.DataLoader` with this many
+                workers. Other image models decode upcoming batches of images
+                in a thread pool of this size while inference runs, or in the
+                main thread if ``num_workers=0``. Not applicable to video
+                collections
             skip_failures (True): whether to gracefully continue without
                 raising an error if embeddings cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
@@ -3307,6 +3354,8 @@ class SampleCollection(object):
         classwise=True,
         dynamic=True,
         progress=None,
+        num_workers=None,
+        columnar=False,
         **kwargs,
     ):
         """Evaluates the specified predicted detections in this collection with
@@ -3402,6 +3451,17 @@ class SampleCollection(object):
             progress (None): whether to render a progress bar (True/False), use
                 the default value ``fiftyone.config.show_progress_bars``
                 (None), or a progress callback function to invoke instead
+            num_workers (None): a number of worker processes to use. If a
+                value greater than 1 is provided, the collection is split into
+                shards of contiguous sample IDs that are evaluated in parallel.
+                By default, all samples are evaluated in the main process
+            columnar (False): whether to load and write the objects'
+                attributes in bulk via :meth:`values` and :meth:`set_values`
+                rather than iterating over
+                :class:`fiftyone.core.sample.Sample` instances. Only supported
+                by evaluation methods whose
+                :meth:`fiftyone.utils.eval.detection.DetectionEvaluation.can_evaluate_samples`
+                returns True for the collection
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.detection.DetectionEvaluationConfig`
                 being used
@@ -3423,6 +3483,8 @@ class SampleCollection(object):
             classwise=classwise,
             dynamic=dynamic,
             progress=progress,
+            num_workers=num_workers,
+            columnar=columnar,
             **kwargs,
         )
 
@@ -8315,6 +8377,145 @@ class SampleCollection(object):
         )
         return self._make_and_aggregate(make, field_or_expr)
 
+    def iter_values(
+        self,
+        field_or_expr,
+        expr=None,
+        missing_value=None,
+        unwind=False,
+        batch_size=10000,
+        array_format=None,
+        _raw=False,
+    ):
+        """Returns an iterator over chunks of the values of a field across
+        all samples in the collection.
+
+        This method is a streaming version of :meth:`values` that reads
+        results directly from the database cursor in chunks, so that only one
+        chunk of values is held in memory at a time. This is useful when
+        extracting large slices of data, e.g., all object bounding boxes in
+        a large dataset.
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            # Lists of detection labels, in chunks of 50 samples
+            for labels in dataset.iter_values(
+                "ground_truth.detections.label", batch_size=50
+            ):
+                print(len(labels))  # 50
+
+            # Bounding boxes as a ragged array
+            for boxes, offsets in dataset.iter_values(
+                "ground_truth.detections.bounding_box",
+                array_format="ragged",
+            ):
+                print(boxes.shape)  # (num_objects, 4)
+
+                # The boxes for the first sample of the chunk
+                print(boxes[offsets[0][0]:offsets[0][1]])
+
+            # Multiple fields at once
+            for filepaths, uniqueness in dataset.iter_values(
+                ["filepath", "uniqueness"], array_format="numpy"
+            ):
+                print(uniqueness.mean())
+
+        Args:
+            field_or_expr: a field name, ``embedded.field.name``,
+                :class:`fiftyone.core.expressions.ViewExpression`, or
+                `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+                defining the field or expression to extract. This can also be
+                a list or tuple of field names, in which case tuples of
+                corresponding chunks are emitted. Only fields that do not
+                require ``expr``, ``unwind``, or ``[]`` syntax may be
+                extracted together in this way
+            expr (None): a :class:`fiftyone.core.expressions.ViewExpression` or
+                `MongoDB expression <https://docs.mongodb.com/manual/meta/aggregation-quick-reference/#aggregation-expressions>`_
+                to apply to ``field_or_expr`` (which must be a field) before
+                extracting values
+            missing_value (None): a value to insert for missing or
+                ``None``-valued fields
+            unwind (False): whether to automatically unwind all recognized list
+                fields (True) or unwind all list fields except the top-level
+                sample field (-1)
+            batch_size (10000): the number of documents whose values to
+                include in each chunk
+            array_format (None): an optional format in which to emit each
+                chunk. Supported values are:
+
+                -   ``None``: lists of values, as returned by :meth:`values`
+                -   ``"numpy"``: numpy arrays of values. The values in each
+                    chunk must have a regular shape
+                -   ``"ragged"``: ``(values, offsets)`` tuples, where
+                    ``values`` is a numpy array of the values of all list
+                    elements flattened into a single array, and ``offsets``
+                    is a list containing one array per level of list nesting,
+                    outermost first, whose ``i``-th and ``i + 1``-th elements
+                    are the start and end indexes of the ``i``-th list's
+                    elements in the next level (or ``values``). Missing lists
+                    are treated as empty
+
+        Returns:
+            a generator that emits chunks of values or tuples of chunks
+        """
+        if array_format not in (None, "numpy", "ragged"):
+            raise ValueError(
+                "Unsupported array_format '%s'; supported values are %s"
+                % (array_format, (None, "numpy", "ragged"))
+            )
+
+        multi = isinstance(field_or_expr, (list, tuple))
+        fields_or_exprs = list(field_or_expr) if multi else [field_or_expr]
+
+        aggregations = [
+            foa.Values(
+                f,
+                expr=expr,
+                missing_value=missing_value,
+                unwind=unwind,
+                _raw=_raw,
+            )
+            for f in fields_or_exprs
+        ]
+
+        if len(aggregations) == 1:
+            pipeline = self._build_big_pipeline(aggregations[0])
+            big_fields = ["values"]
+        else:
+            if not all(a._is_big_batchable for a in aggregations):
+                raise ValueError(
+                    "Only fields that do not require `expr`, `unwind`, or "
+                    "`[]` syntax may be passed together to iter_values()"
+                )
+
+            pipeline = self._build_batch_pipeline(
+                dict(enumerate(aggregations))
+            )
+            big_fields = ["value%d" % i for i in range(len(aggregations))]
+
+        cursor = foo.aggregate(self._dataset._sample_collection, pipeline)
+
+        with contextlib.closing(cursor):
+            for batch in fou.iter_batches(cursor, batch_size):
+                chunks = []
+                for aggregation, big_field in zip(aggregations, big_fields):
+                    aggregation._big_field = big_field
+                    values = aggregation.parse_result(batch)
+                    chunks.append(
+                        _format_values_chunk(
+                            values,
+                            aggregation._num_list_fields,
+                            array_format,
+                        )
+                    )
+
+                yield tuple(chunks) if multi else chunks[0]
+
     def draw_labels(
         self,
         output_dir,
@@ -9182,12 +9383,22 @@ class SampleCollection(object):
     def _get_default_indexes(self, frames=False):
         if frames:
             if self._has_frame_fields():
-                return ["id", "_sample_id_1_frame_number_1"]
+                return [
+                    "id",
+                    "_sample_id_1_frame_number_1",
+                    "_last_modified_at",
+                ]
 
             return []
 
         if self._is_patches:
-            names = ["id", "filepath", "sample_id"]
+            names = [
+                "id",
+                "filepath",
+                "_rand",
+                "_last_modified_at",
+                "sample_id",
+            ]
             if self._is_frames:
                 names.extend(["frame_id", "_sample_id_1_frame_number_1"])
 
@@ -9197,18 +9408,33 @@ class SampleCollection(object):
             return [
                 "id",
                 "filepath",
+                "_rand",
+                "_last_modified_at",
                 "sample_id",
                 "_sample_id_1_frame_number_1",
             ]
 
         if self._is_clips:
-            return ["id", "filepath", "sample_id"]
+            return [
+                "id",
+                "filepath",
+                "_rand",
+                "_last_modified_at",
+                "sample_id",
+            ]
 
         if self.media_type == fom.GROUP:
             gf = self.group_field
-            return ["id", "filepath", gf + ".id", gf + ".name"]
+            return [
+                "id",
+                "filepath",
+                "_rand",
+                "_last_modified_at",
+                gf + ".id",
+                gf + ".name",
+            ]
 
-        return ["id", "filepath"]
+        return ["id", "filepath", "_rand", "_last_modified_at"]
 
     def reload(self):
         """Reloads the collection from the database."""
@@ -9471,10 +9697,14 @@ class SampleCollection(object):
             pipelines.append(pipeline)
 
         # Build big pipelines
+        stream_pipelines = {}
         for idx, aggregation in big_aggs.items():
             pipeline = self._build_big_pipeline(aggregation)
-            idx_map[idx] = len(pipelines)
-            pipelines.append(pipeline)
+            if aggregation._is_streaming:
+                stream_pipelines[idx] = pipeline
+            else:
+                idx_map[idx] = len(pipelines)
+                pipelines.append(pipeline)
 
         # Build facet-able pipelines
         compiled_facet_aggs, facet_pipelines = self._build_facets(facet_aggs)
@@ -9483,7 +9713,10 @@ class SampleCollection(object):
             pipelines.append(pipeline)
 
         # Run all aggregations
-        _results = foo.aggregate(self._dataset._sample_collection, pipelines)
+        if pipelines:
+            _results = foo.aggregate(
+                self._dataset._sample_collection, pipelines
+            )
 
         # Parse batch results
         if batch_aggs:
@@ -9493,8 +9726,16 @@ class SampleCollection(object):
 
         # Parse big results
         for idx, aggregation in big_aggs.items():
-            result = list(_results[idx_map[idx]])
-            results[idx] = self._parse_big_result(aggregation, result)
+            if idx in stream_pipelines:
+                # Streaming aggregations consume their cursors directly
+                cursor = foo.aggregate(
+                    self._dataset._sample_collection, stream_pipelines[idx]
+                )
+                with contextlib.closing(cursor):
+                    results[idx] = aggregation.parse_result(cursor)
+            else:
+                result = list(_results[idx_map[idx]])
+                results[idx] = self._parse_big_result(aggregation, result)
 
         # Parse facet-able results
         for idx, aggregation in compiled_facet_aggs.items():
@@ -9786,6 +10027,18 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement _aggregate()")
 
+    def _make_record_fcn(self):
+        schema = self.get_field_schema(include_private=True)
+        fields = {
+            name: (field.db_field or name, field)
+            for name, field in schema.items()
+        }
+
+        def make_record(d):
+            return fosa.SampleRecord(d, fields)
+
+        return make_record
+
     def _make_and_aggregate(self, make, args):
         if isinstance(args, (list, tuple)):
             return tuple(self.aggregate([make(arg) for arg in args]))
@@ -10425,6 +10678,28 @@ def _unwind_values(values, level=0):
     return values
 
 
+def _format_values_chunk(values, num_list_fields, array_format):
+    if array_format is None:
+        return values
+
+    if array_format == "numpy":
+        try:
+            return np.asarray(values)
+        except ValueError as e:
+            raise ValueError(
+                "Values have an irregular shape; use "
+                "`array_format='ragged'` instead"
+            ) from e
+
+    offsets = []
+    for _ in range(num_list_fields):
+        lengths = [len(v) if v is not None else 0 for v in values]
+        offsets.append(np.concatenate(([0], np.cumsum(lengths, dtype=int))))
+        values = [vv for v in values if v is not None for vv in v]
+
+    return np.asarray(values), offsets
+
+
 def _parse_label_field(
     sample_collection,
     label_field,
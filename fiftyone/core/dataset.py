@@ -6,7 +6,8 @@ FiftyOne datasets.
 |
 """
 
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 from datetime import datetime
 import fnmatch
@@ -41,6 +42,7 @@ from fiftyone.core.odm.dataset import SampleFieldDocument
 from fiftyone.core.odm.dataset import DatasetAppConfig
 import fiftyone.migrations as fomi
 import fiftyone.core.odm as foo
+import fiftyone.core.odm.sample as foos
 import fiftyone.core.sample as fos
 import fiftyone.core.storage as fost
 from fiftyone.core.singletons import DatasetSingleton
@@ -2161,6 +2163,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         autosave=False,
         batch_size=None,
         batching_strategy=None,
+        prefetch=None,
+        read_only=False,
     ):
         """Returns an iterator over the samples in the dataset.
 
@@ -2221,12 +2225,29 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 -   ``"latency"``: a target latency, in seconds, between saves
 
                 By default, ``fo.config.default_batcher`` is used
+            prefetch (None): an optional number of samples to load in a
+                background thread ahead of the caller, which allows database
+                reads and sample construction to overlap with the caller's
+                work. By default, samples are loaded on demand
+            read_only (False): whether to emit read-only
+                :class:`fiftyone.core.sample.SampleRecord` instances, which
+                are backed directly by the samples' database dicts and only
+                deserialize fields when they are accessed, rather than
+                :class:`fiftyone.core.sample.Sample` instances. Cannot be
+                combined with ``autosave``
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.Sample` instances
         """
+        if read_only and autosave:
+            raise ValueError("Cannot autosave read-only samples")
+
         with contextlib.ExitStack() as exit_context:
-            samples = self._iter_samples()
+            samples = self._iter_samples(read_only=read_only)
+
+            if prefetch:
+                samples = fou.iter_prefetched(samples, prefetch)
+                exit_context.enter_context(contextlib.closing(samples))
 
             pb = fou.ProgressBar(total=self, progress=progress)
             exit_context.enter_context(pb)
@@ -2246,8 +2267,12 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 if autosave:
                     save_context.save(sample)
 
-    def _iter_samples(self, pipeline=None):
-        make_sample = self._make_sample_fcn()
+    def _iter_samples(self, pipeline=None, read_only=False):
+        if read_only:
+            make_sample = self._make_record_fcn()
+        else:
+            make_sample = self._make_sample_fcn()
+
         index = 0
 
         try:
@@ -2264,7 +2289,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             # The cursor has timed out so we yield from a new one after
             # skipping to the last offset
             pipeline = [{"$skip": index}] + (pipeline or [])
-            for sample in self._iter_samples(pipeline=pipeline):
+            for sample in self._iter_samples(
+                pipeline=pipeline, read_only=read_only
+            ):
                 yield sample
 
     def _make_sample_fcn(self):
@@ -2281,6 +2308,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         autosave=False,
         batch_size=None,
         batching_strategy=None,
+        prefetch=None,
     ):
         """Returns an iterator over the groups in the dataset.
 
@@ -2346,6 +2374,10 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 -   ``"latency"``: a target latency, in seconds, between saves
 
                 By default, ``fo.config.default_batcher`` is used
+            prefetch (None): an optional number of groups to load in a
+                background thread ahead of the caller, which allows database
+                reads and sample construction to overlap with the caller's
+                work. By default, groups are loaded on demand
 
         Returns:
             an iterator that emits dicts mapping group slice names to
@@ -2357,6 +2389,10 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         with contextlib.ExitStack() as exit_context:
             groups = self._iter_groups(group_slices=group_slices)
 
+            if prefetch:
+                groups = fou.iter_prefetched(groups, prefetch)
+                exit_context.enter_context(contextlib.closing(groups))
+
             pb = fou.ProgressBar(total=self, progress=progress)
             exit_context.enter_context(pb)
             groups = pb(groups)
@@ -2519,6 +2555,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         validate=True,
         progress=None,
         num_samples=None,
+        num_workers=None,
     ):
         """Adds the given samples to the dataset.
 
@@ -2543,6 +2580,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             num_samples (None): the number of samples in ``samples``. If not
                 provided, this is computed (if possible) via ``len(samples)``
                 if needed for progress tracking
+            num_workers (None): a number of worker threads to use to serialize
+                batches of samples. If a value greater than 0 is provided,
+                serialization of subsequent batches is pipelined with the
+                insertion of the current batch into the database. Schema
+                expansion, validation, and insertion are always performed in
+                the calling thread, in order. By default, all batches are
+                processed serially
 
         Returns:
             a list of IDs of the samples in the dataset
@@ -2554,6 +2598,11 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             samples, progress=progress, total=num_samples
         )
 
+        if num_workers is not None and num_workers > 0:
+            return self._add_samples_pipelined(
+                batcher, expand_schema, dynamic, validate, num_workers
+            )
+
         sample_ids = []
         with batcher:
             for batch in batcher:
@@ -2564,6 +2613,177 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         return sample_ids
 
+    def _add_samples_pipelined(
+        self, batcher, expand_schema, dynamic, validate, num_workers
+    ):
+        # Serialization of up to `num_workers` batches runs in worker threads
+        # while the calling thread inserts the oldest pending batch, which
+        # preserves insertion order
+        sample_ids = []
+        pending = deque()
+
+        def _insert_next():
+            samples, future = pending.popleft()
+            try:
+                _ids = self._insert_samples_batch(
+                    samples, future.result(), batcher=batcher
+                )
+            except:
+                # The serial path would not have reached subsequent batches
+                pending.clear()
+                raise
+
+            sample_ids.extend(_ids)
+
+        with batcher, ThreadPoolExecutor(max_workers=num_workers) as executor:
+            try:
+                for batch in batcher:
+                    samples = self._prepare_samples_batch(
+                        batch, expand_schema, dynamic, validate
+                    )
+                    future = executor.submit(self._make_dicts, samples)
+                    pending.append((samples, future))
+
+                    if len(pending) > num_workers:
+                        _insert_next()
+            except:
+                # Insert previous batches, as the serial path would have
+                while pending:
+                    _insert_next()
+
+                raise
+
+            while pending:
+                _insert_next()
+
+        return sample_ids
+
+    def add_sample_dicts(
+        self,
+        dicts,
+        schema=None,
+        expand_schema=True,
+        dynamic=False,
+        validate=True,
+        progress=None,
+        num_samples=None,
+    ):
+        """Adds the given sample dicts to the dataset.
+
+        This method is an optimized alternative to :meth:`add_samples` for
+        data that is already available in serialized form. The dicts are
+        inserted directly into the database without constructing
+        :class:`fiftyone.core.sample.Sample` instances.
+
+        Each dict must be a BSON-compatible sample document, in the format
+        returned by
+        :meth:`fiftyone.core.sample.Sample.to_mongo_dict`. That is, embedded
+        documents such as labels must be dicts with their ``_cls`` set, and
+        ``filepath`` is required. The ``_media_type``, ``_rand``, and ``tags``
+        fields are automatically populated if necessary, and None-valued
+        fields are omitted. Video samples must not contain frames.
+
+        Rather than checking every sample, schema expansion and validation are
+        performed on one representative sample per batch for each distinct
+        combination of field names and value types that is encountered.
+
+        Args:
+            dicts: an iterable of sample dicts
+            schema (None): an optional dict mapping field names to
+                :class:`fiftyone.core.fields.Field` instances to declare on the
+                dataset before adding the samples
+            expand_schema (True): whether to dynamically add new sample fields
+                encountered to the dataset schema. If False, an error is raised
+                if a sample's schema is not a subset of the dataset schema
+            dynamic (False): whether to declare dynamic attributes of embedded
+                document fields that are encountered
+            validate (True): whether to validate that the fields of each
+                representative sample are compliant with the dataset schema
+                before adding the samples
+            progress (None): whether to render a progress bar (True/False), use
+                the default value ``fiftyone.config.show_progress_bars``
+                (None), or a progress callback function to invoke instead
+            num_samples (None): the number of dicts in ``dicts``. If not
+                provided, this is computed (if possible) via ``len(dicts)`` if
+                needed for progress tracking
+
+        Returns:
+            a list of IDs of the samples in the dataset
+        """
+        if schema:
+            self._merge_sample_field_schema(schema)
+
+        if num_samples is None:
+            num_samples = dicts
+
+        batcher = fou.get_default_batcher(
+            dicts, progress=progress, total=num_samples
+        )
+
+        sample_ids = []
+        with batcher:
+            for batch in batcher:
+                _ids = self._add_sample_dicts_batch(
+                    batch, expand_schema, dynamic, validate, batcher=batcher
+                )
+                sample_ids.extend(_ids)
+
+        return sample_ids
+
+    def _add_sample_dicts_batch(
+        self, dicts, expand_schema, dynamic, validate, batcher=None
+    ):
+        dataset_id = self._doc.id
+        now = datetime.utcnow()
+
+        _dicts = []
+        representatives = {}
+        for d in dicts:
+            d = {k: v for k, v in d.items() if v is not None}
+
+            if "frames" in d:
+                raise ValueError(
+                    "Sample dicts must not contain frames; use add_samples() "
+                    "to add video samples with frame-level data"
+                )
+
+            filepath = d["filepath"]
+            if "_media_type" not in d:
+                d["_media_type"] = fom.get_media_type(filepath)
+
+            if "_rand" not in d:
+                d["_rand"] = foos._generate_rand(filepath=filepath)
+
+            d.setdefault("tags", [])
+            d["_dataset_id"] = dataset_id
+            d["_last_modified_at"] = now
+
+            key = _get_sample_dict_signature(d)
+            if key not in representatives:
+                representatives[key] = d
+
+            _dicts.append(d)
+
+        if expand_schema or validate:
+            samples = [
+                fos.Sample.from_dict(dict(d)) for d in representatives.values()
+            ]
+            self._prepare_samples_batch(
+                samples, expand_schema, dynamic, validate
+            )
+
+        try:
+            # adds `_id` to each dict
+            self._sample_collection.insert_many(_dicts)
+        except BulkWriteError as bwe:
+            msg = bwe.details["writeErrors"][0]["errmsg"]
+            raise ValueError(msg) from bwe
+
+        if batcher is not None and batcher.manual_backpressure:
+            batcher.apply_backpressure(_dicts)
+
+        return [str(d["_id"]) for d in _dicts]
+
     def add_collection(
         self,
         sample_collection,
@@ -2618,6 +2838,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
     def _add_samples_batch(
         self, samples, expand_schema, dynamic, validate, batcher=None
+    ):
+        samples = self._prepare_samples_batch(
+            samples, expand_schema, dynamic, validate
+        )
+        dicts = self._make_dicts(samples)
+        return self._insert_samples_batch(samples, dicts, batcher=batcher)
+
+    def _prepare_samples_batch(
+        self, samples, expand_schema, dynamic, validate
     ):
         samples = [s.copy() if s._in_db else s for s in samples]
 
@@ -2630,8 +2859,12 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if validate:
             self._validate_samples(samples)
 
-        dicts = [self._make_dict(sample) for sample in samples]
+        return samples
+
+    def _make_dicts(self, samples):
+        return [self._make_dict(sample) for sample in samples]
 
+    def _insert_samples_batch(self, samples, dicts, batcher=None):
         try:
             # adds `_id` to each dict
             self._sample_collection.insert_many(dicts)
@@ -2721,6 +2954,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         d = {k: v for k, v in d.items() if v is not None}
 
         d["_dataset_id"] = self._doc.id
+        d["_last_modified_at"] = datetime.utcnow()
 
         return d
 
@@ -2732,7 +2966,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         else:
             coll = self._sample_collection
 
+        _set_last_modified_at(ops)
         foo.bulk_write(ops, coll, ordered=ordered, progress=progress)
+        self._bump_data_version()
 
         if frames:
             fofr.Frame._reload_docs(self._frame_collection_name, frame_ids=ids)
@@ -3293,10 +3529,12 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 sample_ops.extend(ops)
 
         if sample_ops:
+            _set_last_modified_at(sample_ops)
             foo.bulk_write(sample_ops, self._sample_collection)
             fos.Sample._reload_docs(self._sample_collection_name)
 
         if frame_ops:
+            _set_last_modified_at(frame_ops)
             foo.bulk_write(frame_ops, self._frame_collection)
             fofr.Frame._reload_docs(self._frame_collection_name)
 
@@ -3396,6 +3634,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                             )
 
         if sample_ops:
+            _set_last_modified_at(sample_ops)
             foo.bulk_write(sample_ops, self._sample_collection)
 
             fos.Sample._reload_docs(
@@ -3403,6 +3642,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             )
 
         if frame_ops:
+            _set_last_modified_at(frame_ops)
             foo.bulk_write(frame_ops, self._frame_collection)
 
             # pylint: disable=unexpected-keyword-arg
@@ -4136,6 +4376,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             d = {}
 
         self._sample_collection.delete_many(d)
+        self._bump_data_version()
         fos.Sample._reset_docs(
             self._sample_collection_name, sample_ids=sample_ids
         )
@@ -4242,6 +4483,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             d = {}
 
         self._frame_collection.delete_many(d)
+        self._bump_data_version()
         fofr.Frame._reset_docs(
             self._frame_collection_name, sample_ids=sample_ids
         )
@@ -4266,6 +4508,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                     }
                 }
             )
+            self._bump_data_version()
             fofr.Frame._reset_docs_by_frame_id(
                 self._frame_collection_name, frame_ids, keep=True
             )
@@ -4294,6 +4537,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             return
 
         foo.bulk_write(ops, self._frame_collection)
+        self._bump_data_version()
         for sample_id, fns in zip(sample_ids, frame_numbers):
             fofr.Frame._reset_docs_for_sample(
                 self._frame_collection_name, sample_id, fns, keep=True
@@ -7220,6 +7464,36 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._doc.last_loaded_at = datetime.utcnow()
         self._save()
 
+    def _bump_data_version(self):
+        # Increments a counter that allows caches of the contents of this
+        # dataset's samples/frames, like the App server's, to detect writes
+        conn = foo.get_db_conn()
+        conn.datasets.update_one(
+            {"_id": self._doc.id}, {"$inc": {"_data_version": 1}}
+        )
+
+    def _get_data_version(self):
+        # Returns a value that changes whenever this dataset's samples/frames
+        # are modified. Individual sample/frame saves don't increment the
+        # counter, so the latest modification times are also included
+        conn = foo.get_db_conn()
+        d = conn.datasets.find_one({"_id": self._doc.id}, {"_data_version": 1})
+        version = [(d or {}).get("_data_version", 0)]
+
+        colls = [self._sample_collection]
+        if self._frame_collection_name is not None:
+            colls.append(self._frame_collection)
+
+        for coll in colls:
+            d = coll.find_one(
+                {},
+                {"_last_modified_at": 1},
+                sort=[("_last_modified_at", -1)],
+            )
+            version.append((d or {}).get("_last_modified_at", None))
+
+        return version
+
 
 def _get_random_characters(n):
     return "".join(
@@ -7343,12 +7617,47 @@ def _create_indexes(sample_collection_name, frame_collection_name):
     if sample_collection_name is not None:
         sample_collection = conn[sample_collection_name]
         sample_collection.create_index("filepath")
+        sample_collection.create_index("_rand")
+        sample_collection.create_index("_last_modified_at")
 
     if frame_collection_name is not None:
         frame_collection = conn[frame_collection_name]
         frame_collection.create_index(
             [("_sample_id", 1), ("frame_number", 1)], unique=True
         )
+        frame_collection.create_index("_last_modified_at")
+
+
+# Collections whose indexes have already been checked by this process
+_INDEXED_COLLECTIONS = set()
+
+
+def _ensure_indexes(sample_collection_name, frame_collection_name):
+    # Datasets created by older versions may lack indexes that are now
+    # required for efficient queries, so add any missing ones on load
+    conn = foo.get_db_conn()
+
+    colls = [sample_collection_name]
+    if frame_collection_name is not None:
+        colls.append(frame_collection_name)
+
+    for coll_name in colls:
+        if coll_name in _INDEXED_COLLECTIONS:
+            continue
+
+        if coll_name == sample_collection_name:
+            paths = ["_rand", "_last_modified_at"]
+        else:
+            paths = ["_last_modified_at"]
+
+        coll = conn[coll_name]
+        index_info = coll.index_information()
+        indexed = {tuple(d["key"]) for d in index_info.values()}
+        for path in paths:
+            if ((path, 1),) not in indexed:
+                coll.create_index(path)
+
+        _INDEXED_COLLECTIONS.add(coll_name)
 
 
 def _create_group_indexes(sample_collection_name, group_field):
@@ -7552,6 +7861,8 @@ def _do_load_dataset(obj, name):
     sample_collection_name = dataset_doc.sample_collection_name
     frame_collection_name = dataset_doc.frame_collection_name
 
+    _ensure_indexes(sample_collection_name, frame_collection_name)
+
     sample_doc_cls = _create_sample_document_cls(
         obj, sample_collection_name, field_docs=dataset_doc.sample_fields
     )
@@ -7788,6 +8099,21 @@ def _get_frames_pipeline(sample_collection):
     return coll, pipeline
 
 
+def _set_last_modified_at(ops):
+    # Stamps the given sample/frame write operations with the current time so
+    # that generated views can detect which documents have been modified
+    now = datetime.utcnow()
+    for op in ops:
+        if isinstance(op, (InsertOne, ReplaceOne)):
+            op._doc["_last_modified_at"] = now
+        elif isinstance(op, (UpdateOne, UpdateMany)):
+            update = op._doc
+            if isinstance(update, list):
+                update.append({"$set": {"_last_modified_at": now}})
+            else:
+                update.setdefault("$set", {})["_last_modified_at"] = now
+
+
 def _save_view(view, fields=None):
     # Note: for grouped views, only the active slice's contents are saved,
     # since views cannot edit other slices
@@ -7821,6 +8147,8 @@ def _save_view(view, fields=None):
     # Must retrieve IDs now in case view changes after saving
     sample_ids = view.values("id")
 
+    now = datetime.utcnow()
+
     #
     # Save samples
     #
@@ -7828,10 +8156,13 @@ def _save_view(view, fields=None):
     pipeline = view._pipeline(detach_frames=True, detach_groups=True)
 
     if sample_fields:
-        pipeline.append({"$project": {f: True for f in sample_fields}})
+        project = {f: True for f in sample_fields}
+        project["_last_modified_at"] = {"$literal": now}
+        pipeline.append({"$project": project})
         pipeline.append({"$merge": dataset._sample_collection_name})
         foo.aggregate(dataset._sample_collection, pipeline)
     elif save_samples:
+        pipeline.append({"$addFields": {"_last_modified_at": now}})
         pipeline.append(
             {
                 "$merge": {
@@ -7862,10 +8193,13 @@ def _save_view(view, fields=None):
             )
 
         if frame_fields:
-            pipeline.append({"$project": {f: True for f in frame_fields}})
+            project = {f: True for f in frame_fields}
+            project["_last_modified_at"] = {"$literal": now}
+            pipeline.append({"$project": project})
             pipeline.append({"$merge": dataset._frame_collection_name})
             foo.aggregate(dataset._sample_collection, pipeline)
         else:
+            pipeline.append({"$addFields": {"_last_modified_at": now}})
             pipeline.append(
                 {
                     "$merge": {
@@ -9070,6 +9404,24 @@ def _finalize_frames(sample_collection, key_field, frame_key_field):
     foo.bulk_write(ops, frame_coll)
 
 
+def _get_sample_dict_signature(d):
+    # Sample dicts with the same field names and value types are assumed to
+    # have the same schema
+    signature = []
+    for key, value in d.items():
+        if isinstance(value, list) and value:
+            value = value[0]
+
+        if isinstance(value, dict):
+            vtype = value.get("_cls", "dict")
+        else:
+            vtype = type(value).__name__
+
+        signature.append((key, vtype))
+
+    return frozenset(signature)
+
+
 def _get_media_type(sample):
     for _, value in sample.iter_fields():
         if isinstance(value, fog.Group):
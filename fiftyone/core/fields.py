@@ -955,8 +955,9 @@ class VectorField(mongoengine.fields.BinaryField, Field):
 
     :class:`VectorField` instances accept numeric lists, tuples, and 1D numpy
     array values. The underlying data is serialized and stored in the database
-    as zlib-compressed bytes generated by ``numpy.save`` and always retrieved
-    as a numpy array.
+    as uncompressed little-endian bytes with a dtype/shape header and always
+    retrieved as a numpy array. Vectors stored as zlib-compressed bytes
+    generated by ``numpy.save`` by previous versions are also supported.
 
     Args:
         description (None): an optional description
@@ -972,7 +973,7 @@ class VectorField(mongoengine.fields.BinaryField, Field):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.serialize_numpy_array(value, codec="raw")
         return super().to_mongo(bytes)
 
     def to_python(self, value):
@@ -999,24 +1000,30 @@ class ArrayField(mongoengine.fields.BinaryField, Field):
     """An n-dimensional array field.
 
     :class:`ArrayField` instances accept numpy array values. The underlying
-    data is serialized and stored in the database as zlib-compressed bytes
-    generated by ``numpy.save`` and always retrieved as a numpy array.
+    data is serialized and stored in the database as bytes encoded by the
+    field's codec and always retrieved as a numpy array. Arrays stored as
+    zlib-compressed bytes generated by ``numpy.save`` by previous versions
+    are also supported.
 
     Args:
         description (None): an optional description
         info (None): an optional info dict
+        codec ("auto"): the codec to use to serialize arrays. See
+            :func:`fiftyone.core.utils.serialize_numpy_array` for the
+            supported values
     """
 
-    def __init__(self, description=None, info=None, **kwargs):
+    def __init__(self, description=None, info=None, codec="auto", **kwargs):
         super().__init__(**kwargs)
         self._description = description
         self._info = info
+        self._codec = codec
 
     def to_mongo(self, value):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.serialize_numpy_array(value, codec=self._codec)
         return super().to_mongo(bytes)
 
     def to_python(self, value):
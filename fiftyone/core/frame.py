@@ -5,6 +5,7 @@ Video frames.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from datetime import datetime
 import itertools
 
 from bson import ObjectId
@@ -651,6 +652,7 @@ class Frames(object):
 
         d["_sample_id"] = self._sample_id
         d["_dataset_id"] = self._dataset._doc.id
+        d["_last_modified_at"] = datetime.utcnow()
 
         return d
 
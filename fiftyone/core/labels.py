@@ -409,7 +409,7 @@ class Detection(_HasAttributesDict, _HasID, Label):
 
     label = fof.StringField()
     bounding_box = fof.ListField(fof.FloatField())
-    mask = fof.ArrayField()
+    mask = fof.ArrayField(codec="rle")
     confidence = fof.FloatField()
     index = fof.IntField()
 
@@ -1017,7 +1017,7 @@ class Segmentation(_HasID, _HasMedia, Label):
 
     _MEDIA_FIELD = "mask_path"
 
-    mask = fof.ArrayField()
+    mask = fof.ArrayField(codec="rle")
     mask_path = fof.StringField()
 
     @property
@@ -6,11 +6,16 @@ Metadata stored in dataset samples.
 |
 """
 
+import io
 import itertools
+import json
 import logging
 import multiprocessing.dummy
 import os
+import re
 import requests
+import sqlite3
+import struct
 
 from PIL import Image
 
@@ -21,6 +26,7 @@ import fiftyone as fo
 from fiftyone.core.odm import DynamicEmbeddedDocument
 import fiftyone.core.fields as fof
 import fiftyone.core.media as fom
+import fiftyone.core.storage as fost
 import fiftyone.core.utils as fou
 
 
@@ -253,6 +259,8 @@ def compute_metadata(
     num_workers=None,
     skip_failures=True,
     warn_failures=False,
+    use_processes=False,
+    cache=None,
     progress=None,
 ):
     """Populates the ``metadata`` field of all samples in the collection.
@@ -260,37 +268,46 @@ def compute_metadata(
     Any samples with existing metadata are skipped, unless
     ``overwrite == True``.
 
+    When a ``cache`` is provided, the metadata of local media is stored on disk
+    keyed by the path, size, and modification time of each file, so that
+    subsequent calls can skip media that has not changed.
+
     Args:
         sample_collection: a
             :class:`fiftyone.core.collections.SampleCollection`
         overwrite (False): whether to overwrite existing metadata
-        num_workers (None): a suggested number of threads to use
+        num_workers (None): a suggested number of threads/processes to use
         skip_failures (True): whether to gracefully continue without raising an
             error if metadata cannot be computed for a sample
         warn_failures (False): whether to log a warning if metadata cannot
             be computed for a sample
+        use_processes (False): whether to compute metadata in a process pool
+            rather than a thread pool
+        cache (None): an optional metadata cache to use. Can be True to use
+            the default cache in ``fiftyone.config.default_dataset_dir``, or
+            the path to a cache file to use
         progress (None): whether to render a progress bar (True/False), use the
             default value ``fiftyone.config.show_progress_bars`` (None), or a
             progress callback function to invoke instead
     """
-    num_workers = fou.recommend_thread_pool_workers(num_workers)
+    if use_processes:
+        num_workers = fou.recommend_process_pool_workers(num_workers)
+    else:
+        num_workers = fou.recommend_thread_pool_workers(num_workers)
 
     if sample_collection.media_type == fom.GROUP:
         sample_collection = sample_collection.select_group_slices(
             _allow_mixed=True
         )
 
-    if num_workers <= 1:
-        _compute_metadata(
-            sample_collection, overwrite=overwrite, progress=progress
-        )
-    else:
-        _compute_metadata_multi(
-            sample_collection,
-            num_workers,
-            overwrite=overwrite,
-            progress=progress,
-        )
+    _compute_metadata(
+        sample_collection,
+        num_workers=num_workers,
+        use_processes=use_processes,
+        cache=cache,
+        overwrite=overwrite,
+        progress=progress,
+    )
 
     if skip_failures and not warn_failures:
         return
@@ -341,12 +358,27 @@ def get_image_info(f):
     """Retrieves the dimensions and number of channels of the given image from
     a file-like object that is streaming its contents.
 
+    The dimensions of JPEG, PNG, WebP, and TIFF images are parsed directly
+    from their headers when possible, without decoding any pixel data. Other
+    formats are read via ``PIL.Image``.
+
     Args:
         f: a file-like object that supports ``read()``, ``seek()``, ``tell()``
 
     Returns:
         ``(width, height, num_channels)``
     """
+    start = f.tell()
+
+    try:
+        info = _sniff_image_info(f)
+    except (struct.error, ValueError, OSError):
+        info = None
+
+    if info is not None:
+        return info
+
+    f.seek(start)
     img = Image.open(f)
 
     # Flip the dimensions if image metadata requires us to. PIL.Image doesn't
@@ -359,8 +391,284 @@ def get_image_info(f):
     return width, height, len(img.getbands())
 
 
+# Value from PIL.ExifTags.Base.Orientation
+_ORIENTATION_TAG = 0x0112
+_FLIPPED_ORIENTATIONS = {5, 6, 7, 8}
+_XMP_ORIENTATION_PATTERN = re.compile(rb'tiff:Orientation(="|>)([0-9])')
+
+_JPEG_SOF_MARKERS = {
+    0xC0,
+    0xC1,
+    0xC2,
+    0xC3,
+    0xC5,
+    0xC6,
+    0xC7,
+    0xC9,
+    0xCA,
+    0xCB,
+    0xCD,
+    0xCE,
+    0xCF,
+}
+_JPEG_NUM_CHANNELS = {1: 1, 3: 3, 4: 4}
+_PNG_NUM_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+def _sniff_image_info(f):
+    """Parses ``(width, height, num_channels)`` from the header of a JPEG,
+    PNG, WebP, or TIFF image.
+
+    The returned values match those reported by ``PIL.Image``, including
+    accounting for EXIF orientation. If the image is in another format or its
+    header contains metadata that cannot be parsed here, None is returned and
+    the image must be read via ``PIL.Image`` instead.
+
+    Args:
+        f: a file-like object that supports ``read()``, ``seek()``, ``tell()``
+
+    Returns:
+        ``(width, height, num_channels)``, or None
+    """
+    start = f.tell()
+    header = f.read(12)
+
+    if header[:2] == b"\xff\xd8":
+        f.seek(start + 2)
+        return _sniff_jpeg_info(f)
+
+    if header[:8] == b"\x89PNG\r\n\x1a\n":
+        f.seek(start + 8)
+        return _sniff_png_info(f)
+
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return _sniff_webp_info(f)
+
+    if header[:4] in (b"II*\x00", b"MM\x00*"):
+        return _sniff_tiff_info(f, start)
+
+    return None
+
+
+def _sniff_jpeg_info(f):
+    info = None
+    exif = None
+    xmp = None
+
+    # Like PIL, we read all markers up to the start of the image data, since
+    # APP segments may follow the frame header
+    while True:
+        if f.read(1) != b"\xff":
+            return None
+
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)
+
+        if not marker:
+            return None
+
+        marker = marker[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            continue
+
+        if marker in (0xD9, 0xDA):
+            break
+
+        length = struct.unpack(">H", f.read(2))[0]
+
+        if marker in _JPEG_SOF_MARKERS and info is None:
+            _, height, width, num_layers = struct.unpack(">BHHB", f.read(6))
+            num_channels = _JPEG_NUM_CHANNELS.get(num_layers, None)
+            if num_channels is None or height == 0:
+                return None
+
+            info = (width, height, num_channels)
+            f.seek(length - 8, io.SEEK_CUR)
+        elif marker == 0xE1:
+            data = f.read(length - 2)
+            if data[:6] == b"Exif\x00\x00":
+                if exif is None:
+                    exif = data[6:]
+            elif data[:29] == b"http://ns.adobe.com/xap/1.0/\x00":
+                xmp = data[29:]
+        else:
+            f.seek(length - 2, io.SEEK_CUR)
+
+    if info is None:
+        return None
+
+    orientation = None
+
+    if exif is not None:
+        tags = _read_tiff_tags(
+            lambda offset, size: exif[offset : offset + size],
+            (_ORIENTATION_TAG,),
+        )
+        if tags is not None:
+            orientation = tags.get(_ORIENTATION_TAG, None)
+
+    if orientation is None and xmp is not None:
+        match = _XMP_ORIENTATION_PATTERN.search(xmp)
+        if match:
+            orientation = int(match[2])
+
+    width, height, num_channels = info
+    if orientation in _FLIPPED_ORIENTATIONS:
+        width, height = height, width
+
+    return width, height, num_channels
+
+
+def _sniff_png_info(f):
+    length, chunk_type = struct.unpack(">I4s", f.read(8))
+    if chunk_type != b"IHDR":
+        return None
+
+    width, height, _, color_type = struct.unpack(">IIBB", f.read(10))
+    num_channels = _PNG_NUM_CHANNELS.get(color_type, None)
+    if num_channels is None:
+        return None
+
+    f.seek(length - 6, io.SEEK_CUR)  # rest of IHDR + CRC
+
+    # PIL reads EXIF orientation from chunks anywhere in the file, so we must
+    # scan all chunk headers for EXIF/XMP metadata
+    while True:
+        data = f.read(8)
+        if len(data) < 8:
+            break
+
+        length, chunk_type = struct.unpack(">I4s", data)
+        if chunk_type == b"IEND":
+            break
+
+        if chunk_type == b"eXIf":
+            return None
+
+        if chunk_type in (b"tEXt", b"zTXt", b"iTXt"):
+            data = f.read(min(length, 80))
+            keyword = data.split(b"\x00", 1)[0]
+            if keyword in (b"XML:com.adobe.xmp", b"Raw profile type exif"):
+                return None
+
+            f.seek(length - len(data) + 4, io.SEEK_CUR)
+        else:
+            f.seek(length + 4, io.SEEK_CUR)
+
+    return width, height, num_channels
+
+
+def _sniff_webp_info(f):
+    chunk_type, _ = struct.unpack("<4sI", f.read(8))
+
+    if chunk_type == b"VP8 ":
+        data = f.read(10)
+        if data[3:6] != b"\x9d\x01\x2a":
+            return None
+
+        width, height = struct.unpack("<HH", data[6:10])
+        return width & 0x3FFF, height & 0x3FFF, 3
+
+    if chunk_type == b"VP8L":
+        data = f.read(5)
+        if data[0] != 0x2F:
+            return None
+
+        bits = int.from_bytes(data[1:5], "little")
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        num_channels = 4 if (bits >> 28) & 1 else 3
+        return width, height, num_channels
+
+    if chunk_type == b"VP8X":
+        data = f.read(10)
+        flags = data[0]
+
+        # Animations and EXIF/XMP metadata are left to PIL
+        if flags & 0x0E:
+            return None
+
+        width = int.from_bytes(data[4:7], "little") + 1
+        height = int.from_bytes(data[7:10], "little") + 1
+        num_channels = 4 if flags & 0x10 else 3
+        return width, height, num_channels
+
+    return None
+
+
+def _sniff_tiff_info(f, start):
+    def read(offset, size):
+        f.seek(start + offset)
+        return f.read(size)
+
+    # ImageWidth, ImageLength, SamplesPerPixel, Orientation, XMP
+    tags = _read_tiff_tags(read, (256, 257, 277, _ORIENTATION_TAG, 700))
+    if tags is None:
+        return None
+
+    width = tags.get(256, None)
+    height = tags.get(257, None)
+    if width is None or height is None:
+        return None
+
+    # Some versions of PIL apply the orientation of TIFF images when reading
+    # their size, so oriented images must be read via PIL to match
+    orientation = tags.get(_ORIENTATION_TAG, None)
+    if orientation in _FLIPPED_ORIENTATIONS:
+        return None
+
+    if orientation is None and 700 in tags:
+        return None
+
+    num_channels = tags.get(277, None) or 1
+
+    return width, height, num_channels
+
+
+def _read_tiff_tags(read, tags):
+    # Reads the given SHORT/LONG tags from the first IFD of TIFF-formatted
+    # data. Other tags that are present are included with value None
+    byte_order = read(0, 2)
+    if byte_order == b"II":
+        endian = "<"
+    elif byte_order == b"MM":
+        endian = ">"
+    else:
+        return None
+
+    magic, ifd_offset = struct.unpack(endian + "HI", read(2, 6))
+    if magic != 42:
+        return None
+
+    num_entries = struct.unpack(endian + "H", read(ifd_offset, 2))[0]
+    entries = read(ifd_offset + 2, 12 * num_entries)
+
+    values = {}
+    for idx in range(num_entries):
+        entry = entries[12 * idx : 12 * (idx + 1)]
+        tag, field_type, count = struct.unpack(endian + "HHI", entry[:8])
+        if tag not in tags:
+            continue
+
+        if count == 1 and field_type == 3:
+            values[tag] = struct.unpack(endian + "H", entry[8:10])[0]
+        elif count == 1 and field_type == 4:
+            values[tag] = struct.unpack(endian + "I", entry[8:12])[0]
+        else:
+            values[tag] = None
+
+    return values
+
+
 def _compute_metadata(
-    sample_collection, overwrite=False, batch_size=1000, progress=None
+    sample_collection,
+    num_workers=1,
+    use_processes=False,
+    cache=None,
+    overwrite=False,
+    batch_size=1000,
+    progress=None,
 ):
     if not overwrite:
         sample_collection = sample_collection.exists("metadata", False)
@@ -376,69 +684,210 @@ def _compute_metadata(
 
     logger.info("Computing metadata...")
 
-    inputs = zip(ids, filepaths, media_types)
+    inputs = list(zip(ids, filepaths, media_types))
     values = {}
 
+    cache_path = _parse_cache(cache)
+    if cache_path is not None:
+        metadata_cache = _MetadataCache(cache_path)
+    else:
+        metadata_cache = None
+
     try:
         with fou.ProgressBar(total=num_samples, progress=progress) as pb:
-            for args in pb(inputs):
-                sample_id, metadata = _do_compute_metadata(args)
+            if metadata_cache is not None:
+                inputs, results = metadata_cache.lookup(inputs)
+
+                # Omit the keys of cached results so they aren't rewritten
+                results = [(_id, None, m) for _id, _, m in results]
+            else:
+                inputs = [args + (None,) for args in inputs]
+                results = []
+
+            results = itertools.chain(
+                results,
+                _iter_metadata(inputs, num_workers, use_processes),
+            )
+
+            for sample_id, key, metadata in results:
                 values[sample_id] = metadata
+                if metadata_cache is not None and key is not None:
+                    metadata_cache.add(key, metadata)
+
+                pb.update()
+
                 if len(values) >= batch_size:
                     sample_collection.set_values(
                         "metadata", values, key_field="id"
                     )
                     values.clear()
+
+                    if metadata_cache is not None:
+                        metadata_cache.flush()
     finally:
         sample_collection.set_values("metadata", values, key_field="id")
 
+        if metadata_cache is not None:
+            metadata_cache.close()
 
-def _compute_metadata_multi(
-    sample_collection,
-    num_workers,
-    overwrite=False,
-    batch_size=1000,
-    progress=None,
-):
-    if not overwrite:
-        sample_collection = sample_collection.exists("metadata", False)
 
-    ids, filepaths, media_types = sample_collection.values(
-        ["id", "filepath", "_media_type"],
-        _allow_missing=True,
-    )
+def _iter_metadata(inputs, num_workers, use_processes):
+    if not inputs:
+        return
+
+    if num_workers <= 1:
+        for args in inputs:
+            yield _do_compute_metadata(args)
 
-    num_samples = len(ids)
-    if num_samples == 0:
         return
 
-    logger.info("Computing metadata...")
+    if use_processes:
+        ctx = fou.get_multiprocessing_context()
 
-    inputs = zip(ids, filepaths, media_types)
-    values = {}
+        # Amortize the IPC overhead of sending small tasks to processes
+        chunksize = max(1, min(64, len(inputs) // (4 * num_workers)))
+    else:
+        ctx = multiprocessing.dummy
+        chunksize = 1
 
-    try:
-        with multiprocessing.dummy.Pool(processes=num_workers) as pool:
-            with fou.ProgressBar(total=num_samples, progress=progress) as pb:
-                for sample_id, metadata in pb(
-                    pool.imap_unordered(_do_compute_metadata, inputs)
-                ):
-                    values[sample_id] = metadata
-                    if len(values) >= batch_size:
-                        sample_collection.set_values(
-                            "metadata", values, key_field="id"
-                        )
-                        values.clear()
-    finally:
-        sample_collection.set_values("metadata", values, key_field="id")
+    with ctx.Pool(processes=num_workers) as pool:
+        for result in pool.imap_unordered(
+            _do_compute_metadata, inputs, chunksize=chunksize
+        ):
+            yield result
 
 
 def _do_compute_metadata(args):
-    sample_id, filepath, media_type = args
+    sample_id, filepath, media_type, key = args
     metadata = _compute_sample_metadata(
         filepath, media_type, skip_failures=True
     )
-    return sample_id, metadata
+    return sample_id, key, metadata
+
+
+def _parse_cache(cache):
+    if cache is None or cache is False:
+        return None
+
+    if cache is True:
+        return os.path.join(
+            fo.config.default_dataset_dir, "__metadata__", "cache.db"
+        )
+
+    return fost.normalize_path(cache)
+
+
+def _get_cache_key(filepath):
+    if filepath.startswith("http"):
+        return None
+
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+
+    return filepath, stat.st_size, stat.st_mtime_ns
+
+
+class _MetadataCache(object):
+    """An on-disk cache of :class:`Metadata` instances keyed by the
+    ``(filepath, size, mtime)`` of the media that they describe.
+
+    Args:
+        path: the path to the SQLite database in which to store the cache
+    """
+
+    def __init__(self, path):
+        etau.ensure_basedir(path)
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "filepath TEXT PRIMARY KEY, "
+            "size INTEGER, "
+            "mtime_ns INTEGER, "
+            "metadata TEXT)"
+        )
+        self._conn.commit()
+        self._pending = []
+
+    def lookup(self, inputs, batch_size=500):
+        """Looks up the given inputs in the cache.
+
+        Args:
+            inputs: a list of ``(sample_id, filepath, media_type)`` tuples
+            batch_size (500): the number of filepaths to query at a time
+
+        Returns:
+            a tuple of
+
+            -   a list of ``(sample_id, filepath, media_type, key)`` tuples
+                whose metadata must be computed
+            -   a list of ``(sample_id, key, metadata)`` tuples that were
+                found in the cache
+        """
+        misses = []
+        hits = []
+        for batch in fou.iter_batches(inputs, batch_size):
+            keys = [_get_cache_key(filepath) for _, filepath, _ in batch]
+            filepaths = [key[0] for key in keys if key is not None]
+
+            rows = {}
+            if filepaths:
+                query = (
+                    "SELECT filepath, size, mtime_ns, metadata FROM metadata "
+                    "WHERE filepath IN (%s)" % ",".join("?" * len(filepaths))
+                )
+                for filepath, size, mtime_ns, d in self._conn.execute(
+                    query, filepaths
+                ):
+                    rows[filepath] = (size, mtime_ns, d)
+
+            for (sample_id, filepath, media_type), key in zip(batch, keys):
+                metadata = None
+                if key is not None:
+                    row = rows.get(filepath, None)
+                    if row is not None and row[:2] == key[1:]:
+                        metadata = Metadata.from_dict(json.loads(row[2]))
+                        if type(metadata) is not get_metadata_cls(media_type):
+                            metadata = None
+
+                if metadata is not None:
+                    hits.append((sample_id, key, metadata))
+                else:
+                    misses.append((sample_id, filepath, media_type, key))
+
+        return misses, hits
+
+    def add(self, key, metadata):
+        """Adds the given metadata to the cache.
+
+        The metadata is not written to disk until :meth:`flush` is called.
+
+        Args:
+            key: a ``(filepath, size, mtime_ns)`` tuple, or None
+            metadata: a :class:`Metadata`, or None
+        """
+        if key is None or metadata is None:
+            return
+
+        self._pending.append(key + (json.dumps(metadata.to_dict()),))
+
+    def flush(self):
+        """Writes any pending metadata to disk."""
+        if not self._pending:
+            return
+
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?)",
+            self._pending,
+        )
+        self._conn.commit()
+        self._pending = []
+
+    def close(self):
+        """Writes any pending metadata to disk and closes the cache."""
+        self.flush()
+        self._conn.close()
 
 
 def _compute_sample_metadata(filepath, media_type, skip_failures=False):
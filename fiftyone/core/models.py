@@ -5,11 +5,19 @@ FiftyOne models.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
+import functools
 import inspect
 import logging
+import queue
+import threading
+import timeit
 
+from bson import ObjectId
 import numpy as np
+from pymongo import UpdateOne
 
 import eta.core.frameutils as etaf
 import eta.core.learning as etal
@@ -23,6 +31,7 @@ import fiftyone.core.collections as foc
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
+import fiftyone.core.sample as fosa
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
@@ -41,6 +50,10 @@ fouu = fou.lazy_import("fiftyone.utils.ultralytics")
 logger = logging.getLogger(__name__)
 
 
+# The number of batches of images to decode ahead of inference when loading
+# images for non-Torch models
+_PREFETCH_BATCHES = 2
+
 _ALLOWED_PATCH_TYPES = (
     fol.Detection,
     fol.Detections,
@@ -86,7 +99,11 @@ def apply_model(
         batch_size (None): an optional batch size to use, if the model supports
             batching
         num_workers (None): the number of workers to use when loading images.
-            Only applicable for Torch-based models
+            Torch-based models use a
+            :class:`torch:torch.utils.data.DataLoader` with this many workers.
+            Other image models decode upcoming batches of images in a thread
+            pool of this size while inference runs, or in the main thread if
+            ``num_workers=0``. Not applicable to video collections
         skip_failures (True): whether to gracefully continue without raising an
             error if predictions cannot be generated for a sample. Only
             applicable to :class:`Model` instances
@@ -157,9 +174,10 @@ def apply_model(
         isinstance(model, TorchModelMixin) and samples.media_type == fom.IMAGE
     )
 
-    if num_workers is not None and not use_data_loader:
+    if num_workers is not None and samples.media_type != fom.IMAGE:
         logger.warning(
-            "Ignoring `num_workers` parameter; only supported for Torch models"
+            "Ignoring `num_workers` parameter; only supported for image "
+            "collections"
         )
 
     if output_dir is not None:
@@ -259,6 +277,7 @@ def apply_model(
                 label_field,
                 confidence_thresh,
                 batch_size,
+                num_workers,
                 skip_failures,
                 filename_maker,
                 progress,
@@ -269,6 +288,7 @@ def apply_model(
             model,
             label_field,
             confidence_thresh,
+            num_workers,
             skip_failures,
             filename_maker,
             progress,
@@ -313,6 +333,7 @@ def _apply_image_model_single(
     model,
     label_field,
     confidence_thresh,
+    num_workers,
     skip_failures,
     filename_maker,
     progress,
@@ -320,12 +341,14 @@ def _apply_image_model_single(
     needs_samples = isinstance(model, SamplesMixin)
 
     with contextlib.ExitStack() as context:
-        pb = context.enter_context(fou.ProgressBar(progress=progress))
+        pb = context.enter_context(fou.ProgressBar(samples, progress=progress))
         ctx = context.enter_context(foc.SaveContext(samples))
 
-        for sample in pb(samples):
+        for (sample,), load_imgs in _iter_image_batches(
+            samples, 1, num_workers
+        ):
             try:
-                img = foui.read(sample.filepath)
+                (img,) = load_imgs()
 
                 if needs_samples:
                     labels = model.predict(img, sample=sample)
@@ -347,6 +370,8 @@ def _apply_image_model_single(
 
                 logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
+            pb.update()
+
 
 def _apply_image_model_batch(
     samples,
@@ -354,6 +379,7 @@ def _apply_image_model_batch(
     label_field,
     confidence_thresh,
     batch_size,
+    num_workers,
     skip_failures,
     filename_maker,
     progress,
@@ -364,9 +390,11 @@ def _apply_image_model_batch(
         pb = context.enter_context(fou.ProgressBar(samples, progress=progress))
         ctx = context.enter_context(foc.SaveContext(samples))
 
-        for sample_batch in fou.iter_batches(samples, batch_size):
+        for sample_batch, load_imgs in _iter_image_batches(
+            samples, batch_size, num_workers
+        ):
             try:
-                imgs = [foui.read(sample.filepath) for sample in sample_batch]
+                imgs = load_imgs()
 
                 if needs_samples:
                     labels_batch = model.predict_all(
@@ -400,6 +428,48 @@ def _apply_image_model_batch(
             pb.update(len(sample_batch))
 
 
+def _iter_image_batches(
+    samples, batch_size, num_workers, prefetch=_PREFETCH_BATCHES
+):
+    # Emits (sample_batch, load_imgs) tuples, where load_imgs() returns the
+    # images in the batch or raises the error encountered while reading them.
+    # When num_workers > 0, images are decoded in a thread pool up to
+    # `prefetch` batches ahead of the batch that is currently being processed
+    num_workers = fou.recommend_thread_pool_workers(num_workers)
+    batches = fou.iter_batches(samples, batch_size)
+
+    if num_workers <= 0:
+        for sample_batch in batches:
+            yield sample_batch, functools.partial(_read_images, sample_batch)
+
+        return
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        queue = deque()
+        for sample_batch in batches:
+            futures = [
+                executor.submit(foui.read, sample.filepath)
+                for sample in sample_batch
+            ]
+            queue.append((sample_batch, futures))
+
+            if len(queue) > prefetch:
+                sample_batch, futures = queue.popleft()
+                yield sample_batch, functools.partial(_get_results, futures)
+
+        while queue:
+            sample_batch, futures = queue.popleft()
+            yield sample_batch, functools.partial(_get_results, futures)
+
+
+def _read_images(sample_batch):
+    return [foui.read(sample.filepath) for sample in sample_batch]
+
+
+def _get_results(futures):
+    return [future.result() for future in futures]
+
+
 def _apply_image_model_data_loader(
     samples,
     model,
@@ -419,7 +489,9 @@ def _apply_image_model_data_loader(
 
     with contextlib.ExitStack() as context:
         pb = context.enter_context(fou.ProgressBar(samples, progress=progress))
-        ctx = context.enter_context(foc.SaveContext(samples))
+        writer = context.enter_context(
+            _AsyncSampleWriter(samples, skip_failures=skip_failures)
+        )
 
         for sample_batch, imgs in zip(
             fou.iter_batches(samples, batch_size),
@@ -440,12 +512,12 @@ def _apply_image_model_data_loader(
                     if filename_maker is not None:
                         _export_arrays(labels, sample.filepath, filename_maker)
 
-                    sample.add_labels(
+                    writer.add_labels(
+                        sample,
                         labels,
                         label_field=label_field,
                         confidence_thresh=confidence_thresh,
                     )
-                    ctx.save(sample)
 
             except Exception as e:
                 if not skip_failures:
@@ -461,6 +533,222 @@ def _apply_image_model_data_loader(
             pb.update(len(sample_batch))
 
 
+class _AsyncSampleWriter(object):
+    """Context that writes field values to the samples of a collection in a
+    background thread, so that the caller never blocks on database
+    round-trips.
+
+    Values are serialized directly into ``$set`` updates without modifying
+    any :class:`fiftyone.core.sample.Sample` instances, and updates are
+    flushed according to the batching strategy described by
+    :func:`fiftyone.core.utils.parse_batching_strategy`. At most
+    ``max_queue_size`` samples may be pending at any time; beyond that,
+    the caller blocks until the writer catches up.
+
+    Args:
+        sample_collection: a
+            :class:`fiftyone.core.collections.SampleCollection`
+        batch_size (None): the batch size to use when writing updates
+        batching_strategy (None): the batching strategy to use when writing
+            updates
+        max_queue_size (1000): the maximum number of pending samples
+        skip_failures (True): whether to log a warning rather than raise an
+            error if values cannot be written
+    """
+
+    def __init__(
+        self,
+        sample_collection,
+        batch_size=None,
+        batching_strategy=None,
+        max_queue_size=1000,
+        skip_failures=True,
+    ):
+        batch_size, batching_strategy = fou.parse_batching_strategy(
+            batch_size=batch_size, batching_strategy=batching_strategy
+        )
+
+        self.batch_size = batch_size
+        self.batching_strategy = batching_strategy
+        self.skip_failures = skip_failures
+
+        self._dataset = sample_collection._dataset
+        self._fields = {}
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = None
+        self._error = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, *args):
+        self._queue.put(None)
+        self._thread.join()
+
+        if exc_type is None:
+            self._raise_error()
+
+    def add_labels(
+        self, sample, labels, label_field=None, confidence_thresh=None
+    ):
+        """Registers the given labels to be written to the sample.
+
+        The labels are interpreted as per
+        :meth:`fiftyone.core.sample.Sample.add_labels`, except that frame
+        labels are not supported.
+
+        Args:
+            sample: a :class:`fiftyone.core.sample.Sample` or
+                :class:`fiftyone.core.sample.SampleView`
+            labels: a :class:`fiftyone.core.labels.Label` or dict of labels
+            label_field (None): the sample field, prefix, or dict defining in
+                which field(s) to save the labels
+            confidence_thresh (None): an optional confidence threshold to apply
+                to any applicable labels before saving them
+        """
+        if confidence_thresh is not None:
+            labels = fosa._apply_confidence_thresh(labels, confidence_thresh)
+
+        if isinstance(label_field, dict):
+            label_key = lambda k: label_field.get(k, k)
+        elif label_field is not None:
+            label_key = lambda k: label_field + "_" + k
+        else:
+            label_key = lambda k: k
+
+        if fosa._is_frames_dict(labels):
+            raise ValueError("Cannot add frame labels to non-video samples")
+
+        if isinstance(labels, dict):
+            values = {label_key(k): v for k, v in labels.items()}
+        elif labels is not None:
+            if label_field is None:
+                raise ValueError(
+                    "A `label_field` must be provided in order to add labels "
+                    "to a single sample field"
+                )
+
+            values = {label_field: labels}
+        else:
+            return
+
+        self.set_values(sample.id, values)
+
+    def set_values(self, sample_id, values):
+        """Registers the given field values to be written to the sample.
+
+        Any fields that do not exist are added to the dataset's schema.
+        ``None`` values for fields that do not exist are ignored.
+
+        Args:
+            sample_id: the ID of the sample
+            values: a dict mapping field names to values
+        """
+        self._raise_error()
+
+        _values = {}
+        for field_name, value in values.items():
+            if self._fields.get(field_name, None) is None:
+                self._fields[field_name] = self._get_field(field_name, value)
+
+            if self._fields[field_name] is not None:
+                _values[field_name] = value
+
+        if _values:
+            self._queue.put((sample_id, _values))
+
+    def _get_field(self, field_name, value):
+        field = self._dataset.get_field(field_name)
+        if field is None and value is not None:
+            self._dataset._add_implied_sample_field(field_name, value)
+            field = self._dataset.get_field(field_name)
+
+        return field
+
+    def _raise_error(self):
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+
+    def _run(self):
+        ops = []
+        ids = []
+        curr_size = 0
+        last_time = timeit.default_timer()
+
+        while True:
+            timeout = None
+            if ops and self.batching_strategy == "latency":
+                elapsed = timeit.default_timer() - last_time
+                timeout = max(self.batch_size - elapsed, 0)
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ()
+
+            if item is None:
+                self._write(ops, ids)
+                break
+
+            if item:
+                sample_id, values = item
+                op = self._make_op(sample_id, values)
+                if op is not None:
+                    ops.append(op)
+                    ids.append(sample_id)
+                    if self.batching_strategy == "size":
+                        curr_size += len(str(op))
+
+            if self.batching_strategy == "static":
+                flush = len(ops) >= self.batch_size
+            elif self.batching_strategy == "size":
+                flush = curr_size >= self.batch_size
+            else:
+                flush = timeit.default_timer() - last_time >= self.batch_size
+
+            if flush:
+                self._write(ops, ids)
+                ops = []
+                ids = []
+                curr_size = 0
+                last_time = timeit.default_timer()
+
+    def _make_op(self, sample_id, values):
+        try:
+            update = {}
+            for field_name, value in values.items():
+                field = self._fields[field_name]
+                update[field.db_field or field_name] = foc._serialize_value(
+                    field_name, field, value
+                )
+
+            return UpdateOne({"_id": ObjectId(sample_id)}, {"$set": update})
+        except Exception as e:
+            self._handle_error(e, "Sample: %s" % sample_id)
+
+    def _write(self, ops, ids):
+        if not ops:
+            return
+
+        try:
+            self._dataset._bulk_write(ops, ids=ids)
+        except Exception as e:
+            self._handle_error(e, "Batch: %s - %s" % (ids[0], ids[-1]))
+
+    def _handle_error(self, error, msg):
+        if not self.skip_failures:
+            if self._error is None:
+                self._error = error
+
+            return
+
+        logger.warning("%s\nError: %s\n", msg, error)
+
+
 def _apply_image_model_to_frames_single(
     samples,
     model,
@@ -798,7 +1086,11 @@ def compute_embeddings(
         batch_size (None): an optional batch size to use, if the model supports
             batching
         num_workers (None): the number of workers to use when loading images.
-            Only applicable for Torch-based models
+            Torch-based models use a
+            :class:`torch:torch.utils.data.DataLoader` with this many workers.
+            Other image models decode upcoming batches of images in a thread
+            pool of this size while inference runs, or in the main thread if
+            ``num_workers=0``. Not applicable to video collections
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample. Only
             applicable to :class:`Model` instances
@@ -871,9 +1163,10 @@ def compute_embeddings(
         isinstance(model, TorchModelMixin) and samples.media_type == fom.IMAGE
     )
 
-    if num_workers is not None and not use_data_loader:
+    if num_workers is not None and samples.media_type != fom.IMAGE:
         logger.warning(
-            "Ignoring `num_workers` parameter; only supported for Torch models"
+            "Ignoring `num_workers` parameter; only supported for image "
+            "collections"
         )
 
     if embeddings_field is not None:
@@ -943,31 +1236,73 @@ def compute_embeddings(
                 model,
                 embeddings_field,
                 batch_size,
+                num_workers,
                 skip_failures,
                 progress,
             )
 
         return _compute_image_embeddings_single(
-            samples, model, embeddings_field, skip_failures, progress
+            samples,
+            model,
+            embeddings_field,
+            num_workers,
+            skip_failures,
+            progress,
         )
 
 
+def get_embeddings(samples, embeddings_field):
+    """Loads the embeddings stored in the given field of the collection into
+    a single array.
+
+    Embeddings written by :func:`compute_embeddings` are stored as raw
+    bytes, so they are decoded in bulk without any per-sample processing.
+
+    Args:
+        samples: a :class:`fiftyone.core.collections.SampleCollection`
+        embeddings_field: the name of a
+            :class:`fiftyone.core.fields.VectorField` containing embeddings.
+            When loading video frame embeddings, the "frames." prefix is
+            required
+
+    Returns:
+        a ``num_samples x num_dim`` array of embeddings, or a
+        ``num_frames x num_dim`` array when loading frame embeddings, where
+        ``num_frames`` is the total number of frames in the collection
+    """
+    samples.validate_field_type(embeddings_field, fof.VectorField)
+
+    values = samples.values(embeddings_field, unwind=True, _raw=True)
+
+    num_missing = sum(v is None for v in values)
+    if num_missing > 0:
+        raise ValueError(
+            "Found %d samples with no embeddings in field '%s'. Use "
+            "`exists('%s')` to select only samples with embeddings"
+            % (num_missing, embeddings_field, embeddings_field)
+        )
+
+    return fou.deserialize_numpy_arrays(values)
+
+
 def _compute_image_embeddings_single(
-    samples, model, embeddings_field, skip_failures, progress
+    samples, model, embeddings_field, num_workers, skip_failures, progress
 ):
     embeddings = []
     errors = False
 
     with contextlib.ExitStack() as context:
-        pb = context.enter_context(fou.ProgressBar(progress=progress))
+        pb = context.enter_context(fou.ProgressBar(samples, progress=progress))
         if embeddings_field is not None:
             ctx = context.enter_context(foc.SaveContext(samples))
 
-        for sample in pb(samples):
+        for (sample,), load_imgs in _iter_image_batches(
+            samples, 1, num_workers
+        ):
             embedding = None
 
             try:
-                img = foui.read(sample.filepath)
+                (img,) = load_imgs()
                 embedding = model.embed(img)
             except Exception as e:
                 if not skip_failures:
@@ -982,6 +1317,8 @@ def _compute_image_embeddings_single(
             else:
                 embeddings.append(embedding)
 
+            pb.update()
+
     if embeddings_field is not None:
         return None
 
@@ -992,7 +1329,13 @@ def _compute_image_embeddings_single(
 
 
 def _compute_image_embeddings_batch(
-    samples, model, embeddings_field, batch_size, skip_failures, progress
+    samples,
+    model,
+    embeddings_field,
+    batch_size,
+    num_workers,
+    skip_failures,
+    progress,
 ):
     embeddings = []
     errors = False
@@ -1002,11 +1345,13 @@ def _compute_image_embeddings_batch(
         if embeddings_field is not None:
             ctx = context.enter_context(foc.SaveContext(samples))
 
-        for sample_batch in fou.iter_batches(samples, batch_size):
+        for sample_batch, load_imgs in _iter_image_batches(
+            samples, batch_size, num_workers
+        ):
             embeddings_batch = [None] * len(sample_batch)
 
             try:
-                imgs = [foui.read(sample.filepath) for sample in sample_batch]
+                imgs = load_imgs()
                 embeddings_batch = list(model.embed_all(imgs))  # list of 1D
             except Exception as e:
                 if not skip_failures:
@@ -1057,7 +1402,9 @@ def _compute_image_embeddings_data_loader(
     with contextlib.ExitStack() as context:
         pb = context.enter_context(fou.ProgressBar(samples, progress=progress))
         if embeddings_field is not None:
-            ctx = context.enter_context(foc.SaveContext(samples))
+            writer = context.enter_context(
+                _AsyncSampleWriter(samples, skip_failures=skip_failures)
+            )
 
         for sample_batch, imgs in zip(
             fou.iter_batches(samples, batch_size),
@@ -1084,8 +1431,7 @@ def _compute_image_embeddings_data_loader(
 
             if embeddings_field is not None:
                 for sample, embedding in zip(sample_batch, embeddings_batch):
-                    sample[embeddings_field] = embedding
-                    ctx.save(sample)
+                    writer.set_values(sample.id, {embeddings_field: embedding})
             else:
                 embeddings.extend(embeddings_batch)
 
@@ -15,7 +15,7 @@ import os
 import asyncio
 from bson import json_util, ObjectId
 from bson.codec_options import CodecOptions
-from mongoengine import connect
+from mongoengine import connect, disconnect
 import motor.motor_asyncio as mtr
 
 from packaging.version import Version
@@ -376,6 +376,21 @@ def ensure_connection():
     _connect()
 
 
+def reset_connection():
+    """Discards this process's database clients so that the next database
+    access establishes a new connection.
+
+    This must be called in worker processes that are forked from a process
+    that has already connected to the database.
+    """
+    global _client
+    global _async_client
+
+    _client = None
+    _async_client = None
+    disconnect()
+
+
 def get_db_client():
     """Returns a database client.
 
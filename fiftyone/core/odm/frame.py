@@ -26,6 +26,7 @@ class DatasetFrameDocument(DatasetMixin, Document):
 
     _sample_id = fof.ObjectIdField(required=True)
     _dataset_id = fof.ObjectIdField()
+    _last_modified_at = fof.DateTimeField(null=True)
 
 
 class NoDatasetFrameDocument(NoDatasetMixin, SerializableDocument):
@@ -6,6 +6,7 @@ Mixins and helpers for dataset backing documents.
 |
 """
 from collections import OrderedDict
+from datetime import datetime
 
 from bson import ObjectId
 from pymongo import UpdateOne
@@ -783,6 +784,7 @@ class DatasetMixin(object):
 
         coll = get_db_conn()[cls.__name__]
         coll.update_many({}, {"$rename": rename_expr})
+        cls._dataset._bump_data_version()
 
     @classmethod
     def _rename_fields_collection(cls, sample_collection, paths, new_paths):
@@ -824,6 +826,7 @@ class DatasetMixin(object):
         #
         field_roots = sample_collection._get_root_fields(paths + new_paths)
         view.save(field_roots)
+        cls._dataset._bump_data_version()
 
     @classmethod
     def _clone_fields_simple(cls, paths, new_paths):
@@ -836,6 +839,7 @@ class DatasetMixin(object):
 
         coll = get_db_conn()[cls.__name__]
         coll.update_many({}, [{"$set": set_expr}])
+        cls._dataset._bump_data_version()
 
     @classmethod
     def _clone_fields_collection(cls, sample_collection, paths, new_paths):
@@ -883,8 +887,11 @@ class DatasetMixin(object):
 
         _paths = cls._handle_db_fields(paths)
 
+        update = {p: None for p in _paths}
+        update["_last_modified_at"] = datetime.utcnow()
+
         coll = get_db_conn()[cls.__name__]
-        coll.update_many({}, {"$set": {p: None for p in _paths}})
+        coll.update_many({}, {"$set": update})
 
     @classmethod
     def _clear_fields_collection(cls, sample_collection, paths):
@@ -919,6 +926,7 @@ class DatasetMixin(object):
 
         coll = get_db_conn()[cls.__name__]
         coll.update_many({}, [{"$unset": _paths}])
+        cls._dataset._bump_data_version()
 
     @classmethod
     def _handle_db_field(cls, path, new_path=None):
@@ -1311,6 +1319,10 @@ class DatasetMixin(object):
         """Updates an existing document."""
         extra_updates = self._extract_extra_updates(updates, filtered_fields)
 
+        now = datetime.utcnow()
+        updates.setdefault("$set", {})["_last_modified_at"] = now
+        self._data["_last_modified_at"] = now
+
         if deferred:
             ops = self._deferred_updates(_id, updates, extra_updates, upsert)
             updated_existing = None
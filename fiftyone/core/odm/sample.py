@@ -89,6 +89,7 @@ class DatasetSampleDocument(DatasetMixin, Document):
     _media_type = fof.StringField()
     _rand = fof.FloatField(default=_generate_rand)
     _dataset_id = fof.ObjectIdField()
+    _last_modified_at = fof.DateTimeField(null=True)
 
     @property
     def media_type(self):
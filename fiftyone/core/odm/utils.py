@@ -65,7 +65,8 @@ def serialize_value(value, extended=False):
 
     if isinstance(value, np.ndarray):
         # VectorField/ArrayField
-        binary = Binary(fou.serialize_numpy_array(value))
+        codec = "raw" if value.ndim == 1 else "auto"
+        binary = Binary(fou.serialize_numpy_array(value, codec=codec))
         if not extended:
             return binary
 
@@ -327,14 +327,19 @@ class _PatchesView(fov.DatasetView):
         self._source_collection.reload()
 
         #
-        # Regenerate the patches dataset
+        # Sync the patches dataset with any changes to the source collection
+        # since it was last generated, or regenerate it from scratch if an
+        # incremental sync is not possible
         #
         # This assumes that calling `load_view()` when the current patches
         # dataset has been deleted will cause a new one to be generated
         #
-        self._patches_dataset.delete()
-        _view = self._patches_stage.load_view(self._source_collection)
-        self._patches_dataset = _view._patches_dataset
+        if not self._patches_stage._sync_dataset(
+            self._source_collection, self._patches_dataset
+        ):
+            self._patches_dataset.delete()
+            _view = self._patches_stage.load_view(self._source_collection)
+            self._patches_dataset = _view._patches_dataset
 
         super().reload()
 
@@ -748,6 +748,137 @@ class SampleView(_SampleMixin, DocumentView):
         return sample_ops, frame_ops
 
 
+class SampleRecord(object):
+    """A read-only record of a sample in a collection.
+
+    Sample records are lightweight alternatives to :class:`Sample` and
+    :class:`SampleView` instances for read-only workflows. They are backed
+    directly by the sample's dictionary as loaded from the database, and
+    their fields are only deserialized when they are first accessed.
+
+    Sample records do not belong to a dataset, cannot be modified or saved,
+    and do not provide access to frame-level fields. Modifying the values
+    returned by a record has no effect on the database.
+
+    .. note::
+
+        Sample records should never be created manually; they are generated
+        by calling ``iter_samples(read_only=True)`` on a
+        :class:`fiftyone.core.collections.SampleCollection`.
+
+    Args:
+        d: a sample dict
+        fields: a dict mapping field names to ``(db_field, field)`` tuples
+    """
+
+    __slots__ = ("_d", "_fields", "_values")
+
+    def __init__(self, d, fields):
+        object.__setattr__(self, "_d", d)
+        object.__setattr__(self, "_fields", fields)
+        object.__setattr__(self, "_values", {})
+
+    def __repr__(self):
+        return "<%s: id=%s, filepath=%s>" % (
+            self.__class__.__name__,
+            self.id,
+            self._d.get("filepath", None),
+        )
+
+    def __getattr__(self, name):
+        try:
+            return self.get_field(name)
+        except KeyError:
+            raise AttributeError(
+                "%s has no field '%s'" % (self.__class__.__name__, name)
+            )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "%s instances are read-only" % self.__class__.__name__
+        )
+
+    def __getitem__(self, field_name):
+        return self.get_field(field_name)
+
+    def __setitem__(self, field_name, value):
+        raise TypeError("%s instances are read-only" % self.__class__.__name__)
+
+    def __contains__(self, field_name):
+        return self.has_field(field_name)
+
+    @property
+    def id(self):
+        """The ID of the sample."""
+        return str(self._d["_id"])
+
+    @property
+    def media_type(self):
+        """The media type of the sample."""
+        return self._d.get("_media_type", None)
+
+    @property
+    def filename(self):
+        """The basename of the media's filepath."""
+        return os.path.basename(self._d["filepath"])
+
+    @property
+    def field_names(self):
+        """An ordered tuple of the public fields of this record."""
+        return tuple(
+            name
+            for name, (db_field, _) in self._fields.items()
+            if not name.startswith("_") and db_field in self._d
+        )
+
+    def has_field(self, field_name):
+        """Determines whether the record has a field of the given name.
+
+        Args:
+            field_name: the field name
+
+        Returns:
+            True/False
+        """
+        db_field, _ = self._fields.get(field_name, (field_name, None))
+        return db_field in self._d
+
+    def get_field(self, field_name):
+        """Gets the value of a field of the record.
+
+        Args:
+            field_name: the field name
+
+        Returns:
+            the field value
+
+        Raises:
+            KeyError: if the field does not exist
+        """
+        try:
+            return self._values[field_name]
+        except KeyError:
+            pass
+
+        db_field, field = self._fields.get(field_name, (field_name, None))
+
+        if db_field not in self._d:
+            if field is None:
+                raise KeyError(
+                    "%s has no field '%s'"
+                    % (self.__class__.__name__, field_name)
+                )
+
+            value = None
+        elif field is not None:
+            value = field.to_python(self._d[db_field])
+        else:
+            value = foo.deserialize_value(self._d[db_field])
+
+        self._values[field_name] = value
+        return value
+
+
 def _apply_confidence_thresh(label, confidence_thresh):
     if _is_frames_dict(label):
         label = {
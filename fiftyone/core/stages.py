@@ -9,6 +9,8 @@ View stages.
 from collections import defaultdict, OrderedDict
 import contextlib
 from copy import deepcopy
+from datetime import datetime
+import hashlib
 import itertools
 import random
 import reprlib
@@ -27,6 +29,7 @@ import fiftyone.core.frame as fofr
 import fiftyone.core.groups as fog
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
+import fiftyone.core.odm as foo
 from fiftyone.core.odm.document import MongoEngineBaseDocument
 import fiftyone.core.sample as fos
 import fiftyone.core.utils as fou
@@ -7329,16 +7332,31 @@ class Take(ViewStage):
         stage = fo.Take(2, seed=51)
         view = dataset.add_stage(stage)
 
+    .. note::
+
+        Samples are selected by choosing a random pivot in the space of the
+        collection's internal random keys and returning the ``size`` samples
+        whose keys follow it, wrapping around if necessary. When this stage
+        is applied directly to a non-grouped image dataset, this is performed
+        via an indexed range scan, so its cost scales with ``size`` rather
+        than the size of the collection.
+
     Args:
         size: the number of samples to return. If a non-positive number is
             provided, an empty view is returned
         seed (None): an optional random seed to use when selecting the samples
     """
 
-    def __init__(self, size, seed=None, _randint=None):
+    def __init__(self, size, seed=None, _randint=None, _pivot=None):
+        if not _randint:
+            rng = _get_rng(seed)
+            _randint = rng.randint(int(1e7), int(1e10))
+            _pivot = rng.random()
+
         self._seed = seed
         self._size = size
-        self._randint = _randint or _get_rng(seed).randint(int(1e7), int(1e10))
+        self._randint = _randint
+        self._pivot = _pivot
 
     @property
     def size(self):
@@ -7350,27 +7368,68 @@ class Take(ViewStage):
         """The random seed to use, or ``None``."""
         return self._seed
 
-    def to_mongo(self, _):
+    def to_mongo(self, sample_collection):
         if self._size <= 0:
             return [{"$match": {"_id": None}}]
 
+        if self._pivot is None:
+            # Stages that were serialized before pivots were introduced
+            return [
+                {
+                    "$addFields": {
+                        "_rand_take": {"$mod": [self._randint, "$_rand"]}
+                    }
+                },
+                {"$sort": {"_rand_take": 1}},
+                {"$limit": self._size},
+                {"$project": {"_rand_take": False}},
+            ]
+
+        pivot = self._get_pivot(sample_collection)
+
+        if _can_scan_rand_index(sample_collection):
+            coll_name = sample_collection._dataset._sample_collection_name
+            return [
+                {"$match": {"_rand": {"$gte": pivot}}},
+                {"$sort": {"_rand": 1}},
+                {"$limit": self._size},
+                {
+                    "$unionWith": {
+                        "coll": coll_name,
+                        "pipeline": [
+                            {"$match": {"_rand": {"$lt": pivot}}},
+                            {"$sort": {"_rand": 1}},
+                            {"$limit": self._size},
+                        ],
+                    }
+                },
+                {"$limit": self._size},
+            ]
+
         # @todo can we avoid creating a new field here?
         return [
-            {
-                "$addFields": {
-                    "_rand_take": {"$mod": [self._randint, "$_rand"]}
-                }
-            },
-            {"$sort": {"_rand_take": 1}},
+            {"$addFields": {"_rand_take": {"$lt": ["$_rand", pivot]}}},
+            {"$sort": {"_rand_take": 1, "_rand": 1}},
             {"$limit": self._size},
             {"$project": {"_rand_take": False}},
         ]
 
+    def _get_pivot(self, sample_collection):
+        # The `_rand` bounds change as samples are added or deleted, so they
+        # are looked up (via the `_rand` index) each time the stage is built
+        bounds = _get_rand_bounds(sample_collection)
+        if bounds is None:
+            return 0.0
+
+        lower, upper = bounds
+        return lower + self._pivot * (upper - lower)
+
     def _kwargs(self):
         return [
             ["size", self._size],
             ["seed", self._seed],
             ["_randint", self._randint],
+            ["_pivot", self._pivot],
         ]
 
     @classmethod
@@ -7384,6 +7443,7 @@ class Take(ViewStage):
                 "placeholder": "seed (default=None)",
             },
             {"name": "_randint", "type": "NoneType|int", "default": "None"},
+            {"name": "_pivot", "type": "NoneType|float", "default": "None"},
         ]
 
 
@@ -7465,14 +7525,14 @@ class ToPatches(ViewStage):
         last_state = deepcopy(self._state)
         if last_state is not None:
             name = last_state.pop("name", None)
+            last_state.pop("synced_at", None)
+            last_state.pop("schema", None)
         else:
             name = None
 
         if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
-            patches_dataset = fop.make_patches_dataset(
-                sample_collection, self._field, **kwargs
-            )
+            synced_at = _get_sync_time()
+            patches_dataset = self._make_dataset(sample_collection)
 
             # Other views may use the same generated dataset, so reuse the old
             # name if possible
@@ -7480,12 +7540,30 @@ class ToPatches(ViewStage):
                 patches_dataset.name = name
 
             state["name"] = patches_dataset.name
+            state["synced_at"] = synced_at.isoformat()
+            state["schema"] = _get_schema_hash(sample_collection)
             self._state = state
         else:
             patches_dataset = fod.load_dataset(name)
 
         return fop.PatchesView(sample_collection, self, patches_dataset)
 
+    def _make_dataset(self, sample_collection):
+        kwargs = self._config or {}
+        return fop.make_patches_dataset(
+            sample_collection, self._field, **kwargs
+        )
+
+    def _sync_dataset(self, sample_collection, dataset):
+        if sample_collection._is_frames:
+            id_field = "_frame_id"
+        else:
+            id_field = "_sample_id"
+
+        return _sync_generated_dataset(
+            self, sample_collection, dataset, "_id", id_field
+        )
+
     def _kwargs(self):
         return [
             ["field", self._field],
@@ -7609,14 +7687,14 @@ class ToEvaluationPatches(ViewStage):
         last_state = deepcopy(self._state)
         if last_state is not None:
             name = last_state.pop("name", None)
+            last_state.pop("synced_at", None)
+            last_state.pop("schema", None)
         else:
             name = None
 
         if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
-            eval_patches_dataset = fop.make_evaluation_patches_dataset(
-                sample_collection, self._eval_key, **kwargs
-            )
+            synced_at = _get_sync_time()
+            eval_patches_dataset = self._make_dataset(sample_collection)
 
             # Other views may use the same generated dataset, so reuse the old
             # name if possible
@@ -7624,6 +7702,8 @@ class ToEvaluationPatches(ViewStage):
                 eval_patches_dataset.name = name
 
             state["name"] = eval_patches_dataset.name
+            state["synced_at"] = synced_at.isoformat()
+            state["schema"] = _get_schema_hash(sample_collection)
             self._state = state
         else:
             eval_patches_dataset = fod.load_dataset(name)
@@ -7632,6 +7712,22 @@ class ToEvaluationPatches(ViewStage):
             sample_collection, self, eval_patches_dataset
         )
 
+    def _make_dataset(self, sample_collection):
+        kwargs = self._config or {}
+        return fop.make_evaluation_patches_dataset(
+            sample_collection, self._eval_key, **kwargs
+        )
+
+    def _sync_dataset(self, sample_collection, dataset):
+        if sample_collection._is_frames:
+            id_field = "_frame_id"
+        else:
+            id_field = "_sample_id"
+
+        return _sync_generated_dataset(
+            self, sample_collection, dataset, "_id", id_field
+        )
+
     def _kwargs(self):
         return [
             ["eval_key", self._eval_key],
@@ -7766,14 +7862,14 @@ class ToClips(ViewStage):
         last_state = deepcopy(self._state)
         if last_state is not None:
             name = last_state.pop("name", None)
+            last_state.pop("synced_at", None)
+            last_state.pop("schema", None)
         else:
             name = None
 
         if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
-            clips_dataset = focl.make_clips_dataset(
-                sample_collection, self._field_or_expr, **kwargs
-            )
+            synced_at = _get_sync_time()
+            clips_dataset = self._make_dataset(sample_collection)
 
             # Other views may use the same generated dataset, so reuse the old
             # name if possible
@@ -7781,12 +7877,29 @@ class ToClips(ViewStage):
                 clips_dataset.name = name
 
             state["name"] = clips_dataset.name
+            state["synced_at"] = synced_at.isoformat()
+            state["schema"] = _get_schema_hash(sample_collection)
             self._state = state
         else:
             clips_dataset = fod.load_dataset(name)
 
         return focl.ClipsView(sample_collection, self, clips_dataset)
 
+    def _make_dataset(self, sample_collection):
+        kwargs = self._config or {}
+        return focl.make_clips_dataset(
+            sample_collection, self._field_or_expr, **kwargs
+        )
+
+    def _sync_dataset(self, sample_collection, dataset):
+        return _sync_generated_dataset(
+            self,
+            sample_collection,
+            dataset,
+            _get_video_id_field(sample_collection),
+            "_sample_id",
+        )
+
     def _get_mongo_field_or_expr(self):
         if isinstance(self._field_or_expr, foe.ViewExpression):
             return self._field_or_expr.to_mongo()
@@ -7900,22 +8013,39 @@ class ToTrajectories(ViewStage):
         last_state = deepcopy(self._state)
         if last_state is not None:
             name = last_state.pop("name", None)
+            last_state.pop("synced_at", None)
+            last_state.pop("schema", None)
         else:
             name = None
 
         if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
-            clips_dataset = focl.make_clips_dataset(
-                sample_collection, self._field, trajectories=True, **kwargs
-            )
+            synced_at = _get_sync_time()
+            clips_dataset = self._make_dataset(sample_collection)
 
             state["name"] = clips_dataset.name
+            state["synced_at"] = synced_at.isoformat()
+            state["schema"] = _get_schema_hash(sample_collection)
             self._state = state
         else:
             clips_dataset = fod.load_dataset(name)
 
         return focl.TrajectoriesView(sample_collection, self, clips_dataset)
 
+    def _make_dataset(self, sample_collection):
+        kwargs = self._config or {}
+        return focl.make_clips_dataset(
+            sample_collection, self._field, trajectories=True, **kwargs
+        )
+
+    def _sync_dataset(self, sample_collection, dataset):
+        return _sync_generated_dataset(
+            self,
+            sample_collection,
+            dataset,
+            _get_video_id_field(sample_collection),
+            "_sample_id",
+        )
+
     def _kwargs(self):
         return [
             ["field", self._field],
@@ -8084,14 +8214,14 @@ class ToFrames(ViewStage):
         last_state = deepcopy(self._state)
         if last_state is not None:
             name = last_state.pop("name", None)
+            last_state.pop("synced_at", None)
+            last_state.pop("schema", None)
         else:
             name = None
 
         if state != last_state or not fod.dataset_exists(name):
-            kwargs = self._config or {}
-            frames_dataset = fovi.make_frames_dataset(
-                sample_collection, **kwargs
-            )
+            synced_at = _get_sync_time()
+            frames_dataset = self._make_dataset(sample_collection)
 
             # Other views may use the same generated dataset, so reuse the old
             # name if possible
@@ -8099,12 +8229,27 @@ class ToFrames(ViewStage):
                 frames_dataset.name = name
 
             state["name"] = frames_dataset.name
+            state["synced_at"] = synced_at.isoformat()
+            state["schema"] = _get_schema_hash(sample_collection)
             self._state = state
         else:
             frames_dataset = fod.load_dataset(name)
 
         return fovi.FramesView(sample_collection, self, frames_dataset)
 
+    def _make_dataset(self, sample_collection):
+        kwargs = self._config or {}
+        return fovi.make_frames_dataset(sample_collection, **kwargs)
+
+    def _sync_dataset(self, sample_collection, dataset):
+        return _sync_generated_dataset(
+            self,
+            sample_collection,
+            dataset,
+            _get_video_id_field(sample_collection),
+            "_sample_id",
+        )
+
     def _kwargs(self):
         return [
             ["config", self._config],
@@ -8215,6 +8360,189 @@ def _get_rng(seed):
     return _random
 
 
+def _get_rand_bounds(sample_collection):
+    # Returns the range of `_rand` values in the collection, which depends on
+    # how its samples were generated
+    coll = sample_collection._dataset._sample_collection
+    query = {"_rand": {"$ne": None}}
+    projection = {"_rand": True}
+
+    first = coll.find_one(query, projection, sort=[("_rand", 1)])
+    if first is None:
+        return None
+
+    last = coll.find_one(query, projection, sort=[("_rand", -1)])
+    return first["_rand"], last["_rand"]
+
+
+def _can_scan_rand_index(sample_collection):
+    # Indexed range scans on `_rand` are only possible when a stage is the
+    # first operation applied to the underlying sample collection
+    if not isinstance(sample_collection, fod.Dataset):
+        if sample_collection._stages:
+            return False
+
+    dataset = sample_collection._dataset
+    return dataset.media_type != fom.GROUP and not dataset._contains_videos(
+        any_slice=True
+    )
+
+
+def _get_video_id_field(sample_collection):
+    # Clips store the ID of their source video in `_sample_id`
+    if sample_collection._is_clips:
+        return "_sample_id"
+
+    return "_id"
+
+
+# Stages whose output can change when samples that they do not output are
+# modified or deleted
+_POSITIONAL_STAGES = (Concat, Limit, Mongo, Skip, SortBySimilarity, Take)
+
+
+def _get_sync_time():
+    # MongoDB stores datetimes with millisecond precision, so we truncate to
+    # ensure that writes in the same millisecond as the sync are detected
+    now = datetime.utcnow()
+    return now.replace(microsecond=1000 * (now.microsecond // 1000))
+
+
+def _sync_generated_dataset(
+    stage, sample_collection, dataset, src_id_field, id_field
+):
+    # Incrementally syncs the `dataset` generated by `stage` with the samples
+    # in `sample_collection` that have been added, modified, or deleted since
+    # the last sync. Each generated sample stores the `src_id_field` of the
+    # source sample from which it was derived in its `id_field`
+    #
+    # Returns False if the dataset must be regenerated from scratch instead
+    state = stage._state
+    if not state or state.get("name", None) != dataset.name:
+        return False
+
+    last_synced_at = state.get("synced_at", None)
+    if last_synced_at is None:
+        return False
+
+    # Unmodified samples may enter positional views when other samples are
+    # modified or deleted, so these views are always regenerated
+    if isinstance(sample_collection, fov.DatasetView) and any(
+        isinstance(s, _POSITIONAL_STAGES) for s in sample_collection._stages
+    ):
+        return False
+
+    synced_at = _get_sync_time()
+    query = {
+        "_last_modified_at": {"$gte": datetime.fromisoformat(last_synced_at)}
+    }
+
+    src_ids = set(sample_collection.distinct(src_id_field))
+    ids = set(sample_collection.match(query).distinct(src_id_field))
+
+    if sample_collection._contains_videos():
+        frame_coll = sample_collection._dataset._frame_collection
+        ids.update(
+            src_ids.intersection(frame_coll.distinct("_sample_id", query))
+        )
+
+    # Regenerating most of the dataset is cheaper to do from scratch
+    if len(ids) > 0.5 * len(src_ids):
+        return False
+
+    gen_ids = set(dataset.distinct(id_field))
+    del_ids = (gen_ids - src_ids) | (gen_ids & ids)
+
+    # When no samples were modified and the source schema is unchanged, there
+    # is nothing to generate
+    schema = _get_schema_hash(sample_collection)
+    if not ids and schema == state.get("schema", None):
+        _delete_generated_samples(dataset, id_field, del_ids)
+        state["synced_at"] = synced_at.isoformat()
+        return True
+
+    # Generate a (possibly empty) dataset so that schema changes to the
+    # source collection are detected
+    src_view = sample_collection.match({src_id_field: {"$in": list(ids)}})
+    tmp_dataset = stage._make_dataset(src_view)
+
+    try:
+        schema = dataset.get_field_schema(include_private=True, flat=True)
+        tmp_schema = tmp_dataset.get_field_schema(
+            include_private=True, flat=True
+        )
+        if any(path not in schema for path in tmp_schema.keys()):
+            return False
+
+        _delete_generated_samples(
+            dataset, id_field, del_ids, keep_ids=tmp_dataset.values("_id")
+        )
+
+        # Merged samples are stamped with the time of the sync so that
+        # incremental syncs of views generated from this dataset see them
+        foo.aggregate(
+            tmp_dataset._sample_collection,
+            [
+                {
+                    "$addFields": {
+                        "_dataset_id": dataset._doc.id,
+                        "_last_modified_at": "$$NOW",
+                    }
+                },
+                {
+                    "$merge": {
+                        "into": dataset._sample_collection_name,
+                        "on": "_id",
+                        "whenMatched": "replace",
+                        "whenNotMatched": "insert",
+                    }
+                },
+            ],
+        )
+    finally:
+        tmp_dataset.delete()
+
+    state["synced_at"] = synced_at.isoformat()
+    state["schema"] = schema
+
+    return True
+
+
+def _get_schema_hash(sample_collection):
+    paths = list(
+        sample_collection.get_field_schema(include_private=True, flat=True)
+    )
+    if sample_collection._has_frame_fields():
+        paths.extend(
+            sample_collection._FRAMES_PREFIX + path
+            for path in sample_collection.get_frame_field_schema(
+                include_private=True, flat=True
+            )
+        )
+
+    return hashlib.md5(",".join(sorted(paths)).encode()).hexdigest()
+
+
+def _delete_generated_samples(dataset, id_field, del_ids, keep_ids=None):
+    if not del_ids:
+        return
+
+    docs = dataset._sample_collection.find(
+        {id_field: {"$in": list(del_ids)}}, {"_id": True}
+    )
+    stale_ids = set(d["_id"] for d in docs)
+    if keep_ids:
+        stale_ids.difference_update(keep_ids)
+
+    if stale_ids:
+        dataset._sample_collection.delete_many(
+            {"_id": {"$in": list(stale_ids)}}
+        )
+        fos.Sample._reset_docs(
+            dataset._sample_collection_name, sample_ids=stale_ids
+        )
+
+
 def _parse_labels_field(sample_collection, field_path):
     path, is_list_field = sample_collection._get_label_field_root(field_path)
     is_frame_field = sample_collection._is_frame_field(field_path)
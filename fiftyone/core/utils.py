@@ -24,12 +24,14 @@ import multiprocessing
 import numbers
 import os
 import platform
+import queue
 import re
 import signal
 import string
 import struct
 import subprocess
 import sys
+import threading
 import timeit
 import types
 from xml.parsers.expat import ExpatError
@@ -1939,20 +1941,45 @@ def compute_filehash(filepath, method=None, chunk_size=None):
     return hasher.hexdigest()
 
 
-def serialize_numpy_array(array, ascii=False):
+def serialize_numpy_array(array, ascii=False, codec=None):
     """Serializes a numpy array.
 
+    By default, arrays are serialized via ``numpy.save`` and then
+    zlib-compressed. Alternatively, a ``codec`` may be specified, in which
+    case the array's data is stored as little-endian bytes encoded by the
+    codec behind a small dtype/shape header. The supported codecs are:
+
+    -   ``"raw"``: uncompressed bytes, which are the fastest to encode and
+        decode and allow batches of same-shaped arrays to be decoded in bulk
+        via :func:`deserialize_numpy_arrays`
+    -   ``"zlib"``, ``"lz4"``, ``"zstd"``: bytes compressed via the
+        corresponding algorithm. The ``lz4`` and ``zstandard`` packages are
+        required for the latter two
+    -   ``"compress"``: bytes compressed via the fastest of the above
+        compressors that is installed
+    -   ``"rle"``: zlib-compressed run-length encoded values, which are
+        well-suited to segmentation masks. If run-length encoding would not
+        reduce the size of the array, ``"compress"`` is used instead
+    -   ``"auto"``: ``"raw"`` for floating point arrays, which rarely
+        compress well, and ``"rle"`` otherwise
+
+    All formats are supported by :func:`deserialize_numpy_array`.
+
     Args:
         array: a numpy array-like
         ascii (False): whether to return a base64-encoded ASCII string instead
             of raw bytes
+        codec (None): an optional codec to use
 
     Returns:
         the serialized bytes
     """
-    with io.BytesIO() as f:
-        np.save(f, np.asarray(array), allow_pickle=False)
-        bytes_str = zlib.compress(f.getvalue())
+    if codec is not None:
+        bytes_str = _encode_numpy_array(np.asarray(array), codec)
+    else:
+        with io.BytesIO() as f:
+            np.save(f, np.asarray(array), allow_pickle=False)
+            bytes_str = zlib.compress(f.getvalue())
 
     if ascii:
         bytes_str = b64encode(bytes_str).decode("ascii")
@@ -1975,10 +2002,232 @@ def deserialize_numpy_array(numpy_bytes, ascii=False):
     if ascii:
         numpy_bytes = b64decode(numpy_bytes.encode("ascii"))
 
+    if numpy_bytes[: len(_ARRAY_MAGIC)] == _ARRAY_MAGIC:
+        return _decode_numpy_array(numpy_bytes)
+
     with io.BytesIO(zlib.decompress(numpy_bytes)) as f:
         return np.load(f)
 
 
+def deserialize_numpy_arrays(numpy_bytes_list):
+    """Loads a list of serialized numpy arrays generated by
+    :func:`serialize_numpy_array` into a single stacked array.
+
+    When all arrays were serialized with the ``"raw"`` codec and share a
+    common dtype and shape, they are decoded in a single pass with no
+    per-array decoding.
+
+    Args:
+        numpy_bytes_list: a list of serialized numpy array bytes
+
+    Returns:
+        a numpy array whose first dimension is ``len(numpy_bytes_list)``
+    """
+    if not numpy_bytes_list:
+        return np.empty((0,))
+
+    first = numpy_bytes_list[0]
+    if first[: len(_ARRAY_MAGIC)] == _ARRAY_MAGIC:
+        codec, dtype, shape, header_len = _parse_array_header(first)
+        header = first[:header_len]
+        num_bytes = len(first)
+        if codec == "raw" and all(
+            len(b) == num_bytes and b[:header_len] == header
+            for b in numpy_bytes_list
+        ):
+            row_dtype = np.dtype(
+                [("header", "V%d" % header_len), ("array", dtype, shape)]
+            )
+            rows = np.frombuffer(b"".join(numpy_bytes_list), dtype=row_dtype)
+            return rows["array"].astype(dtype.newbyteorder("="))
+
+    return np.stack([deserialize_numpy_array(b) for b in numpy_bytes_list])
+
+
+# Header: magic, version, codec ID, dtype length, ndim, dtype, shape. Version
+# 1 headers have no codec ID, since their data is always stored raw
+_ARRAY_MAGIC = b"\x93FOARR"
+_ARRAY_VERSION = 2
+_ARRAY_CODECS = ("raw", "zlib", "lz4", "zstd", "rle")
+
+
+def _encode_numpy_array(array, codec):
+    if array.dtype.hasobject:
+        raise ValueError("Cannot serialize object arrays")
+
+    if codec == "auto":
+        codec = "raw" if array.dtype.kind in ("f", "c") else "rle"
+
+    if codec == "compress":
+        codec = _get_compression_codec()
+
+    if codec not in _ARRAY_CODECS:
+        raise ValueError(
+            "Unsupported codec '%s'. Supported values are %s"
+            % (codec, ("auto", "compress") + _ARRAY_CODECS)
+        )
+
+    dtype = array.dtype.newbyteorder("<")
+    data = np.ascontiguousarray(array, dtype=dtype)
+
+    if codec == "rle":
+        payload = _rle_encode(data.ravel())
+        if payload is None:
+            return _encode_numpy_array(array, "compress")
+
+        payload = zlib.compress(payload, 1)
+    elif codec == "raw":
+        payload = data.tobytes()
+    else:
+        payload = _compress_bytes(data.tobytes(), codec)
+
+    descr = dtype.str.encode("ascii")
+    header = (
+        _ARRAY_MAGIC
+        + struct.pack(
+            "<BBBB",
+            _ARRAY_VERSION,
+            _ARRAY_CODECS.index(codec),
+            len(descr),
+            array.ndim,
+        )
+        + descr
+        + struct.pack("<%dQ" % array.ndim, *array.shape)
+    )
+
+    return header + payload
+
+
+def _decode_numpy_array(numpy_bytes):
+    codec, dtype, shape, header_len = _parse_array_header(numpy_bytes)
+
+    if codec == "raw":
+        array = np.frombuffer(numpy_bytes, dtype=dtype, offset=header_len)
+    elif codec == "rle":
+        payload = zlib.decompress(numpy_bytes[header_len:])
+        array = _rle_decode(payload, dtype)
+    else:
+        data = _decompress_bytes(bytes(numpy_bytes[header_len:]), codec)
+        array = np.frombuffer(data, dtype=dtype)
+
+    return array.reshape(shape).astype(dtype.newbyteorder("="))
+
+
+def _parse_array_header(numpy_bytes):
+    offset = len(_ARRAY_MAGIC)
+    version = numpy_bytes[offset]
+    if version == 1:
+        codec_id = 0
+        descr_len, ndim = struct.unpack_from("<BB", numpy_bytes, offset + 1)
+        offset += 3
+    elif version == _ARRAY_VERSION:
+        codec_id, descr_len, ndim = struct.unpack_from(
+            "<BBB", numpy_bytes, offset + 1
+        )
+        offset += 4
+    else:
+        codec_id = None
+
+    if codec_id is None or codec_id >= len(_ARRAY_CODECS):
+        raise ValueError(
+            "Unsupported serialized array version %d; you may need to "
+            "upgrade FiftyOne" % version
+        )
+
+    dtype = np.dtype(bytes(numpy_bytes[offset : offset + descr_len]).decode())
+    offset += descr_len
+    shape = struct.unpack_from("<%dQ" % ndim, numpy_bytes, offset)
+    offset += 8 * ndim
+
+    return _ARRAY_CODECS[codec_id], dtype, shape, offset
+
+
+def _get_compression_codec():
+    global _COMPRESSION_CODEC
+
+    if _COMPRESSION_CODEC is None:
+        _COMPRESSION_CODEC = "zlib"
+        for codec, module_name in (
+            ("lz4", "lz4.frame"),
+            ("zstd", "zstandard"),
+        ):
+            try:
+                importlib.import_module(module_name)
+                _COMPRESSION_CODEC = codec
+                break
+            except ImportError:
+                pass
+
+    return _COMPRESSION_CODEC
+
+
+_COMPRESSION_CODEC = None
+
+
+def _compress_bytes(data, codec):
+    if codec == "lz4":
+        return _lz4_frame.compress(data)
+
+    if codec == "zstd":
+        return _zstd.ZstdCompressor().compress(data)
+
+    return zlib.compress(data, 1)
+
+
+def _decompress_bytes(data, codec):
+    if codec == "lz4":
+        return _lz4_frame.decompress(data)
+
+    if codec == "zstd":
+        return _zstd.ZstdDecompressor().decompress(data)
+
+    return zlib.decompress(data)
+
+
+_lz4_frame = lazy_import("lz4.frame", callback=lambda: ensure_import("lz4"))
+_zstd = lazy_import("zstandard", callback=lambda: ensure_import("zstandard"))
+
+
+def _rle_encode(flat):
+    # Payload: number of runs, run values, then uint32 run lengths
+    num = flat.size
+    if num == 0 or num > np.iinfo(np.uint32).max:
+        return None
+
+    if flat.dtype.kind == "f":
+        # Compare bit patterns so that NaNs form runs
+        _flat = flat.view("<u%d" % flat.dtype.itemsize)
+    else:
+        _flat = flat
+
+    starts = np.flatnonzero(_flat[1:] != _flat[:-1]) + 1
+    starts = np.concatenate(([0], starts))
+    num_runs = len(starts)
+
+    if num_runs * (flat.dtype.itemsize + 4) + 8 >= flat.nbytes:
+        return None
+
+    lengths = np.diff(np.append(starts, num)).astype("<u4")
+
+    return (
+        struct.pack("<Q", num_runs)
+        + flat[starts].tobytes()
+        + lengths.tobytes()
+    )
+
+
+def _rle_decode(payload, dtype):
+    (num_runs,) = struct.unpack_from("<Q", payload)
+    offset = 8
+    values = np.frombuffer(payload, dtype=dtype, count=num_runs, offset=offset)
+    offset += num_runs * dtype.itemsize
+    lengths = np.frombuffer(
+        payload, dtype="<u4", count=num_runs, offset=offset
+    )
+
+    return np.repeat(values, lengths)
+
+
 def iter_batches(iterable, batch_size):
     """Iterates over the given iterable in batches.
 
@@ -2036,6 +2285,254 @@ def iter_slices(sliceable, batch_size):
         yield chunk
 
 
+def iter_prefetched(iterable, size):
+    """Iterates over the given iterable, consuming it in a background thread
+    that stays up to ``size`` elements ahead of the caller.
+
+    Any exceptions raised by the iterable are raised by the returned
+    generator, and the background thread is stopped when the generator is
+    closed.
+
+    Args:
+        iterable: an iterable
+        size: the maximum number of elements to buffer
+
+    Returns:
+        a generator that emits the elements of the input
+    """
+    buffer = queue.Queue(maxsize=max(size, 1))
+    stop = threading.Event()
+    done = object()
+
+    def _put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _produce():
+        it = iter(iterable)
+        try:
+            for element in it:
+                if not _put((element, None)):
+                    break
+            else:
+                _put((done, None))
+        except BaseException as e:
+            _put((done, e))
+        finally:
+            # Iterables that own resources such as cursors must be closed by
+            # the thread that is consuming them
+            if hasattr(it, "close"):
+                it.close()
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            element, error = buffer.get()
+            if element is done:
+                if error is not None:
+                    raise error
+
+                return
+
+            yield element
+    finally:
+        stop.set()
+        thread.join()
+
+
+class KLLSketch(object):
+    """A mergeable sketch that summarizes the distribution of a stream of
+    numeric values in bounded memory.
+
+    This class implements the KLL sketch from
+    `Karnin, Lang, and Liberty (2016) <https://arxiv.org/abs/1603.05346>`_.
+    The sketch stores ``O(k)`` values regardless of the number of values it
+    has summarized, and its quantile and rank estimates have a normalized
+    rank error of about ``1.65 / k`` with high probability, e.g., about 1%
+    for ``k = 200``. The minimum, maximum, and count of the values are
+    tracked exactly.
+
+    Sketches of different streams can be combined via :meth:`merge`, which
+    allows partial sketches, e.g., of different chunks or shards of data, to
+    be computed independently.
+
+    Args:
+        k (200): the accuracy parameter of the sketch. Larger values use more
+            memory but provide more accurate estimates
+        seed (None): an optional random seed
+    """
+
+    _C = 2.0 / 3.0
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8; found %s" % k)
+
+        self.k = int(k)
+        self.n = 0
+        self.min = None
+        self.max = None
+
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+        self._sorted = None
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def num_retained(self):
+        """The number of values currently stored by the sketch."""
+        return sum(len(level) for level in self._levels)
+
+    def update(self, values):
+        """Adds the given values to the sketch.
+
+        Args:
+            values: a numeric value or array-like of numeric values
+
+        Returns:
+            the sketch
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return self
+
+        self._update_bounds(values.min(), values.max(), values.size)
+        self._levels[0] = np.concatenate((self._levels[0], values))
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Merges the given sketch into this sketch.
+
+        Args:
+            other: a :class:`KLLSketch`
+
+        Returns:
+            the sketch
+        """
+        if other.n == 0:
+            return self
+
+        self._update_bounds(other.min, other.max, other.n)
+
+        for _ in range(len(self._levels), len(other._levels)):
+            self._levels.append(np.empty(0))
+
+        for idx, level in enumerate(other._levels):
+            self._levels[idx] = np.concatenate((self._levels[idx], level))
+
+        self._compress()
+        return self
+
+    def quantiles(self, quantiles):
+        """Estimates the given quantiles of the values in the sketch.
+
+        Args:
+            quantiles: an array-like of quantiles in ``[0, 1]``
+
+        Returns:
+            a numpy array of quantile values, or an array of nans if the
+            sketch is empty
+        """
+        quantiles = np.asarray(quantiles, dtype=float)
+        if self.n == 0:
+            return np.full(quantiles.shape, np.nan)
+
+        values, cum_weights = self._get_sorted()
+        targets = quantiles * cum_weights[-1]
+        inds = np.searchsorted(cum_weights, targets, side="left")
+        results = values[np.clip(inds, 0, len(values) - 1)]
+
+        # Extreme quantiles are known exactly
+        results = np.where(quantiles <= 0, self.min, results)
+        results = np.where(quantiles >= 1, self.max, results)
+
+        return results
+
+    def ranks(self, values):
+        """Estimates the number of values in the sketch that are strictly
+        less than each of the given values.
+
+        Args:
+            values: an array-like of values
+
+        Returns:
+            a numpy array of ranks in ``[0, n]``
+        """
+        values = np.asarray(values, dtype=float)
+        if self.n == 0:
+            return np.zeros(values.shape)
+
+        _values, cum_weights = self._get_sorted()
+        inds = np.searchsorted(_values, values, side="left")
+        cum_weights = np.concatenate(([0], cum_weights))
+        ranks = cum_weights[inds] * (self.n / cum_weights[-1])
+
+        # Ranks outside of the bounds are known exactly
+        ranks = np.where(values <= self.min, 0, ranks)
+        ranks = np.where(values > self.max, self.n, ranks)
+
+        return ranks
+
+    def _update_bounds(self, vmin, vmax, n):
+        self.n += int(n)
+        self.min = vmin if self.min is None else min(self.min, vmin)
+        self.max = vmax if self.max is None else max(self.max, vmax)
+        self._sorted = None
+
+    def _capacity(self, level):
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self.k * self._C**depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if len(values) > self._capacity(level):
+                values = np.sort(values)
+                if len(values) % 2:
+                    keep, values = values[-1:], values[:-1]
+                else:
+                    keep = values[:0]
+
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+
+                offset = self._rng.integers(2)
+                self._levels[level + 1] = np.concatenate(
+                    (self._levels[level + 1], values[offset::2])
+                )
+                self._levels[level] = keep
+
+            level += 1
+
+        self._sorted = None
+
+    def _get_sorted(self):
+        if self._sorted is None:
+            values = np.concatenate(self._levels)
+            weights = np.concatenate(
+                [
+                    np.full(len(level), 2.0**idx)
+                    for idx, level in enumerate(self._levels)
+                ]
+            )
+            inds = np.argsort(values, kind="stable")
+            self._sorted = (values[inds], np.cumsum(weights[inds]))
+
+        return self._sorted
+
+
 def call_on_exit(callback):
     """Registers the given callback function so that it will be called when the
     process exits for (almost) any reason
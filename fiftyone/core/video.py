@@ -287,14 +287,19 @@ class FramesView(fov.DatasetView):
         self._source_collection.reload()
 
         #
-        # Regenerate the frames dataset
+        # Sync the frames dataset with any changes to the source collection
+        # since it was last generated, or regenerate it from scratch if an
+        # incremental sync is not possible
         #
-        # This assumes that calling `load_view()` when the current patches
+        # This assumes that calling `load_view()` when the current frames
         # dataset has been deleted will cause a new one to be generated
         #
-        self._frames_dataset.delete()
-        _view = self._frames_stage.load_view(self._source_collection)
-        self._frames_dataset = _view._frames_dataset
+        if not self._frames_stage._sync_dataset(
+            self._source_collection, self._frames_dataset
+        ):
+            self._frames_dataset.delete()
+            _view = self._frames_stage.load_view(self._source_collection)
+            self._frames_dataset = _view._frames_dataset
 
         super().reload()
 
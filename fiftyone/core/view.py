@@ -437,6 +437,8 @@ class DatasetView(foc.SampleCollection):
         autosave=False,
         batch_size=None,
         batching_strategy=None,
+        prefetch=None,
+        read_only=False,
     ):
         """Returns an iterator over the samples in the view.
 
@@ -498,12 +500,29 @@ class DatasetView(foc.SampleCollection):
                 -   ``"latency"``: a target latency, in seconds, between saves
 
                 By default, ``fo.config.default_batcher`` is used
+            prefetch (None): an optional number of samples to load in a
+                background thread ahead of the caller, which allows database
+                reads and sample construction to overlap with the caller's
+                work. By default, samples are loaded on demand
+            read_only (False): whether to emit read-only
+                :class:`fiftyone.core.sample.SampleRecord` instances, which
+                are backed directly by the samples' database dicts and only
+                deserialize fields when they are accessed, rather than
+                :class:`fiftyone.core.sample.SampleView` instances. Cannot be
+                combined with ``autosave``
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.SampleView` instances
         """
+        if read_only and autosave:
+            raise ValueError("Cannot autosave read-only samples")
+
         with contextlib.ExitStack() as exit_context:
-            samples = self._iter_samples()
+            samples = self._iter_samples(read_only=read_only)
+
+            if prefetch:
+                samples = fou.iter_prefetched(samples, prefetch)
+                exit_context.enter_context(contextlib.closing(samples))
 
             pb = fou.ProgressBar(total=self, progress=progress)
             exit_context.enter_context(pb)
@@ -523,8 +542,12 @@ class DatasetView(foc.SampleCollection):
                 if autosave:
                     save_context.save(sample)
 
-    def _iter_samples(self):
-        make_sample = self._make_sample_fcn()
+    def _iter_samples(self, read_only=False):
+        if read_only:
+            make_sample = self._make_record_fcn()
+        else:
+            make_sample = self._make_sample_fcn()
+
         index = 0
 
         try:
@@ -537,7 +560,7 @@ class DatasetView(foc.SampleCollection):
             # The cursor has timed out so we yield from a new one after
             # skipping to the last offset
             view = self.skip(index)
-            for sample in view._iter_samples():
+            for sample in view._iter_samples(read_only=read_only):
                 yield sample
 
     def _make_sample_fcn(self):
@@ -572,6 +595,7 @@ class DatasetView(foc.SampleCollection):
         autosave=False,
         batch_size=None,
         batching_strategy=None,
+        prefetch=None,
     ):
         """Returns an iterator over the groups in the view.
 
@@ -638,6 +662,10 @@ class DatasetView(foc.SampleCollection):
                 -   ``"latency"``: a target latency, in seconds, between saves
 
                 By default, ``fo.config.default_batcher`` is used
+            prefetch (None): an optional number of groups to load in a
+                background thread ahead of the caller, which allows database
+                reads and sample construction to overlap with the caller's
+                work. By default, groups are loaded on demand
 
         Returns:
             an iterator that emits dicts mapping slice names to
@@ -654,6 +682,10 @@ class DatasetView(foc.SampleCollection):
         with contextlib.ExitStack() as exit_context:
             groups = self._iter_groups(group_slices=group_slices)
 
+            if prefetch:
+                groups = fou.iter_prefetched(groups, prefetch)
+                exit_context.enter_context(contextlib.closing(groups))
+
             pb = fou.ProgressBar(total=self, progress=progress)
             exit_context.enter_context(pb)
             groups = pb(groups)
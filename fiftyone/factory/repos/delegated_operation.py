@@ -6,8 +6,8 @@ FiftyOne delegated operation repository.
 |
 """
 import logging
-from datetime import datetime
-from typing import Any, List
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
 
 import pymongo
 from bson import ObjectId
@@ -43,8 +43,13 @@ class DelegatedOperationRepo(object):
         result: ExecutionResult = None,
         run_link: str = None,
         progress: ExecutionProgress = None,
+        claim_token: str = None,
     ) -> DelegatedOperationDocument:
-        """Update the run state of an operation."""
+        """Update the run state of an operation.
+
+        If a ``claim_token`` is provided, the operation is only updated if it
+        is still running under that claim, and None is returned otherwise.
+        """
         raise NotImplementedError("subclass must implement update_run_state()")
 
     def update_progress(
@@ -55,6 +60,36 @@ class DelegatedOperationRepo(object):
         """Update the progress of an operation."""
         raise NotImplementedError("subclass must implement update_progress()")
 
+    def claim_operation(
+        self,
+        operator: str = None,
+        dataset_name: str = None,
+        delegation_target: str = None,
+        max_running_per_dataset: int = None,
+        **kwargs: Any,
+    ) -> DelegatedOperationDocument:
+        """Atomically transition the oldest matching queued operation to
+        running state and return it, or None if no operation can be claimed.
+
+        The returned operation's ``claim_token`` identifies this claim.
+        """
+        raise NotImplementedError("subclass must implement claim_operation()")
+
+    def heartbeat(self, claims: Dict[ObjectId, str]) -> List[ObjectId]:
+        """Record a heartbeat for the given running operations, which are
+        specified as a dict mapping operation IDs to claim tokens, and return
+        the IDs of the operations that are no longer held by those claims.
+        """
+        raise NotImplementedError("subclass must implement heartbeat()")
+
+    def requeue_expired_operations(self, lease_duration: float) -> int:
+        """Requeue running operations whose last heartbeat is older than
+        ``lease_duration`` seconds.
+        """
+        raise NotImplementedError(
+            "subclass must implement requeue_expired_operations()"
+        )
+
     def get_queued_operations(
         self, operator: str = None, dataset_name=None
     ) -> List[DelegatedOperationDocument]:
@@ -147,6 +182,16 @@ class MongoDelegatedOperationRepo(DelegatedOperationRepo):
                     [("run_state", pymongo.ASCENDING)], name="run_state_1"
                 )
             )
+        if "run_state_1_queued_at_1" not in index_names:
+            indices_to_create.append(
+                IndexModel(
+                    [
+                        ("run_state", pymongo.ASCENDING),
+                        ("queued_at", pymongo.ASCENDING),
+                    ],
+                    name="run_state_1_queued_at_1",
+                )
+            )
 
         if indices_to_create:
             self._collection.create_indexes(indices_to_create)
@@ -221,6 +266,7 @@ class MongoDelegatedOperationRepo(DelegatedOperationRepo):
         result: ExecutionResult = None,
         run_link: str = None,
         progress: ExecutionProgress = None,
+        claim_token: str = None,
     ) -> DelegatedOperationDocument:
         update = None
 
@@ -269,12 +315,20 @@ class MongoDelegatedOperationRepo(DelegatedOperationRepo):
             update["$set"]["status"] = progress
             update["$set"]["status"]["updated_at"] = datetime.utcnow()
 
+        query = {"_id": _id}
+        if claim_token is not None:
+            query["run_state"] = ExecutionRunState.RUNNING
+            query["claim_token"] = claim_token
+
         doc = self._collection.find_one_and_update(
-            filter={"_id": _id},
+            filter=query,
             update=update,
             return_document=pymongo.ReturnDocument.AFTER,
         )
 
+        if doc is None and claim_token is not None:
+            return None
+
         return DelegatedOperationDocument().from_pymongo(doc)
 
     def update_progress(
@@ -313,6 +367,121 @@ class MongoDelegatedOperationRepo(DelegatedOperationRepo):
 
         return DelegatedOperationDocument().from_pymongo(doc)
 
+    def claim_operation(
+        self,
+        operator: str = None,
+        dataset_name: str = None,
+        delegation_target: str = None,
+        max_running_per_dataset: int = None,
+        **kwargs: Any,
+    ) -> DelegatedOperationDocument:
+        query = {"run_state": ExecutionRunState.QUEUED}
+        if operator:
+            query["operator"] = operator
+        if dataset_name:
+            query["context.request_params.dataset_name"] = dataset_name
+        if delegation_target:
+            query["delegation_target"] = delegation_target
+
+        for arg in kwargs:
+            query[arg] = kwargs[arg]
+
+        if max_running_per_dataset:
+            # Datasets that are at capacity are excluded when claiming. Note
+            # that orchestrators claiming concurrently may briefly exceed the
+            # limit
+            busy_ids = [
+                d["_id"]
+                for d in self._collection.aggregate(
+                    [
+                        {
+                            "$match": {
+                                "run_state": ExecutionRunState.RUNNING,
+                                "dataset_id": {"$ne": None},
+                            }
+                        },
+                        {
+                            "$group": {
+                                "_id": "$dataset_id",
+                                "count": {"$sum": 1},
+                            }
+                        },
+                        {
+                            "$match": {
+                                "count": {"$gte": max_running_per_dataset}
+                            }
+                        },
+                    ]
+                )
+            ]
+            if busy_ids:
+                query["$and"] = [{"dataset_id": {"$nin": busy_ids}}]
+
+        now = datetime.utcnow()
+        doc = self._collection.find_one_and_update(
+            filter=query,
+            update={
+                "$set": {
+                    "run_state": ExecutionRunState.RUNNING,
+                    "started_at": now,
+                    "updated_at": now,
+                    "heartbeat_at": now,
+                    "claim_token": str(ObjectId()),
+                }
+            },
+            sort=[("queued_at", pymongo.ASCENDING)],
+            return_document=pymongo.ReturnDocument.AFTER,
+        )
+
+        if doc is None:
+            return None
+
+        return DelegatedOperationDocument().from_pymongo(doc)
+
+    def heartbeat(self, claims: Dict[ObjectId, str]) -> List[ObjectId]:
+        if not claims:
+            return []
+
+        # Requeuing an operation clears its claim token and claiming it again
+        # generates a new one, so a claim is held while its token matches
+        query = {
+            "$or": [
+                {"_id": _id, "claim_token": claim_token}
+                for _id, claim_token in claims.items()
+            ]
+        }
+        self._collection.update_many(
+            {"run_state": ExecutionRunState.RUNNING, **query},
+            {"$set": {"heartbeat_at": datetime.utcnow()}},
+        )
+
+        held_ids = {d["_id"] for d in self._collection.find(query, {"_id": 1})}
+        return [_id for _id in claims if _id not in held_ids]
+
+    def requeue_expired_operations(self, lease_duration: float) -> int:
+        # Only operations that were claimed via claim_operation() have
+        # heartbeats, so operations that were run by other means are never
+        # requeued
+        now = datetime.utcnow()
+        res = self._collection.update_many(
+            {
+                "run_state": ExecutionRunState.RUNNING,
+                "heartbeat_at": {
+                    "$lt": now - timedelta(seconds=lease_duration)
+                },
+            },
+            {
+                "$set": {
+                    "run_state": ExecutionRunState.QUEUED,
+                    "started_at": None,
+                    "updated_at": now,
+                    "heartbeat_at": None,
+                    "claim_token": None,
+                }
+            },
+        )
+        return res.modified_count
+
     def get_queued_operations(
         self,
         operator: str = None,
@@ -42,6 +42,8 @@ class DelegatedOperationDocument(object):
         self.status = None
         self.dataset_id = None
         self.started_at = None
+        self.heartbeat_at = None
+        self.claim_token = None
         self.pinned = False
         self.completed_at = None
         self.failed_at = None
@@ -66,6 +68,10 @@ class DelegatedOperationDocument(object):
             doc["completed_at"] if "completed_at" in doc else None
         )
         self.failed_at = doc["failed_at"] if "failed_at" in doc else None
+        self.heartbeat_at = (
+            doc["heartbeat_at"] if "heartbeat_at" in doc else None
+        )
+        self.claim_token = doc["claim_token"] if "claim_token" in doc else None
         self.pinned = doc["pinned"] if "pinned" in doc else None
         self.dataset_id = doc["dataset_id"] if "dataset_id" in doc else None
         self.run_link = doc["run_link"] if "run_link" in doc else None
@@ -6,11 +6,12 @@ FiftyOne delegated operations.
 |
 """
 import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import logging
+import threading
 import traceback
 
 from fiftyone.factory.repo_factory import RepositoryFactory
-from fiftyone.factory import DelegatedOperationPagingParams
 from fiftyone.operators.executor import (
     prepare_operator_executor,
     do_execute_operator,
@@ -25,6 +26,10 @@ logger = logging.getLogger(__name__)
 class DelegatedOperationService(object):
     """Service for executing delegated operations."""
 
+    # The number of seconds after which running operations claimed via
+    # claim_operation() that have not sent a heartbeat are requeued
+    LEASE_DURATION = 300
+
     def __init__(self, repo=None):
         if repo is None:
             repo = RepositoryFactory.delegated_operation_repo()
@@ -95,6 +100,7 @@ class DelegatedOperationService(object):
         result=None,
         progress=None,
         run_link=None,
+        claim_token=None,
     ):
         """Sets the given delegated operation to completed state.
 
@@ -108,13 +114,18 @@ class DelegatedOperationService(object):
                 operation
             run_link (None): an optional link to orchestrator-specific
                 information about the operation
+            claim_token (None): the ``claim_token`` of the operation returned
+                by :meth:`claim_operation`. If provided, the operation is only
+                updated if it has not since been requeued
 
         Returns:
-            a :class:`fiftyone.factory.repos.DelegatedOperationDocument`
+            a :class:`fiftyone.factory.repos.DelegatedOperationDocument`, or
+            None if the operation is no longer held by ``claim_token``
         """
         return self._repo.update_run_state(
             _id=doc_id,
             run_state=ExecutionRunState.COMPLETED,
+            claim_token=claim_token,
             result=result,
             progress=progress,
             run_link=run_link,
@@ -126,6 +137,7 @@ class DelegatedOperationService(object):
         result=None,
         progress=None,
         run_link=None,
+        claim_token=None,
     ):
         """Sets the given delegated operation to failed state.
 
@@ -139,13 +151,18 @@ class DelegatedOperationService(object):
                 operation
             run_link (None): an optional link to orchestrator-specific
                 information about the operation
+            claim_token (None): the ``claim_token`` of the operation returned
+                by :meth:`claim_operation`. If provided, the operation is only
+                updated if it has not since been requeued
 
         Returns:
-            a :class:`fiftyone.factory.repos.DelegatedOperationDocument`
+            a :class:`fiftyone.factory.repos.DelegatedOperationDocument`, or
+            None if the operation is no longer held by ``claim_token``
         """
         return self._repo.update_run_state(
             _id=doc_id,
             run_state=ExecutionRunState.FAILED,
+            claim_token=claim_token,
             result=result,
             run_link=run_link,
             progress=progress,
@@ -275,6 +292,63 @@ class DelegatedOperationService(object):
             **kwargs,
         )
 
+    def claim_operation(
+        self,
+        operator=None,
+        delegation_target=None,
+        dataset_name=None,
+        max_running_per_dataset=None,
+        **kwargs,
+    ):
+        """Atomically claims the oldest queued delegated operation matching
+        the given criteria by transitioning it to running state.
+
+        Each operation can be claimed by at most one caller, even when
+        multiple orchestrators are claiming operations concurrently.
+
+        Args:
+            operator (None): the optional name of the operator whose
+                operations to claim
+            delegation_target (None): the optional delegation target of the
+                operations to claim
+            dataset_name (None): the optional name of the dataset whose
+                operations to claim
+            max_running_per_dataset (None): an optional maximum number of
+                operations that may be running on the same dataset. Operations
+                on datasets that are at capacity are not claimed
+
+        Returns:
+            a :class:`fiftyone.factory.repos.DelegatedOperationDocument`, or
+            None if no operation could be claimed
+        """
+        return self._repo.claim_operation(
+            operator=operator,
+            dataset_name=dataset_name,
+            delegation_target=delegation_target,
+            max_running_per_dataset=max_running_per_dataset,
+            **kwargs,
+        )
+
+    def requeue_expired_operations(self, lease_duration=None):
+        """Requeues running delegated operations whose orchestrator has not
+        sent a heartbeat within the given lease duration, which typically
+        means that the orchestrator crashed.
+
+        Only operations that were claimed via :meth:`claim_operation` are
+        eligible to be requeued.
+
+        Args:
+            lease_duration (None): the lease duration, in seconds. By default,
+                ``DelegatedOperationService.LEASE_DURATION`` is used
+
+        Returns:
+            the number of operations that were requeued
+        """
+        if lease_duration is None:
+            lease_duration = self.LEASE_DURATION
+
+        return self._repo.requeue_expired_operations(lease_duration)
+
     def execute_queued_operations(
         self,
         operator=None,
@@ -282,10 +356,22 @@ class DelegatedOperationService(object):
         dataset_name=None,
         limit=None,
         log=False,
+        num_workers=None,
+        max_running_per_dataset=None,
+        lease_duration=None,
         **kwargs,
     ):
         """Executes queued delegated operations matching the given criteria.
 
+        Operations are atomically claimed one at a time, so multiple
+        orchestrators may safely execute queued operations concurrently. This
+        method returns when no more matching operations can be claimed and
+        all claimed operations have finished executing.
+
+        While operations are executing, heartbeats are periodically recorded
+        for them, and operations whose orchestrator has stopped sending
+        heartbeats for longer than ``lease_duration`` are requeued.
+
         Args:
             operator (None): the optional name of the operator to execute all
                 the queued delegated operations for
@@ -297,23 +383,67 @@ class DelegatedOperationService(object):
                 operations to execute
             log (False): the optional boolean flag to log the execution of the
                 delegated operations
+            num_workers (None): the number of operations to execute
+                concurrently in a thread pool. By default, operations are
+                executed one at a time
+            max_running_per_dataset (None): an optional maximum number of
+                operations that may be running on the same dataset
+            lease_duration (None): the lease duration, in seconds, after which
+                running operations without heartbeats are requeued. By
+                default, ``DelegatedOperationService.LEASE_DURATION`` is used
         """
-        if limit is not None:
-            paging = DelegatedOperationPagingParams(limit=limit)
-        else:
-            paging = None
-
-        queued_ops = self.list_operations(
-            operator=operator,
-            dataset_name=dataset_name,
-            delegation_target=delegation_target,
-            run_state=ExecutionRunState.QUEUED,
-            paging=paging,
-            **kwargs,
-        )
-
-        for op in queued_ops:
-            self.execute_operation(operation=op, log=log)
+        if num_workers is None:
+            num_workers = 1
+
+        if lease_duration is None:
+            lease_duration = self.LEASE_DURATION
+
+        num_requeued = self.requeue_expired_operations(lease_duration)
+        if log and num_requeued > 0:
+            logger.info("Requeued %d expired operation(s)", num_requeued)
+
+        num_claimed = 0
+        running = set()
+
+        with _HeartbeatThread(
+            self._repo, lease_duration, log=log
+        ) as heartbeat, ThreadPoolExecutor(
+            max_workers=num_workers
+        ) as executor:
+            while True:
+                while len(running) < num_workers and (
+                    limit is None or num_claimed < limit
+                ):
+                    op = self.claim_operation(
+                        operator=operator,
+                        dataset_name=dataset_name,
+                        delegation_target=delegation_target,
+                        max_running_per_dataset=max_running_per_dataset,
+                        **kwargs,
+                    )
+                    if op is None:
+                        break
+
+                    heartbeat.add(op.id, op.claim_token)
+                    running.add(
+                        executor.submit(
+                            self._execute_claimed_operation, op, heartbeat, log
+                        )
+                    )
+                    num_claimed += 1
+
+                if not running:
+                    break
+
+                _, running = wait(running, return_when=FIRST_COMPLETED)
+
+    def _execute_claimed_operation(self, operation, heartbeat, log):
+        try:
+            self._execute_operation(
+                operation, log=log, claim_token=operation.claim_token
+            )
+        finally:
+            heartbeat.remove(operation.id)
 
     def count(self, filters=None, search=None):
         """Counts the delegated operations matching the given criteria.
@@ -338,8 +468,22 @@ class DelegatedOperationService(object):
             run_link (None): an optional link to orchestrator-specific
                 information about the operation
         """
+        self._execute_operation(
+            operation, log=log, run_link=run_link, set_running=True
+        )
+
+    def _execute_operation(
+        self,
+        operation,
+        log=False,
+        run_link=None,
+        set_running=False,
+        claim_token=None,
+    ):
         try:
-            self.set_running(doc_id=operation.id, run_link=run_link)
+            if set_running:
+                self.set_running(doc_id=operation.id, run_link=run_link)
+
             if log:
                 logger.info(
                     "\nRunning operation %s (%s)",
@@ -349,14 +493,22 @@ class DelegatedOperationService(object):
 
             result = asyncio.run(self._execute_operator(operation))
 
-            self.set_completed(doc_id=operation.id, result=result)
-            if log:
+            doc = self.set_completed(
+                doc_id=operation.id, result=result, claim_token=claim_token
+            )
+            if doc is None:
+                _log_lost_claim(operation)
+            elif log:
                 logger.info("Operation %s complete", operation.id)
         except:
             result = ExecutionResult(error=traceback.format_exc())
 
-            self.set_failed(doc_id=operation.id, result=result)
-            if log:
+            doc = self.set_failed(
+                doc_id=operation.id, result=result, claim_token=claim_token
+            )
+            if doc is None:
+                _log_lost_claim(operation)
+            elif log:
                 logger.info(
                     "Operation %s failed\n%s", operation.id, result.error
                 )
@@ -384,3 +536,73 @@ class DelegatedOperationService(object):
 
         operator, _, ctx = prepared
         return await do_execute_operator(operator, ctx, exhaust=True)
+
+
+class _HeartbeatThread(object):
+    """Background thread that records heartbeats for the delegated operations
+    that are running in this process and requeues operations whose leases
+    have expired.
+    """
+
+    def __init__(self, repo, lease_duration, log=False):
+        self._repo = repo
+        self._lease_duration = lease_duration
+        self._log = log
+        self._claims = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop_event.set()
+        self._thread.join()
+
+    def add(self, doc_id, claim_token):
+        with self._lock:
+            self._claims[doc_id] = claim_token
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._claims.pop(doc_id, None)
+
+    def _run(self):
+        interval = self._lease_duration / 4.0
+        while not self._stop_event.wait(interval):
+            with self._lock:
+                claims = dict(self._claims)
+
+            try:
+                # Operations whose leases were lost will not have their
+                # results recorded, so stop sending heartbeats for them
+                lost_ids = self._repo.heartbeat(claims)
+                with self._lock:
+                    for doc_id in lost_ids:
+                        if self._claims.pop(doc_id, None) is not None:
+                            logger.warning(
+                                "Lost the lease on operation %s, which may "
+                                "now be executed by another orchestrator",
+                                doc_id,
+                            )
+
+                num_requeued = self._repo.requeue_expired_operations(
+                    self._lease_duration
+                )
+                if self._log and num_requeued > 0:
+                    logger.info(
+                        "Requeued %d expired operation(s)", num_requeued
+                    )
+            except Exception as e:
+                logger.warning("Failed to record heartbeats: %s", e)
+
+
+def _log_lost_claim(operation):
+    logger.warning(
+        "Not recording the result of operation %s because its lease expired "
+        "and it was requeued",
+        operation.id,
+    )
@@ -19,6 +19,7 @@ import fiftyone.core.media as fom
 from fiftyone.core.utils import datetime_to_timestamp
 import fiftyone.core.view as fov
 
+from fiftyone.server.cache import results_cache
 from fiftyone.server.constants import LIST_LIMIT
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
 from fiftyone.server.inputs import SelectedLabel
@@ -141,8 +142,21 @@ async def aggregate_resolver(
             ]
         )
 
+    if slice_view is not None:
+        slice_stages = slice_view._serialize(include_uuids=False)
+    else:
+        slice_stages = None
+
+    return await results_cache.get_or_compute(
+        view,
+        [form.paths, slice_stages],
+        lambda: _aggregate_paths(view, form.paths, slice_view),
+    )
+
+
+async def _aggregate_paths(view, paths, slice_view):
     aggregations, deserializers = zip(
-        *[_resolve_path_aggregation(path, view) for path in form.paths]
+        *[_resolve_path_aggregation(path, view) for path in paths]
     )
     counts = [len(a) for a in aggregations]
     flattened = [item for sublist in aggregations for item in sublist]
@@ -0,0 +1,168 @@
+"""
+FiftyOne Server result caching.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import asyncio
+import threading
+
+from bson import json_util
+import cachetools
+
+import fiftyone.core.dataset as fod
+import fiftyone.core.utils as fou
+
+
+CACHE_MAX_SIZE = 1024
+CACHE_TTL = 300
+
+
+class ResultCache(object):
+    """A thread-safe cache of results computed on sample collections.
+
+    Results are evicted in least recently used order once ``max_size``
+    results are cached, and expire after ``ttl`` seconds. Cache keys include
+    the version of the collection's dataset, so results are never served
+    after the dataset's samples or frames have been modified.
+
+    Concurrent requests for the same uncached result are coalesced, so that
+    the result is only computed once.
+
+    Args:
+        max_size (CACHE_MAX_SIZE): the maximum number of results to cache
+        ttl (CACHE_TTL): the number of seconds after which results expire
+    """
+
+    def __init__(self, max_size=CACHE_MAX_SIZE, ttl=CACHE_TTL):
+        self._cache = cachetools.TTLCache(maxsize=max_size, ttl=ttl)
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._cache)
+
+    def make_key(self, sample_collection, *args):
+        """Returns a cache key for a result computed on the given collection
+        with the given parameters.
+
+        Args:
+            sample_collection: a
+                :class:`fiftyone.core.collections.SampleCollection`
+            *args: JSON-serializable parameters that define the result
+
+        Returns:
+            a string key
+        """
+        dataset = sample_collection._dataset
+        if isinstance(sample_collection, fod.Dataset):
+            stages = []
+        else:
+            stages = sample_collection._serialize(include_uuids=False)
+
+        return json_util.dumps(
+            [
+                str(dataset._doc.id),
+                dataset._get_data_version(),
+                stages,
+                sample_collection.group_slice,
+                list(args),
+            ],
+            sort_keys=True,
+        )
+
+    def get(self, key, default=None):
+        """Gets the cached result for the given key, if any.
+
+        Args:
+            key: a key returned by :meth:`make_key`
+            default (None): a value to return if no result is cached
+
+        Returns:
+            the cached result, or ``default``
+        """
+        with self._lock:
+            return self._cache.get(key, default)
+
+    def set(self, key, result):
+        """Caches the given result.
+
+        Args:
+            key: a key returned by :meth:`make_key`
+            result: the result
+        """
+        with self._lock:
+            self._cache[key] = result
+
+    def clear(self):
+        """Removes all cached results."""
+        with self._lock:
+            self._cache.clear()
+
+    async def get_or_compute(self, sample_collection, args, compute):
+        """Returns the cached result for the given collection and parameters,
+        computing and caching it if necessary.
+
+        If the same result is already being computed, its computation is
+        awaited rather than started again. If that computation is cancelled,
+        one of the requests awaiting it computes the result instead.
+
+        Args:
+            sample_collection: a
+                :class:`fiftyone.core.collections.SampleCollection`
+            args: a list of JSON-serializable parameters that define the
+                result
+            compute: an async function that computes the result
+
+        Returns:
+            the result
+        """
+        key = await fou.run_sync_task(self.make_key, sample_collection, *args)
+
+        result = self.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        while True:
+            future = self._in_flight.get(key, None)
+            if future is None:
+                break
+
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # If the computation was cancelled, rather than this request,
+                # the first waiter to resume takes over computing the result
+                if not future.cancelled():
+                    raise
+
+            result = self.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # don't warn if no one else is waiting
+            raise
+        else:
+            self.set(key, result)
+            future.set_result(result)
+        finally:
+            self._in_flight.pop(key, None)
+
+        return result
+
+
+_MISSING = object()
+
+results_cache = ResultCache()
@@ -18,6 +18,7 @@ import strawberry as gql
 import fiftyone as fo
 import fiftyone.core.fields as fof
 
+from fiftyone.server.cache import results_cache
 import fiftyone.server.constants as foc
 from fiftyone.server.data import Info
 from fiftyone.server.utils import meets_type
@@ -112,10 +113,20 @@ async def lightning_resolver(
     input: LightningInput, info: Info
 ) -> t.List[LightningResults]:
     dataset: fo.Dataset = fo.load_dataset(input.dataset)
+    return await results_cache.get_or_compute(
+        dataset,
+        [asdict(path) for path in input.paths],
+        lambda: _resolve_lightning_paths(dataset, input.paths, info),
+    )
+
+
+async def _resolve_lightning_paths(
+    dataset: fo.Dataset, paths: t.List[LightningPathInput], info: Info
+) -> t.List[LightningResults]:
     collections, queries, resolvers = zip(
         *[
             _resolve_lightning_path_queries(path, dataset, info)
-            for path in input.paths
+            for path in paths
         ]
     )
     counts = [len(a) for a in queries]
@@ -10,8 +10,10 @@ from starlette.endpoints import HTTPEndpoint
 from starlette.requests import Request
 
 import fiftyone.core.aggregations as foa
+import fiftyone.core.utils as fou
 import fiftyone.core.view as fov
 
+from fiftyone.server.cache import results_cache
 from fiftyone.server.decorators import route
 
 import fiftyone.server.view as fosv
@@ -33,7 +35,13 @@ class Aggregate(HTTPEndpoint):
         if sample_ids:
             view = fov.make_optimized_select_view(view, sample_ids)
 
-        aggregate_result = view.aggregate(
-            [foa.Aggregation._from_dict(agg) for agg in aggregations]
+        async def compute():
+            return await fou.run_sync_task(
+                view.aggregate,
+                [foa.Aggregation._from_dict(agg) for agg in aggregations],
+            )
+
+        aggregate_result = await results_cache.get_or_compute(
+            view, [aggregations], compute
         )
         return {"aggregate": aggregate_result}
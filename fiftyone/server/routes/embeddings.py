@@ -6,9 +6,13 @@ FiftyOne Server ``/embeddings`` route.
 |
 """
 import itertools
+import struct
 
+from bson import json_util
+import numpy as np
 from starlette.endpoints import HTTPEndpoint
 from starlette.requests import Request
+from starlette.responses import Response
 
 import fiftyone.core.fields as fof
 import fiftyone.core.stages as fos
@@ -37,7 +41,16 @@ def get_sample_filter(slices):
 class OnPlotLoad(HTTPEndpoint):
     @route
     async def post(self, request: Request, data: dict) -> dict:
-        """Loads an embeddings plot based on the current view."""
+        """Loads an embeddings plot based on the current view.
+
+        By default, the plot is returned as JSON traces. If ``format`` is
+        ``"binary"``, the plot is instead returned in the compact binary
+        format described by :func:`_encode_plot`.
+
+        The optional ``bounds = [[xmin, ymin], [xmax, ymax]]`` and
+        ``maxPoints`` parameters can be used to only load the points in the
+        visible region of the plot at the given level of detail.
+        """
         return await run_sync_task(self._post_sync, data)
 
     def _post_sync(self, data):
@@ -93,7 +106,18 @@ class OnPlotLoad(HTTPEndpoint):
             sample_ids = results._curr_sample_ids
         else:
             ids = results._curr_sample_ids
-            sample_ids = itertools.repeat(None)
+            sample_ids = None
+
+        # Only return the points in the requested region, downsampled to the
+        # requested level of detail
+        inds, visible_count = _get_visible_inds(
+            points, bounds=data.get("bounds"), max_points=data.get("maxPoints")
+        )
+        if inds is not None:
+            points = points[inds]
+            ids = [ids[i] for i in inds]
+            if sample_ids is not None:
+                sample_ids = [sample_ids[i] for i in inds]
 
         # Color by data
         if label_field:
@@ -132,21 +156,30 @@ class OnPlotLoad(HTTPEndpoint):
             labels = itertools.repeat(None)
             style = "uncolored"
 
-        selected = itertools.repeat(True)
-
-        traces = {}
-        for data in zip(points, ids, sample_ids, labels, selected):
-            _add_to_trace(traces, style, *data)
-
-        return {
-            "traces": traces,
+        info = {
             "style": style,
             "index_size": index_size,
             "available_count": available_count,
             "missing_count": missing_count,
+            "visible_count": visible_count,
             "patches_field": patches_field,
         }
 
+        if data.get("format", "json") == "binary":
+            return _encode_plot(info, points, ids, sample_ids, labels)
+
+        if sample_ids is None:
+            sample_ids = itertools.repeat(None)
+
+        selected = itertools.repeat(True)
+
+        traces = {}
+        for args in zip(points, ids, sample_ids, labels, selected):
+            _add_to_trace(traces, style, *args)
+
+        info["traces"] = traces
+        return info
+
 
 class EmbeddingsSelection(HTTPEndpoint):
     @route
@@ -330,3 +363,106 @@ def _add_to_trace(traces, style, points, id, sample_id, label, selected):
             "selected": selected,
         }
     )
+
+
+def _get_visible_inds(points, bounds=None, max_points=None):
+    # Returns the indices of the points within `bounds`, downsampled to at
+    # most `max_points` by keeping one point per occupied cell of a grid over
+    # the region, along with the number of points within `bounds`
+    num_points = len(points)
+    if bounds is None and (max_points is None or num_points <= max_points):
+        return None, num_points
+
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+
+    if bounds is not None:
+        lower, upper = np.asarray(bounds, dtype=float)
+        mask = np.all((points >= lower) & (points <= upper), axis=1)
+        inds = np.flatnonzero(mask)
+    else:
+        inds = np.arange(num_points)
+
+    visible_count = len(inds)
+
+    if max_points is not None and visible_count > max_points:
+        _points = points[inds]
+        if bounds is None:
+            lower = _points.min(axis=0)
+            upper = _points.max(axis=0)
+
+        grid_size = max(int(np.sqrt(max_points)), 1)
+        scale = grid_size / np.maximum(upper - lower, np.finfo(float).eps)
+        cells = np.floor((_points - lower) * scale).astype(np.int64)
+        cells = np.clip(cells, 0, grid_size - 1)
+        keys = cells[:, 0] * grid_size + cells[:, 1]
+        _, first = np.unique(keys, return_index=True)
+        inds = inds[np.sort(first)]
+
+    return inds, visible_count
+
+
+_PLOT_MAGIC = b"FOEP"
+
+
+def _encode_plot(info, points, ids, sample_ids, labels):
+    # Binary plot format (little-endian):
+    #   - magic "FOEP", uint32 length of the JSON header
+    #   - JSON header, space-padded to a multiple of 4 bytes
+    #   - float32 points, shape (count, 2)
+    #   - 12-byte object IDs, shape (count,)
+    #   - 12-byte sample IDs, shape (count,), if "has_sample_ids"
+    #   - labels, shape (count,), if "labels_type" is not None. Either int32
+    #     codes into "categories" (-1 for None) or float32 values (NaN for
+    #     None)
+    count = len(ids)
+    info = dict(info, count=count, has_sample_ids=sample_ids is not None)
+
+    buffers = [
+        np.asarray(points, dtype="<f4").reshape(count, 2).tobytes(),
+        bytes.fromhex("".join(ids)),
+    ]
+
+    if sample_ids is not None:
+        buffers.append(bytes.fromhex("".join(sample_ids)))
+
+    labels_type, categories, label_buffer = _encode_labels(
+        labels, info["style"], count
+    )
+    info["labels_type"] = labels_type
+    info["categories"] = categories
+    if label_buffer is not None:
+        buffers.append(label_buffer)
+
+    header = json_util.dumps(info).encode("utf-8")
+    header += b" " * (-len(header) % 4)
+
+    content = b"".join(
+        [_PLOT_MAGIC, struct.pack("<I", len(header)), header] + buffers
+    )
+
+    return Response(content, media_type="application/octet-stream")
+
+
+def _encode_labels(labels, style, count):
+    if style == "uncolored":
+        return None, None, None
+
+    if style == "continuous" and all(
+        l is None
+        or (isinstance(l, (int, float, np.number)) and not isinstance(l, bool))
+        for l in labels
+    ):
+        values = np.array(
+            [np.nan if l is None else l for l in labels], dtype="<f4"
+        )
+        return "float", None, values.tobytes()
+
+    categories = {}
+    codes = np.empty(count, dtype="<i4")
+    for i, label in enumerate(labels):
+        if label is None:
+            codes[i] = -1
+        else:
+            codes[i] = categories.setdefault(label, len(categories))
+
+    return "codes", list(categories.keys()), codes.tobytes()
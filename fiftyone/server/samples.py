@@ -6,13 +6,18 @@ FiftyOne Server samples pagination
 |
 """
 import asyncio
+import base64
+
+from bson import json_util
 import strawberry as gql
 import typing as t
 
+import eta.core.utils as etau
 
 from fiftyone.core.collections import SampleCollection
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
+import fiftyone.core.stages as fosg
 from fiftyone.core.utils import run_sync_task
 
 from fiftyone.server.filters import SampleFilter
@@ -70,6 +75,32 @@ MEDIA_TYPES = {
     fom.THREE_D: ThreeDSample,
 }
 
+# Stages that filter or edit samples without depending on their position in
+# the collection, and can therefore be applied after a keyset $match
+_KEYSET_STAGES = (
+    fosg.Exclude,
+    fosg.ExcludeFields,
+    fosg.ExcludeFrames,
+    fosg.ExcludeLabels,
+    fosg.Exists,
+    fosg.FilterField,
+    fosg.FilterKeypoints,
+    fosg.FilterLabels,
+    fosg.LimitLabels,
+    fosg.MapLabels,
+    fosg.Match,
+    fosg.MatchFrames,
+    fosg.MatchLabels,
+    fosg.MatchTags,
+    fosg.SelectFields,
+    fosg.SelectFrames,
+    fosg.SelectLabels,
+    fosg.SetField,
+)
+
+# Stages that modify the value of their ``field``
+_KEYSET_EDIT_STAGES = (fosg.FilterField, fosg.MapLabels, fosg.SetField)
+
 
 async def paginate_samples(
     dataset: str,
@@ -103,11 +134,14 @@ async def paginate_samples(
     # full datasets.
     full_lookup = has_frames and (filters or stages)
     support = [1, 1] if not full_lookup else None
-    if after is None:
-        after = "-1"
 
-    if int(after) > -1:
-        view = view.skip(int(after) + 1)
+    offset, keys = _parse_cursor(after)
+    keyset = _get_keyset(view)
+
+    if keyset is not None:
+        view = _apply_keyset(view, keyset, keys, offset)
+    elif offset > -1:
+        view = view.skip(offset + 1)
 
     pipeline = view._pipeline(
         attach_frames=has_frames,
@@ -144,11 +178,11 @@ async def paginate_samples(
     )
 
     edges = []
-    for idx, node in enumerate(nodes):
+    for idx, (sample, node) in enumerate(zip(samples, nodes)):
         edges.append(
             Edge(
                 node=node,
-                cursor=str(idx + int(after) + 1),
+                cursor=_make_cursor(idx + offset + 1, sample, keyset),
             )
         )
 
@@ -196,3 +230,176 @@ async def _create_sample_item(
         _id = f"{_id}-modal"
 
     return from_dict(cls, {"id": _id, "sample": sample, **metadata})
+
+
+def _parse_cursor(after):
+    # Cursors are either integer offsets, or encoded keyset cursors that
+    # contain both the offset and the sort key of the last seen sample
+    if after is None:
+        return -1, None
+
+    try:
+        return int(after), None
+    except ValueError:
+        pass
+
+    try:
+        d = json_util.loads(base64.urlsafe_b64decode(after.encode()))
+        return int(d["offset"]), d["keys"]
+    except Exception:
+        raise ValueError(f"invalid cursor '{after}'")
+
+
+def _make_cursor(offset, sample, keyset):
+    if keyset is None:
+        return str(offset)
+
+    _, path, _ = keyset
+    keys = [sample["_id"]]
+    if path is not None:
+        value, found = _get_value(sample, path)
+        if not found:
+            return str(offset)
+
+        keys.insert(0, value)
+
+    d = {"offset": offset, "keys": keys}
+    return base64.urlsafe_b64encode(json_util.dumps(d).encode()).decode()
+
+
+def _get_value(d, path):
+    for key in path.split("."):
+        if not isinstance(d, dict):
+            return None, False
+
+        d = d.get(key, None)
+
+    return d, True
+
+
+def _get_keyset(view):
+    """Returns a ``(num_stages, path, order)`` tuple describing a stable
+    ordering of the given view, in which the view's first ``num_stages``
+    stages are followed by a sort on ``path`` (if any) and then ``_id``,
+    or ``None`` if the view does not define a stable ordering that can be
+    paginated by key.
+    """
+    stages = view._stages
+    for idx in range(len(stages), 0, -1):
+        stage = stages[idx - 1]
+
+        if isinstance(stage, fosg.SortBy):
+            path = _get_sort_path(view, stage, stages[idx:])
+            if path is None:
+                return None
+
+            return idx - 1, path, -1 if stage.reverse else 1
+
+        if isinstance(stage, (fosg.Select, fosg.SelectBy)):
+            if stage.ordered:
+                return None
+
+            continue
+
+        if not isinstance(stage, _KEYSET_STAGES):
+            return None
+
+    return 0, None, 1
+
+
+def _get_sort_path(view, stage, later_stages):
+    field_or_expr = stage._get_mongo_field_or_expr()
+    if not etau.is_str(field_or_expr):
+        return None
+
+    field_name = field_or_expr.lstrip("$")
+
+    try:
+        (
+            path,
+            is_frame_field,
+            list_fields,
+            other_list_fields,
+            _,
+        ) = view._parse_field_name(field_name)
+    except ValueError:
+        return None
+
+    if is_frame_field or list_fields or other_list_fields:
+        return None
+
+    # The sort field must be present in the returned samples in order to
+    # encode their keys
+    root = path.split(".", 1)[0]
+    if view.get_field(root) is None:
+        return None
+
+    for _stage in later_stages:
+        if isinstance(_stage, _KEYSET_EDIT_STAGES):
+            _path, _, _, _, _ = view._parse_field_name(
+                _stage.field, allow_missing=True
+            )
+            if _path.split(".", 1)[0] == root:
+                return None
+
+    return path
+
+
+def _apply_keyset(view, keyset, keys, offset):
+    idx, path, order = keyset
+
+    sort = {"_id": 1}
+    if path is not None:
+        sort = {path: order, "_id": 1}
+
+    pipeline = [{"$sort": sort}]
+
+    num_keys = 2 if path is not None else 1
+    if offset > -1:
+        if keys is not None and len(keys) == num_keys:
+            pipeline.append({"$match": _make_keyset_query(path, order, keys)})
+        else:
+            pipeline.append({"$skip": offset + 1})
+
+    stages = view._stages
+    if path is not None:
+        # Replace the SortBy stage with one that breaks ties by ID
+        later_stages = stages[idx + 1 :]
+    else:
+        later_stages = stages
+
+    _view = view._base_view
+    for stage in stages[:idx]:
+        _view = _view._add_view_stage(stage, validate=False)
+
+    _view = _view._add_view_stage(
+        fosg.Mongo(pipeline, _needs_frames=False), validate=False
+    )
+
+    for stage in later_stages:
+        _view = _view._add_view_stage(stage, validate=False)
+
+    return _view
+
+
+def _make_keyset_query(path, order, keys):
+    _id = keys[-1]
+    if path is None:
+        return {"_id": {"$gt": _id}}
+
+    # Missing and null values are sorted first in ascending order and last in
+    # descending order
+    value = keys[0]
+    if value is None:
+        query = {path: None, "_id": {"$gt": _id}}
+        if order == 1:
+            query = {"$or": [query, {path: {"$ne": None}}]}
+
+        return query
+
+    op = "$gt" if order == 1 else "$lt"
+    queries = [{path: {op: value}}, {path: value, "_id": {"$gt": _id}}]
+    if order == -1:
+        queries.append({path: None})
+
+    return {"$or": queries}
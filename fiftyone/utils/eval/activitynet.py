@@ -130,6 +130,7 @@ class ActivityNetEvaluation(DetectionEvaluation):
         classes=None,
         missing=None,
         progress=None,
+        columnar=False,
     ):
         """Generates aggregate evaluation results for the samples.
 
@@ -155,6 +156,8 @@ class ActivityNetEvaluation(DetectionEvaluation):
             progress (None): whether to render a progress bar (True/False), use
                 the default value ``fiftyone.config.show_progress_bars``
                 (None), or a progress callback function to invoke instead
+            columnar (False): whether ``matches`` were generated via
+                :meth:`evaluate_samples`
 
         Returns:
             a :class:`DetectionResults`
@@ -12,7 +12,9 @@ import numpy as np
 
 import eta.core.utils as etau
 
+import fiftyone.core.labels as fol
 import fiftyone.core.plots as fop
+import fiftyone.core.utils as fou
 import fiftyone.utils.iou as foui
 
 from .detection import (
@@ -165,6 +167,77 @@ class COCOEvaluation(DetectionEvaluation):
 
         return _coco_evaluation_single_iou(gts, preds, eval_key, self.config)
 
+    def can_evaluate_samples(self, samples):
+        if self.config.use_masks:
+            return False
+
+        if samples._is_frame_field(self.config.pred_field):
+            return False
+
+        label_type = samples._get_label_field_type(self.config.gt_field)
+        if not issubclass(label_type, fol.Detections):
+            return False
+
+        # 3D cuboids require evaluate()
+        for field in (self.config.gt_field, self.config.pred_field):
+            _, path = samples._get_label_field_path(field)
+            if samples.count(path + ".dimensions") > 0:
+                return False
+
+        return True
+
+    def evaluate_samples(self, samples, eval_key=None, progress=None):
+        """Performs COCO-style evaluation on the given collection in a
+        columnar fashion.
+
+        The ``id``, ``label``, ``bounding_box``, ``confidence``, and
+        ``self.config.iscrowd`` attributes of the objects are loaded via
+        :meth:`values() <fiftyone.core.collections.SampleCollection.values>`,
+        matching is performed exactly as in :meth:`evaluate`, and, if an
+        ``eval_key`` is provided, the object-level results are written via
+        :meth:`set_values() <fiftyone.core.collections.SampleCollection.set_values>`.
+
+        If ``self.config.compute_mAP`` is True, passing ``columnar=True`` to
+        :meth:`generate_results` performs its IoU sweep in columnar fashion.
+
+        Args:
+            samples: a :class:`fiftyone.core.collections.SampleCollection`
+            eval_key (None): the evaluation key for this evaluation
+            progress (None): whether to render a progress bar (True/False), use
+                the default value ``fiftyone.config.show_progress_bars``
+                (None), or a progress callback function to invoke instead
+
+        Returns:
+            a list containing, for each sample, a list of matched
+            ``(gt_label, pred_label, iou, pred_confidence, gt_id, pred_id)``
+            tuples
+        """
+        iou_thresh = min(self.config.iou, 1 - 1e-10)
+
+        all_gts, all_preds = _get_columnar_labels(samples, self.config)
+
+        sample_matches = []
+        gt_results = []
+        pred_results = []
+        with fou.ProgressBar(total=len(all_gts), progress=progress) as pb:
+            for gts, preds in pb(zip(all_gts, all_preds)):
+                cats = _coco_columnar_setup(gts, preds, self.config)
+                matches, gt_result, pred_result = _compute_columnar_matches(
+                    cats, gts, preds, iou_thresh
+                )
+
+                # omit iscrowd
+                sample_matches.append([m[:-1] for m in matches])
+                gt_results.append(gt_result)
+                pred_results.append(pred_result)
+
+        if eval_key is not None:
+            _write_columnar_results(
+                samples, self.config, eval_key, gt_results, pred_results
+            )
+
+        return sample_matches
+
     def generate_results(
         self,
         samples,
@@ -173,6 +246,7 @@ class COCOEvaluation(DetectionEvaluation):
         classes=None,
         missing=None,
         progress=None,
+        columnar=False,
     ):
         """Generates aggregate evaluation results for the samples.
 
@@ -197,6 +271,9 @@ class COCOEvaluation(DetectionEvaluation):
             progress (None): whether to render a progress bar (True/False), use
                 the default value ``fiftyone.config.show_progress_bars``
                 (None), or a progress callback function to invoke instead
+            columnar (False): whether ``matches`` were generated via
+                :meth:`evaluate_samples`, in which case the IoU sweep is also
+                performed in columnar fashion
 
         Returns:
             a :class:`DetectionResults`
@@ -219,7 +296,11 @@ class COCOEvaluation(DetectionEvaluation):
             iou_threshs,
             classes,
         ) = _compute_pr_curves(
-            samples, self.config, classes=classes, progress=progress
+            samples,
+            self.config,
+            classes=classes,
+            progress=progress,
+            columnar=columnar,
         )
 
         return COCODetectionResults(
@@ -433,15 +514,11 @@ def _coco_evaluation_single_iou(gts, preds, eval_key, config):
     id_key = "%s_id" % eval_key
     iou_key = "%s_iou" % eval_key
 
-    cats, pred_ious, iscrowd = _coco_evaluation_setup(
-        gts, preds, [id_key], iou_key, config
-    )
+    cats = _coco_evaluation_setup(gts, preds, [id_key], iou_key, config)
 
     matches = _compute_matches(
         cats,
-        pred_ious,
         iou_thresh,
-        iscrowd,
         eval_key=eval_key,
         id_key=id_key,
         iou_key=iou_key,
@@ -456,16 +533,14 @@ def _coco_evaluation_iou_sweep(gts, preds, config):
     id_keys = ["eval_id_%s" % str(i).replace(".", "_") for i in iou_threshs]
     iou_key = "eval_iou"
 
-    cats, pred_ious, iscrowd = _coco_evaluation_setup(
+    cats = _coco_evaluation_setup(
         gts, preds, id_keys, iou_key, config, max_preds=config.max_preds
     )
 
     return [
         _compute_matches(
             cats,
-            pred_ious,
             iou_thresh,
-            iscrowd,
             eval_key="_eval",
             id_key=id_key,
             iou_key=iou_key,
@@ -511,115 +586,77 @@ def _coco_evaluation_setup(
             cats[label]["preds"].append(obj)
 
     # Compute IoUs within each category
-    pred_ious = {}
     for objects in cats.values():
         gts = objects["gts"]
         preds = objects["preds"]
 
         # Highest confidence predictions first
-        preds = sorted(preds, key=lambda p: p.confidence or -1, reverse=True)
+        confs = np.array([p.confidence or -1 for p in preds], dtype=float)
+        inds = np.argsort(-confs, kind="stable")
 
         if max_preds is not None:
-            preds = preds[:max_preds]
+            inds = inds[:max_preds]
 
-        objects["preds"] = preds
+        preds = [preds[i] for i in inds]
 
-        # Sort ground truth so crowds are last
-        gts = sorted(gts, key=iscrowd)
+        # Rather than sorting ground truth so crowds are last, crowds are
+        # masked separately when matching
+        objects["preds"] = preds
+        objects["gt_crowds"] = np.array([iscrowd(g) for g in gts], dtype=bool)
+        objects["gt_labels"] = np.array([g.label for g in gts], dtype=object)
 
         # Compute ``num_preds x num_gts`` IoUs
-        ious = foui.compute_ious(preds, gts, **iou_kwargs)
-
-        gt_ids = [g.id for g in gts]
-        for pred, gt_ious in zip(preds, ious):
-            pred_ious[pred.id] = list(zip(gt_ids, gt_ious))
+        objects["ious"] = foui.compute_ious(preds, gts, **iou_kwargs)
 
-    return cats, pred_ious, iscrowd
+    return cats
 
 
-def _compute_matches(
-    cats, pred_ious, iou_thresh, iscrowd, eval_key, id_key, iou_key
-):
+def _compute_matches(cats, iou_thresh, eval_key, id_key, iou_key):
     matches = []
 
     # Match preds to GT, highest confidence first
-    for cat, objects in cats.items():
-        gt_map = {gt.id: gt for gt in objects["gts"]}
-
-        # Match each prediction to the highest available IoU ground truth
-        for pred in objects["preds"]:
-            if pred.id in pred_ious:
-                best_match = None
-                best_match_iou = iou_thresh
-                for gt_id, iou in pred_ious[pred.id]:
-                    gt = gt_map[gt_id]
-                    gt_iscrowd = iscrowd(gt)
-
-                    # Only iscrowd GTs can have multiple matches
-                    if gt[id_key] != _NO_MATCH_ID and not gt_iscrowd:
-                        continue
-
-                    # If matching classwise=False
-                    # Only objects with the same class can match a crowd
-                    if gt_iscrowd and gt.label != pred.label:
-                        continue
-
-                    # Crowds are last in order of GTs
-                    # If we already matched a non-crowd and are on a crowd,
-                    # then break
-                    if (
-                        best_match
-                        and not iscrowd(gt_map[best_match])
-                        and gt_iscrowd
-                    ):
-                        break
-
-                    if iou < best_match_iou:
-                        continue
-
-                    best_match_iou = iou
-                    best_match = gt_id
-
-                if best_match:
-                    gt = gt_map[best_match]
-
-                    # For crowd GTs, record info for first (highest confidence)
-                    # matching prediction on the GT object
-                    if gt[id_key] == _NO_MATCH_ID:
-                        gt[eval_key] = "tp" if gt.label == pred.label else "fn"
-                        gt[id_key] = pred.id
-                        gt[iou_key] = best_match_iou
-
-                    pred[eval_key] = "tp" if gt.label == pred.label else "fp"
-                    pred[id_key] = best_match
-                    pred[iou_key] = best_match_iou
-
-                    matches.append(
-                        (
-                            gt.label,
-                            pred.label,
-                            best_match_iou,
-                            pred.confidence,
-                            gt.id,
-                            pred.id,
-                            iscrowd(gt),
-                        )
-                    )
-                else:
-                    pred[eval_key] = "fp"
-                    matches.append(
-                        (
-                            None,
-                            pred.label,
-                            None,
-                            pred.confidence,
-                            None,
-                            pred.id,
-                            None,
-                        )
-                    )
+    for objects in cats.values():
+        gts = objects["gts"]
+        preds = objects["preds"]
+        ious = objects["ious"]
+        gt_crowds = objects["gt_crowds"]
+
+        pred_matches, gt_matches = _match_objects(
+            ious,
+            gt_crowds,
+            objects["gt_labels"],
+            [pred.label for pred in preds],
+            iou_thresh,
+        )
+
+        for i, (pred, j) in enumerate(zip(preds, pred_matches)):
+            if j >= 0:
+                gt = gts[j]
+                iou = ious[i, j]
 
-            elif pred.label == cat:
+                # For crowd GTs, record info for first (highest confidence)
+                # matching prediction on the GT object
+                if gt_matches[j] == i:
+                    gt[eval_key] = "tp" if gt.label == pred.label else "fn"
+                    gt[id_key] = pred.id
+                    gt[iou_key] = iou
+
+                pred[eval_key] = "tp" if gt.label == pred.label else "fp"
+                pred[id_key] = gt.id
+                pred[iou_key] = iou
+
+                matches.append(
+                    (
+                        gt.label,
+                        pred.label,
+                        iou,
+                        pred.confidence,
+                        gt.id,
+                        pred.id,
+                        bool(gt_crowds[j]),
+                    )
+                )
+            else:
                 pred[eval_key] = "fp"
                 matches.append(
                     (
@@ -634,75 +671,351 @@ def _compute_matches(
                 )
 
         # Leftover GTs are false negatives
-        for gt in objects["gts"]:
-            if gt[id_key] == _NO_MATCH_ID:
-                gt[eval_key] = "fn"
-                matches.append(
-                    (gt.label, None, None, None, gt.id, None, iscrowd(gt))
-                )
+        for j in np.flatnonzero(gt_matches < 0):
+            gt = gts[j]
+            gt[eval_key] = "fn"
+            matches.append(
+                (gt.label, None, None, None, gt.id, None, bool(gt_crowds[j]))
+            )
 
     return matches
 
 
-def _compute_pr_curves(samples, config, classes=None, progress=None):
-    gt_field = config.gt_field
-    pred_field = config.pred_field
-    iou_threshs = config.iou_threshs
+def _match_objects(ious, gt_crowds, gt_labels, pred_labels, iou_thresh):
+    # Returns the index of the GT matched to each prediction and the index of
+    # the first (highest confidence) prediction matched to each GT, or -1
+    num_preds, num_gts = ious.shape
+    pred_matches = np.full(num_preds, -1, dtype=int)
+    gt_matches = np.full(num_gts, -1, dtype=int)
+    gt_matched = np.zeros(num_gts, dtype=bool)
 
-    samples = samples.select_fields([gt_field, pred_field])
+    # Match each prediction to the highest available IoU ground truth
+    for i, (pred_ious, pred_label) in enumerate(zip(ious, pred_labels)):
+        candidates = pred_ious >= iou_thresh
 
-    gt_field, processing_frames = samples._handle_frame_field(gt_field)
-    pred_field, _ = samples._handle_frame_field(pred_field)
+        # Only iscrowd GTs can have multiple matches, and crowds are only
+        # considered if no non-crowd GT matches
+        best_match = _find_best_match(
+            pred_ious, candidates & ~gt_crowds & ~gt_matched
+        )
 
-    num_threshs = len(iou_threshs)
-    thresh_matches = [{} for _ in range(num_threshs)]
+        if best_match is None:
+            crowd_candidates = candidates & gt_crowds
+            if crowd_candidates.any():
+                # If matching classwise=False
+                # Only objects with the same class can match a crowd
+                crowd_candidates &= gt_labels == pred_label
+                best_match = _find_best_match(pred_ious, crowd_candidates)
 
-    if classes is None:
-        _classes = set()
+        if best_match is None:
+            continue
 
-    logger.info("Performing IoU sweep...")
-    for sample in samples.iter_samples(progress=progress):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
+        pred_matches[i] = best_match
+        if not gt_matched[best_match]:
+            gt_matched[best_match] = True
+            gt_matches[best_match] = i
 
-        for image in images:
-            # Don't edit user's data during sweep
-            gts = _copy_labels(image[gt_field])
-            preds = _copy_labels(image[pred_field])
+    return pred_matches, gt_matches
 
-            matches_list = _coco_evaluation_iou_sweep(gts, preds, config)
 
-            for idx, matches in enumerate(matches_list):
-                for match in matches:
-                    gt_label = match[0]
-                    pred_label = match[1]
-                    iscrowd = match[-1]
+def _find_best_match(ious, mask):
+    inds = np.flatnonzero(mask)
+    if inds.size == 0:
+        return None
 
-                    if classes is None:
-                        _classes.add(gt_label)
-                        _classes.add(pred_label)
+    # Ties are broken in favor of the last GT
+    _ious = ious[inds]
+    return inds[inds.size - 1 - np.argmax(_ious[::-1])]
+
+
+def _get_columnar_labels(samples, config):
+    _, gt_path = samples._get_label_field_path(config.gt_field)
+    _, pred_path = samples._get_label_field_path(config.pred_field)
+
+    (
+        gt_ids,
+        gt_labels,
+        gt_boxes,
+        gt_crowds,
+        gt_attr_crowds,
+        pred_ids,
+        pred_labels,
+        pred_boxes,
+        pred_confs,
+    ) = samples.values(
+        [
+            gt_path + ".id",
+            gt_path + ".label",
+            gt_path + ".bounding_box",
+            gt_path + "." + config.iscrowd,
+            gt_path + ".attributes." + config.iscrowd + ".value",
+            pred_path + ".id",
+            pred_path + ".label",
+            pred_path + ".bounding_box",
+            pred_path + ".confidence",
+        ]
+    )
 
-                    if iscrowd:
-                        continue
+    all_gts = [
+        _make_columns(
+            ids, labels, boxes, crowds=_merge_crowds(crowds, attr_crowds)
+        )
+        for ids, labels, boxes, crowds, attr_crowds in zip(
+            gt_ids, gt_labels, gt_boxes, gt_crowds, gt_attr_crowds
+        )
+    ]
+    all_preds = [
+        _make_columns(ids, labels, boxes, confs=confs)
+        for ids, labels, boxes, confs in zip(
+            pred_ids, pred_labels, pred_boxes, pred_confs
+        )
+    ]
 
-                    c = gt_label if gt_label is not None else pred_label
+    return all_gts, all_preds
 
-                    if c not in thresh_matches[idx]:
-                        thresh_matches[idx][c] = {
-                            "tp": [],
-                            "fp": [],
-                            "num_gt": 0,
-                        }
 
-                    if gt_label == pred_label:
-                        thresh_matches[idx][c]["tp"].append(match)
-                    elif pred_label:
-                        thresh_matches[idx][c]["fp"].append(match)
+def _merge_crowds(crowds, attr_crowds):
+    # Like get_attribute_value(), falls back to the legacy `attributes` dict
+    # for objects without a crowd attribute
+    if crowds is None or attr_crowds is None:
+        return crowds
+
+    return [a if c is None else c for c, a in zip(crowds, attr_crowds)]
+
+
+def _make_columns(ids, labels, boxes, crowds=None, confs=None):
+    if ids is None:
+        return None
+
+    num_objects = len(ids)
+
+    if crowds is None:
+        crowds = np.zeros(num_objects, dtype=bool)
+    else:
+        crowds = np.array([bool(c) for c in crowds], dtype=bool)
+
+    if confs is None:
+        confs = [None] * num_objects
+
+    return {
+        "ids": ids,
+        "labels": np.array(labels, dtype=object),
+        "boxes": np.array(boxes, dtype=float).reshape(-1, 4),
+        "crowds": crowds,
+        "confs": confs,
+    }
+
+
+def _coco_columnar_setup(gts, preds, config, max_preds=None):
+    # Organize ground truth and prediction indices by category, in the same
+    # order as _coco_evaluation_setup()
+    cats = defaultdict(lambda: defaultdict(list))
 
-                    if gt_label:
-                        thresh_matches[idx][c]["num_gt"] += 1
+    for key, columns in (("gts", gts), ("preds", preds)):
+        if columns is None:
+            continue
+
+        for idx, label in enumerate(columns["labels"]):
+            cat = label if config.classwise else "all"
+            cats[cat][key].append(idx)
+
+    if gts is None:
+        gts = _make_columns([], [], [])
+
+    if preds is None:
+        preds = _make_columns([], [], [])
+
+    # Compute IoUs within each category
+    for objects in cats.values():
+        gt_inds = np.array(objects["gts"], dtype=int)
+        pred_inds = np.array(objects["preds"], dtype=int)
+
+        # Highest confidence predictions first
+        confs = np.array(
+            [preds["confs"][i] or -1 for i in pred_inds], dtype=float
+        )
+        inds = np.argsort(-confs, kind="stable")
+
+        if max_preds is not None:
+            inds = inds[:max_preds]
+
+        pred_inds = pred_inds[inds]
+        gt_crowds = gts["crowds"][gt_inds]
+
+        objects["gt_inds"] = gt_inds
+        objects["pred_inds"] = pred_inds
+        objects["gt_crowds"] = gt_crowds
+        objects["gt_labels"] = gts["labels"][gt_inds]
+        objects["pred_labels"] = preds["labels"][pred_inds]
+
+        # Compute ``num_preds x num_gts`` IoUs
+        objects["ious"] = foui._compute_bbox_ious_array(
+            preds["boxes"][pred_inds],
+            gts["boxes"][gt_inds],
+            gt_crowds=gt_crowds,
+        )
+
+    return cats
+
+
+def _compute_columnar_matches(cats, gts, preds, iou_thresh):
+    num_gts = len(gts["ids"]) if gts is not None else 0
+    num_preds = len(preds["ids"]) if preds is not None else 0
+
+    gt_evals = [None] * num_gts
+    gt_eval_ids = [_NO_MATCH_ID] * num_gts
+    gt_eval_ious = [_NO_MATCH_IOU] * num_gts
+    pred_evals = [None] * num_preds
+    pred_eval_ids = [_NO_MATCH_ID] * num_preds
+    pred_eval_ious = [_NO_MATCH_IOU] * num_preds
+
+    matches = []
+
+    # Match preds to GT, highest confidence first
+    for objects in cats.values():
+        gt_inds = objects["gt_inds"]
+        pred_inds = objects["pred_inds"]
+        ious = objects["ious"]
+        gt_crowds = objects["gt_crowds"]
+        gt_labels = objects["gt_labels"]
+        pred_labels = objects["pred_labels"]
+
+        pred_matches, gt_matches = _match_objects(
+            ious, gt_crowds, gt_labels, pred_labels, iou_thresh
+        )
+
+        for i, (pidx, j) in enumerate(zip(pred_inds, pred_matches)):
+            pred_label = pred_labels[i]
+            pred_id = preds["ids"][pidx]
+            pred_conf = preds["confs"][pidx]
+
+            if j >= 0:
+                gidx = gt_inds[j]
+                gt_label = gt_labels[j]
+                gt_id = gts["ids"][gidx]
+                iou = ious[i, j]
+
+                # For crowd GTs, record info for first (highest confidence)
+                # matching prediction on the GT object
+                if gt_matches[j] == i:
+                    gt_evals[gidx] = "tp" if gt_label == pred_label else "fn"
+                    gt_eval_ids[gidx] = pred_id
+                    gt_eval_ious[gidx] = float(iou)
+
+                pred_evals[pidx] = "tp" if gt_label == pred_label else "fp"
+                pred_eval_ids[pidx] = gt_id
+                pred_eval_ious[pidx] = float(iou)
+
+                matches.append(
+                    (
+                        gt_label,
+                        pred_label,
+                        iou,
+                        pred_conf,
+                        gt_id,
+                        pred_id,
+                        bool(gt_crowds[j]),
+                    )
+                )
+            else:
+                pred_evals[pidx] = "fp"
+                matches.append(
+                    (None, pred_label, None, pred_conf, None, pred_id, None)
+                )
+
+        # Leftover GTs are false negatives
+        for j in np.flatnonzero(gt_matches < 0):
+            gidx = gt_inds[j]
+            gt_evals[gidx] = "fn"
+            matches.append(
+                (
+                    gt_labels[j],
+                    None,
+                    None,
+                    None,
+                    gts["ids"][gidx],
+                    None,
+                    bool(gt_crowds[j]),
+                )
+            )
+
+    if gts is not None:
+        gt_result = (gt_evals, gt_eval_ids, gt_eval_ious)
+    else:
+        gt_result = None
+
+    if preds is not None:
+        pred_result = (pred_evals, pred_eval_ids, pred_eval_ious)
+    else:
+        pred_result = None
+
+    return matches, gt_result, pred_result
+
+
+def _write_columnar_results(
+    samples, config, eval_key, gt_results, pred_results
+):
+    id_key = "%s_id" % eval_key
+    iou_key = "%s_iou" % eval_key
+
+    for field, results in (
+        (config.gt_field, gt_results),
+        (config.pred_field, pred_results),
+    ):
+        _, path = samples._get_label_field_path(field)
+
+        for idx, key in enumerate((eval_key, id_key, iou_key)):
+            values = [r[idx] if r is not None else None for r in results]
+            samples.set_values(path + "." + key, values)
+
+
+def _compute_pr_curves(
+    samples, config, classes=None, progress=None, columnar=False
+):
+    iou_threshs = config.iou_threshs
+
+    num_threshs = len(iou_threshs)
+    thresh_matches = [{} for _ in range(num_threshs)]
+
+    if classes is None:
+        _classes = set()
+
+    logger.info("Performing IoU sweep...")
+    if columnar:
+        matches_iter = _iter_columnar_iou_sweep(samples, config, progress)
+    else:
+        matches_iter = _iter_iou_sweep(samples, config, progress)
+
+    for matches_list in matches_iter:
+        for idx, matches in enumerate(matches_list):
+            for match in matches:
+                gt_label = match[0]
+                pred_label = match[1]
+                iscrowd = match[-1]
+
+                if classes is None:
+                    _classes.add(gt_label)
+                    _classes.add(pred_label)
+
+                if iscrowd:
+                    continue
+
+                c = gt_label if gt_label is not None else pred_label
+
+                if c not in thresh_matches[idx]:
+                    thresh_matches[idx][c] = {
+                        "tp": [],
+                        "fp": [],
+                        "num_gt": 0,
+                    }
+
+                if gt_label == pred_label:
+                    thresh_matches[idx][c]["tp"].append(match)
+                elif pred_label:
+                    thresh_matches[idx][c]["fp"].append(match)
+
+                if gt_label:
+                    thresh_matches[idx][c]["num_gt"] += 1
 
     if classes is None:
         _classes.discard(None)
@@ -767,6 +1080,43 @@ def _compute_pr_curves(samples, config, classes=None, progress=None):
     return precision, recall, thresholds, iou_threshs, classes
 
 
+def _iter_iou_sweep(samples, config, progress):
+    gt_field = config.gt_field
+    pred_field = config.pred_field
+
+    samples = samples.select_fields([gt_field, pred_field])
+
+    gt_field, processing_frames = samples._handle_frame_field(gt_field)
+    pred_field, _ = samples._handle_frame_field(pred_field)
+
+    for sample in samples.iter_samples(progress=progress):
+        if processing_frames:
+            images = sample.frames.values()
+        else:
+            images = [sample]
+
+        for image in images:
+            # Don't edit user's data during sweep
+            gts = _copy_labels(image[gt_field])
+            preds = _copy_labels(image[pred_field])
+
+            yield _coco_evaluation_iou_sweep(gts, preds, config)
+
+
+def _iter_columnar_iou_sweep(samples, config, progress):
+    all_gts, all_preds = _get_columnar_labels(samples, config)
+
+    with fou.ProgressBar(total=len(all_gts), progress=progress) as pb:
+        for gts, preds in pb(zip(all_gts, all_preds)):
+            cats = _coco_columnar_setup(
+                gts, preds, config, max_preds=config.max_preds
+            )
+            yield [
+                _compute_columnar_matches(cats, gts, preds, iou_thresh)[0]
+                for iou_thresh in config.iou_threshs
+            ]
+
+
 def _copy_labels(labels):
     if labels is None:
         return None
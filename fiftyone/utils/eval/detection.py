@@ -18,6 +18,7 @@ import fiftyone as fo
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.odm as foo
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
@@ -26,6 +27,8 @@ from .base import BaseEvaluationResults
 
 logger = logging.getLogger(__name__)
 
+_MAX_SHARD_SIZE = 10000
+
 
 def evaluate_detections(
     samples,
@@ -41,6 +44,8 @@ def evaluate_detections(
     classwise=True,
     dynamic=True,
     progress=None,
+    num_workers=None,
+    columnar=False,
     **kwargs,
 ):
     """Evaluates the predicted detections in the given samples with respect to
@@ -135,6 +140,20 @@ def evaluate_detections(
         progress (None): whether to render a progress bar (True/False), use the
             default value ``fiftyone.config.show_progress_bars`` (None), or a
             progress callback function to invoke instead
+        num_workers (None): a number of worker processes to use. If a value
+            greater than 1 is provided, the collection is split into shards of
+            contiguous sample IDs that are evaluated in parallel. Patches,
+            frames, and clips views are always evaluated in the main process.
+            By default, all samples are evaluated in the main process
+        columnar (False): whether to load and write the objects' attributes
+            in bulk via
+            :meth:`values() <fiftyone.core.collections.SampleCollection.values>`
+            and
+            :meth:`set_values() <fiftyone.core.collections.SampleCollection.set_values>`
+            rather than iterating over :class:`fiftyone.core.sample.Sample`
+            instances. Only supported by evaluation methods whose
+            :meth:`DetectionEvaluation.can_evaluate_samples` returns True for
+            the collection
         **kwargs: optional keyword arguments for the constructor of the
             :class:`DetectionEvaluationConfig` being used
 
@@ -170,10 +189,80 @@ def evaluate_detections(
     eval_method = config.build()
     eval_method.ensure_requirements()
 
+    if columnar and not eval_method.can_evaluate_samples(samples):
+        raise ValueError(
+            "Evaluation method '%s' does not support columnar evaluation of "
+            "fields '%s' and '%s'" % (config.method, pred_field, gt_field)
+        )
+
     eval_method.register_run(samples, eval_key)
     eval_method.register_samples(samples, eval_key, dynamic=dynamic)
 
     processing_frames = samples._is_frame_field(pred_field)
+
+    # Columnar evaluation only loads the label attributes that it needs, and
+    # it must be able to write the sample-level TP/FP/FN fields
+    if config.requires_additional_fields or columnar:
+        _samples = samples
+    else:
+        _samples = samples.select_fields([gt_field, pred_field])
+
+    # Workers rebuild their shards from the root dataset, which is not
+    # possible for generated collections such as patches, frames, and clips
+    if samples._is_generated:
+        num_workers = None
+
+    if num_workers is not None:
+        num_workers = fou.recommend_process_pool_workers(num_workers)
+
+    logger.info("Evaluating detections...")
+    if num_workers is not None and num_workers > 1:
+        matches = _evaluate_detections_multi(
+            _samples,
+            eval_method,
+            eval_key,
+            processing_frames,
+            num_workers,
+            columnar=columnar,
+            progress=progress,
+        )
+    else:
+        matches = _evaluate_detections_single(
+            _samples,
+            eval_method,
+            eval_key,
+            processing_frames,
+            columnar=columnar,
+            progress=progress,
+        )
+
+    results = eval_method.generate_results(
+        samples,
+        matches,
+        eval_key=eval_key,
+        classes=classes,
+        missing=missing,
+        progress=progress,
+        columnar=columnar,
+    )
+    eval_method.save_run_results(samples, eval_key, results)
+
+    return results
+
+
+def _evaluate_detections_single(
+    samples,
+    eval_method,
+    eval_key,
+    processing_frames,
+    columnar=False,
+    progress=None,
+):
+    if columnar:
+        return _evaluate_detections_columnar(
+            samples, eval_method, eval_key, progress=progress
+        )
+
     save = eval_key is not None
 
     if save:
@@ -181,14 +270,8 @@ def evaluate_detections(
         fp_field = "%s_fp" % eval_key
         fn_field = "%s_fn" % eval_key
 
-    if config.requires_additional_fields:
-        _samples = samples
-    else:
-        _samples = samples.select_fields([gt_field, pred_field])
-
     matches = []
-    logger.info("Evaluating detections...")
-    for sample in _samples.iter_samples(progress=progress, autosave=save):
+    for sample in samples.iter_samples(progress=progress, autosave=save):
         if processing_frames:
             docs = sample.frames.values()
         else:
@@ -215,17 +298,114 @@ def evaluate_detections(
             sample[fp_field] = sample_fp
             sample[fn_field] = sample_fn
 
-    results = eval_method.generate_results(
+    return matches
+
+
+def _evaluate_detections_columnar(
+    samples, eval_method, eval_key, progress=None
+):
+    sample_matches = eval_method.evaluate_samples(
+        samples, eval_key=eval_key, progress=progress
+    )
+
+    if eval_key is not None and sample_matches:
+        tps, fps, fns = zip(*[_tally_matches(m) for m in sample_matches])
+        samples.set_values("%s_tp" % eval_key, list(tps))
+        samples.set_values("%s_fp" % eval_key, list(fps))
+        samples.set_values("%s_fn" % eval_key, list(fns))
+
+    return list(itertools.chain.from_iterable(sample_matches))
+
+
+def _evaluate_detections_multi(
+    samples,
+    eval_method,
+    eval_key,
+    processing_frames,
+    num_workers,
+    columnar=False,
+    progress=None,
+):
+    dataset_name = samples._root_dataset.name
+    view_stages = samples.view()._serialize()
+
+    # Split the collection into shards of contiguous sample IDs so that each
+    # worker can efficiently select its shard via the `_id` index
+    sample_ids = sorted(samples.values("_id"))
+    num_samples = len(sample_ids)
+    num_shards = min(
+        num_samples,
+        max(num_workers, int(np.ceil(num_samples / _MAX_SHARD_SIZE))),
+    )
+    edges = [
+        int(round(b)) for b in np.linspace(0, num_samples, num_shards + 1)
+    ]
+    bounds = list(zip(edges[:-1], edges[1:]))
+
+    inputs = [
+        (
+            dataset_name,
+            view_stages,
+            eval_method,
+            eval_key,
+            processing_frames,
+            columnar,
+            sample_ids[start],
+            sample_ids[stop - 1],
+        )
+        for start, stop in bounds
+    ]
+
+    # Shards are merged in ID order regardless of completion order
+    shard_matches = [None] * len(inputs)
+
+    with fou.ProgressBar(total=num_samples, progress=progress) as pb:
+        with fou.get_multiprocessing_context().Pool(
+            processes=num_workers,
+            initializer=foo.database.reset_connection,
+        ) as pool:
+            for idx, matches in pool.imap_unordered(
+                _evaluate_shard, enumerate(inputs)
+            ):
+                shard_matches[idx] = matches
+                start, stop = bounds[idx]
+                pb.update(count=stop - start)
+
+    # Workers wrote their results directly to the database, so any in-memory
+    # samples must be reloaded
+    samples._dataset._reload_docs()
+
+    return list(itertools.chain.from_iterable(shard_matches))
+
+
+def _evaluate_shard(args):
+    idx, (
+        dataset_name,
+        view_stages,
+        eval_method,
+        eval_key,
+        processing_frames,
+        columnar,
+        first_id,
+        last_id,
+    ) = args
+
+    # Each worker connects to the database anew (see the pool initializer)
+    # and writes its shard's evaluation results via its own batched writes
+    dataset = fo.load_dataset(dataset_name)
+    samples = fo.DatasetView._build(dataset, view_stages)
+    samples = samples.match({"_id": {"$gte": first_id, "$lte": last_id}})
+
+    matches = _evaluate_detections_single(
         samples,
-        matches,
-        eval_key=eval_key,
-        classes=classes,
-        missing=missing,
-        progress=progress,
+        eval_method,
+        eval_key,
+        processing_frames,
+        columnar=columnar,
+        progress=False,
     )
-    eval_method.save_run_results(samples, eval_key, results)
 
-    return results
+    return idx, matches
 
 
 class DetectionEvaluationConfig(foe.EvaluationMethodConfig):
@@ -368,6 +548,41 @@ class DetectionEvaluation(foe.EvaluationMethod):
         """
         raise NotImplementedError("subclass must implement evaluate()")
 
+    def can_evaluate_samples(self, samples):
+        """Whether this method supports columnar evaluation of the given
+        collection via :meth:`evaluate_samples`.
+
+        Args:
+            samples: a :class:`fiftyone.core.collections.SampleCollection`
+
+        Returns:
+            True/False
+        """
+        return False
+
+    def evaluate_samples(self, samples, eval_key=None, progress=None):
+        """Evaluates the ground truth and predictions in all samples of the
+        given collection in a columnar fashion.
+
+        Unlike :meth:`evaluate`, implementations should load and write the
+        object attributes that they require in bulk, and they must populate
+        the same object-level fields as :meth:`evaluate` if an ``eval_key``
+        is provided.
+
+        Args:
+            samples: a :class:`fiftyone.core.collections.SampleCollection`
+            eval_key (None): the evaluation key for this evaluation
+            progress (None): whether to render a progress bar (True/False), use
+                the default value ``fiftyone.config.show_progress_bars``
+                (None), or a progress callback function to invoke instead
+
+        Returns:
+            a list containing, for each sample, a list of matched
+            ``(gt_label, pred_label, iou, pred_confidence, gt_id, pred_id)``
+            tuples
+        """
+        raise NotImplementedError("subclass must implement evaluate_samples()")
+
     def generate_results(
         self,
         samples,
@@ -376,6 +591,7 @@ class DetectionEvaluation(foe.EvaluationMethod):
         classes=None,
         missing=None,
         progress=None,
+        columnar=False,
     ):
         """Generates aggregate evaluation results for the samples.
 
@@ -397,6 +613,9 @@ class DetectionEvaluation(foe.EvaluationMethod):
             progress (None): whether to render a progress bar (True/False), use
                 the default value ``fiftyone.config.show_progress_bars``
                 (None), or a progress callback function to invoke instead
+            columnar (False): whether ``matches`` were generated via
+                :meth:`evaluate_samples`, in which case any additional
+                computations should also be performed in columnar fashion
 
         Returns:
             a :class:`DetectionResults`
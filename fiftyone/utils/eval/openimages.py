@@ -226,6 +226,7 @@ class OpenImagesEvaluation(DetectionEvaluation):
         classes=None,
         missing=None,
         progress=None,
+        columnar=False,
     ):
         """Generates aggregate evaluation results for the samples.
 
@@ -247,6 +248,8 @@ class OpenImagesEvaluation(DetectionEvaluation):
             progress (None): whether to render a progress bar (True/False), use
                 the default value ``fiftyone.config.show_progress_bars``
                 (None), or a progress callback function to invoke instead
+            columnar (False): whether ``matches`` were generated via
+                :meth:`evaluate_samples`
 
         Returns:
             a :class:`OpenImagesDetectionResults`
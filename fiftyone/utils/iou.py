@@ -502,9 +502,74 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
             gts = _polylines_to_detections(gts)
 
     if _get_bbox_dim(gts[0]) == 3:
-        bbox_iou_fcn = compute_cuboid_iou
+        return _compute_cuboid_ious(
+            preds, gts, gt_crowds, is_symmetric, classwise
+        )
+
+    pred_boxes = _get_bbox_array(preds)
+    if is_symmetric:
+        gt_boxes = pred_boxes
+    else:
+        gt_boxes = _get_bbox_array(gts)
+
+    if classwise:
+        pred_labels = [pred.label for pred in preds]
+        if is_symmetric:
+            gt_labels = pred_labels
+        else:
+            gt_labels = [gt.label for gt in gts]
     else:
-        bbox_iou_fcn = compute_bbox_iou
+        pred_labels = None
+        gt_labels = None
+
+    ious = _compute_bbox_ious_array(
+        pred_boxes,
+        gt_boxes,
+        gt_crowds=gt_crowds,
+        pred_labels=pred_labels,
+        gt_labels=gt_labels,
+    )
+
+    if is_symmetric:
+        _symmetrize_ious(ious)
+
+    return ious
+
+
+def _compute_cuboid_ious(preds, gts, gt_crowds, is_symmetric, classwise):
+    # When all cuboids are rotated about the same axis, their IoUs can be
+    # computed in batch
+    axis = _get_cuboid_rotation_axis(preds if is_symmetric else preds + gts)
+    if axis is not None:
+        pred_cuboids = _get_cuboid_array(preds, axis)
+        if is_symmetric:
+            gt_cuboids = pred_cuboids
+        else:
+            gt_cuboids = _get_cuboid_array(gts, axis)
+
+        if classwise:
+            pred_labels = [pred.label for pred in preds]
+            if is_symmetric:
+                gt_labels = pred_labels
+            else:
+                gt_labels = [gt.label for gt in gts]
+        else:
+            pred_labels = None
+            gt_labels = None
+
+        ious = _compute_cuboid_ious_array(
+            pred_cuboids,
+            gt_cuboids,
+            axis=axis,
+            gt_crowds=gt_crowds,
+            pred_labels=pred_labels,
+            gt_labels=gt_labels,
+        )
+
+        if is_symmetric:
+            _symmetrize_ious(ious)
+
+        return ious
 
     ious = np.zeros((len(preds), len(gts)))
 
@@ -518,13 +583,296 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
             elif classwise and pred.label != gt.label:
                 continue
             else:
-                iou = bbox_iou_fcn(gt, pred, gt_crowd=gt_crowd)
+                iou = compute_cuboid_iou(gt, pred, gt_crowd=gt_crowd)
 
             ious[i, j] = iou
 
     return ious
 
 
+def _get_bbox_array(detections):
+    return np.array(
+        [detection.bounding_box for detection in detections], dtype=float
+    ).reshape(-1, 4)
+
+
+def _compute_bbox_ious_array(
+    pred_boxes, gt_boxes, gt_crowds=None, pred_labels=None, gt_labels=None
+):
+    """Computes the pairwise IoUs between the given arrays of bounding boxes.
+
+    The result for each pair is identical to :func:`compute_bbox_iou`.
+
+    Args:
+        pred_boxes: a ``num_preds x 4`` array of ``[x, y, w, h]`` boxes
+        gt_boxes: a ``num_gts x 4`` array of ``[x, y, w, h]`` boxes
+        gt_crowds (None): an optional boolean array of length ``num_gts``
+            indicating which ground truth objects are crowds
+        pred_labels (None): an optional list of predicted labels. If both
+            ``pred_labels`` and ``gt_labels`` are provided, objects with
+            different labels are considered non-overlapping
+        gt_labels (None): an optional list of ground truth labels
+
+    Returns:
+        a ``num_preds x num_gts`` array of IoUs
+    """
+    pred_boxes = np.asarray(pred_boxes, dtype=float).reshape(-1, 4)
+    gt_boxes = np.asarray(gt_boxes, dtype=float).reshape(-1, 4)
+
+    px, py, pw, ph = (c[:, np.newaxis] for c in pred_boxes.T)
+    gx, gy, gw, gh = (c[np.newaxis, :] for c in gt_boxes.T)
+
+    pred_areas = ph * pw
+    gt_areas = gh * gw
+
+    # Width and height of intersection
+    w = np.minimum(px + pw, gx + gw) - np.maximum(px, gx)
+    h = np.minimum(py + ph, gy + gh) - np.maximum(py, gy)
+    overlaps = (w > 0) & (h > 0)
+
+    inter = np.where(overlaps, h * w, 0.0)
+    union = pred_areas + gt_areas - inter
+
+    if gt_crowds is not None:
+        gt_crowds = np.asarray(gt_crowds, dtype=bool)[np.newaxis, :]
+        union = np.where(gt_crowds, pred_areas, union)
+
+    if pred_labels is not None and gt_labels is not None:
+        pred_labels = np.array(pred_labels, dtype=object)[:, np.newaxis]
+        gt_labels = np.array(gt_labels, dtype=object)[np.newaxis, :]
+        overlaps &= pred_labels == gt_labels
+
+    valid = overlaps & (union != 0)
+
+    ious = np.zeros(overlaps.shape)
+    ious[valid] = np.minimum(inter[valid] / union[valid], 1)
+
+    return ious
+
+
+def _get_cuboid_rotation_axis(detections):
+    # Returns the axis about which all of the cuboids are rotated, or None if
+    # they are not all rotated about the same axis
+    rotations = [detection.rotation for detection in detections]
+    if any(len(r) != 3 for r in rotations):
+        return None
+
+    rotations = np.asarray(rotations, dtype=float).reshape(-1, 3)
+    axes = np.flatnonzero(np.any(rotations != 0, axis=0))
+
+    if len(axes) == 0:
+        return 2
+
+    if len(axes) == 1:
+        return axes[0]
+
+    return None
+
+
+def _get_cuboid_array(detections, axis):
+    return np.array(
+        [
+            list(detection.location)
+            + list(detection.dimensions)
+            + [detection.rotation[axis]]
+            for detection in detections
+        ],
+        dtype=float,
+    ).reshape(-1, 7)
+
+
+def _compute_cuboid_ious_array(
+    pred_cuboids,
+    gt_cuboids,
+    axis=2,
+    gt_crowds=None,
+    pred_labels=None,
+    gt_labels=None,
+    batch_size=100000,
+):
+    """Computes the pairwise IoUs between the given arrays of cuboids that
+    are rotated about a common axis.
+
+    The result for each pair is equivalent to :func:`compute_cuboid_iou`.
+
+    Args:
+        pred_cuboids: a ``num_preds x 7`` array of
+            ``[x, y, z, dx, dy, dz, theta]`` cuboids, where ``(x, y, z)`` is
+            the center, ``(dx, dy, dz)`` are the dimensions, and ``theta`` is
+            the counter-clockwise rotation in radians about ``axis``
+        gt_cuboids: a ``num_gts x 7`` array of cuboids
+        axis (2): the axis about which the cuboids are rotated
+        gt_crowds (None): an optional boolean array of length ``num_gts``
+            indicating which ground truth objects are crowds
+        pred_labels (None): an optional list of predicted labels. If both
+            ``pred_labels`` and ``gt_labels`` are provided, objects with
+            different labels are considered non-overlapping
+        gt_labels (None): an optional list of ground truth labels
+        batch_size (100000): the maximum number of candidate pairs whose
+            intersections are computed at once
+
+    Returns:
+        a ``num_preds x num_gts`` array of IoUs
+    """
+    pred_cuboids = np.asarray(pred_cuboids, dtype=float).reshape(-1, 7)
+    gt_cuboids = np.asarray(gt_cuboids, dtype=float).reshape(-1, 7)
+
+    # Project onto the plane perpendicular to `axis`, preserving handedness
+    dims = [(axis + 1) % 3, (axis + 2) % 3, axis]
+
+    pred_centers = pred_cuboids[:, dims]
+    pred_sizes = pred_cuboids[:, [d + 3 for d in dims]]
+    gt_centers = gt_cuboids[:, dims]
+    gt_sizes = gt_cuboids[:, [d + 3 for d in dims]]
+
+    pred_volumes = np.prod(pred_sizes, axis=1)[:, np.newaxis]
+    gt_volumes = np.prod(gt_sizes, axis=1)[np.newaxis, :]
+
+    # Overlap along the rotation axis
+    pz, pdz = pred_centers[:, 2:], pred_sizes[:, 2:]
+    gz, gdz = gt_centers[:, 2].T, gt_sizes[:, 2].T
+    h = np.minimum(pz + 0.5 * pdz, gz + 0.5 * gdz) - np.maximum(
+        pz - 0.5 * pdz, gz - 0.5 * gdz
+    )
+
+    # Only compute intersections of cuboids whose bounding circles overlap
+    pred_radii = 0.5 * np.linalg.norm(pred_sizes[:, :2], axis=1)
+    gt_radii = 0.5 * np.linalg.norm(gt_sizes[:, :2], axis=1)
+    dists = sp.distance.cdist(pred_centers[:, :2], gt_centers[:, :2])
+    overlaps = (h > 0) & (
+        dists < pred_radii[:, np.newaxis] + gt_radii[np.newaxis, :]
+    )
+
+    if pred_labels is not None and gt_labels is not None:
+        pred_labels = np.array(pred_labels, dtype=object)[:, np.newaxis]
+        gt_labels = np.array(gt_labels, dtype=object)[np.newaxis, :]
+        overlaps &= pred_labels == gt_labels
+
+    pred_rects = _get_rotated_rects(
+        pred_centers[:, :2], pred_sizes[:, :2], pred_cuboids[:, 6]
+    )
+    gt_rects = _get_rotated_rects(
+        gt_centers[:, :2], gt_sizes[:, :2], gt_cuboids[:, 6]
+    )
+
+    inds = np.nonzero(overlaps)
+    areas = np.empty(len(inds[0]))
+    for start in range(0, len(areas), batch_size):
+        i = inds[0][start : start + batch_size]
+        j = inds[1][start : start + batch_size]
+        areas[start : start + batch_size] = _compute_rect_intersection_areas(
+            pred_rects[i], gt_rects[j]
+        )
+
+    inter = np.zeros(overlaps.shape)
+    inter[inds] = areas * h[inds]
+
+    union = pred_volumes + gt_volumes - inter
+
+    if gt_crowds is not None:
+        gt_crowds = np.asarray(gt_crowds, dtype=bool)[np.newaxis, :]
+        union = np.where(gt_crowds, pred_volumes, union)
+
+    valid = (inter > 0) & (union != 0)
+
+    ious = np.zeros(overlaps.shape)
+    ious[valid] = np.minimum(inter[valid] / union[valid], 1)
+
+    return ious
+
+
+def _get_rotated_rects(centers, sizes, thetas):
+    # Returns a `num x 4 x 2` array of the counter-clockwise corners of the
+    # given rotated rectangles
+    half = 0.5 * sizes[:, np.newaxis, :]
+    signs = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]])
+    corners = signs[np.newaxis] * half
+
+    cos = np.cos(thetas)[:, np.newaxis]
+    sin = np.sin(thetas)[:, np.newaxis]
+    x = corners[..., 0] * cos - corners[..., 1] * sin
+    y = corners[..., 0] * sin + corners[..., 1] * cos
+
+    return np.stack([x, y], axis=-1) + centers[:, np.newaxis, :]
+
+
+def _compute_rect_intersection_areas(rects1, rects2, eps=1e-9):
+    # Computes the intersection areas of the given pairs of `num x 4 x 2`
+    # counter-clockwise convex quadrilaterals. The vertices of each
+    # intersection polygon are the corners of each quadrilateral that lie
+    # inside the other, plus the intersections of their edges
+    origin = rects1.mean(axis=1, keepdims=True)
+    rects1 = rects1 - origin
+    rects2 = rects2 - origin
+
+    def _cross(u, v):
+        return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+    def _inside(points, rects):
+        # `points` is `num x k x 2`; returns a `num x k` mask
+        edges = np.roll(rects, -1, axis=1) - rects
+        rel = points[:, :, np.newaxis, :] - rects[:, np.newaxis, :, :]
+        return np.all(_cross(edges[:, np.newaxis], rel) >= -eps, axis=2)
+
+    # Edge-edge intersections
+    p = rects1[:, :, np.newaxis, :]
+    r = (np.roll(rects1, -1, axis=1) - rects1)[:, :, np.newaxis, :]
+    q = rects2[:, np.newaxis, :, :]
+    s = (np.roll(rects2, -1, axis=1) - rects2)[:, np.newaxis, :, :]
+
+    denom = _cross(r, s)
+    parallel = np.abs(denom) < eps
+    denom = np.where(parallel, 1.0, denom)
+    t = _cross(q - p, s) / denom
+    u = _cross(q - p, r) / denom
+    crossings = p + t[..., np.newaxis] * r
+    crossings_valid = (
+        ~parallel & (t >= -eps) & (t <= 1 + eps) & (u >= -eps) & (u <= 1 + eps)
+    )
+
+    num = len(rects1)
+    points = np.concatenate(
+        [rects1, rects2, crossings.reshape(num, 16, 2)], axis=1
+    )
+    valid = np.concatenate(
+        [
+            _inside(rects1, rects2),
+            _inside(rects2, rects1),
+            crossings_valid.reshape(num, 16),
+        ],
+        axis=1,
+    )
+
+    # Sort the vertices of each polygon by angle about their centroid,
+    # replacing invalid vertices with the first valid vertex so that they
+    # contribute no area
+    counts = valid.sum(axis=1)
+    centroids = (
+        np.einsum("nk,nkd->nd", valid, points)
+        / np.maximum(counts, 1)[:, np.newaxis]
+    )
+    rel = points - centroids[:, np.newaxis, :]
+    angles = np.where(valid, np.arctan2(rel[..., 1], rel[..., 0]), np.inf)
+    order = np.argsort(angles, axis=1)
+    points = np.take_along_axis(points, order[..., np.newaxis], axis=1)
+    valid = np.take_along_axis(valid, order, axis=1)
+    points = np.where(valid[..., np.newaxis], points, points[:, :1, :])
+
+    # Shoelace formula
+    areas = 0.5 * _cross(points, np.roll(points, -1, axis=1)).sum(axis=1)
+    areas[counts < 3] = 0
+
+    return np.abs(areas)
+
+
+def _symmetrize_ious(ious):
+    # Objects are compared against themselves, so mirror the lower triangle
+    # and define self-IoUs to be 1
+    inds = np.triu_indices_from(ious, k=1)
+    ious[inds] = ious.T[inds]
+    np.fill_diagonal(ious, 1)
+
+
 def _compute_polygon_ious(
     preds,
     gts,
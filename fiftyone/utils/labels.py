@@ -5,12 +5,14 @@ Label utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import numpy as np
+
 import eta.core.utils as etau
 
+import fiftyone.core.dataset as fod
 import fiftyone.core.labels as fol
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
-import fiftyone.utils.iou as foui
 
 
 def objects_to_segmentations(
@@ -692,6 +694,7 @@ def perform_nms(
     iou_thresh=0.5,
     confidence_thresh=None,
     classwise=True,
+    batch_size=1000,
     progress=None,
 ):
     """Performs non-maximum suppression (NMS) on the specified
@@ -718,6 +721,8 @@ def perform_nms(
             lower than this threshold will be discarded
         classwise (True): whether to treat each class ``label`` separately
             (True) or suppress all detections jointly (False)
+        batch_size (1000): the number of samples to read from and write to the
+            database at a time
         progress (None): whether to render a progress bar (True/False), use the
             default value ``fiftyone.config.show_progress_bars`` (None), or a
             progress callback function to invoke instead
@@ -730,11 +735,104 @@ def perform_nms(
     if out_field is None:
         out_field = in_field
 
-    samples = sample_collection.select_fields(in_field)
-    in_field, processing_frames = samples._handle_frame_field(in_field)
-    out_field, _ = samples._handle_frame_field(out_field)
+    in_field, processing_frames = sample_collection._handle_frame_field(
+        in_field
+    )
+    out_field, _ = sample_collection._handle_frame_field(out_field)
 
-    for sample in samples.iter_samples(autosave=True, progress=progress):
+    if processing_frames:
+        prefix = sample_collection._FRAMES_PREFIX
+    else:
+        prefix = ""
+
+    nms_kwargs = dict(
+        iou_thresh=iou_thresh,
+        confidence_thresh=confidence_thresh,
+        classwise=classwise,
+    )
+
+    if _has_filtered_detections(
+        sample_collection, (in_field, out_field), processing_frames
+    ):
+        # Writing back values by ID would only update the visible detections
+        # of the filtered label lists, rather than deleting suppressed ones,
+        # so the samples themselves must be saved
+        _perform_nms_samples(
+            sample_collection,
+            in_field,
+            out_field,
+            processing_frames,
+            batch_size,
+            progress,
+            nms_kwargs,
+        )
+        return
+
+    # Operate on raw label dicts so that only the detections that survive NMS
+    # are ever deserialized, and stream them so that only one batch of
+    # samples is held in memory at a time
+    chunks = sample_collection.iter_values(
+        ["id", prefix + in_field + ".detections"],
+        batch_size=batch_size,
+        _raw=True,
+    )
+
+    with fou.ProgressBar(
+        total=len(sample_collection), progress=progress
+    ) as pb:
+        for ids, all_detections in chunks:
+            values = {}
+            for sample_id, detections in zip(ids, all_detections):
+                if processing_frames:
+                    if detections is not None:
+                        values[sample_id] = [
+                            _perform_nms_dicts(d, **nms_kwargs)
+                            for d in detections
+                        ]
+                else:
+                    values[sample_id] = _perform_nms_dicts(
+                        detections, **nms_kwargs
+                    )
+
+                pb.update()
+
+            if values:
+                sample_collection.set_values(
+                    prefix + out_field, values, key_field="id", skip_none=True
+                )
+
+
+def _has_filtered_detections(sample_collection, fields, processing_frames):
+    if isinstance(sample_collection, fod.Dataset):
+        return False
+
+    filtered_fields = sample_collection._get_filtered_fields(
+        frames=processing_frames
+    )
+    if not filtered_fields:
+        return False
+
+    return any(f + ".detections" in filtered_fields for f in fields)
+
+
+def _perform_nms_samples(
+    sample_collection,
+    in_field,
+    out_field,
+    processing_frames,
+    batch_size,
+    progress,
+    nms_kwargs,
+):
+    samples = sample_collection.select_fields(
+        sample_collection._FRAMES_PREFIX + in_field
+        if processing_frames
+        else in_field
+    )
+
+    for sample in samples.iter_samples(
+        autosave=True, batch_size=batch_size, progress=progress
+    ):
         if processing_frames:
             images = sample.frames.values()
         else:
@@ -743,48 +841,123 @@ def perform_nms(
         for image in images:
             detections = image[in_field]
             if detections is not None:
-                _detections = detections.detections.copy()
-                nms_detections = _perform_nms(
-                    _detections,
-                    iou_thresh=iou_thresh,
-                    confidence_thresh=confidence_thresh,
-                    classwise=classwise,
+                image[out_field] = _perform_nms_dicts(
+                    [d.to_dict() for d in detections.detections],
+                    **nms_kwargs,
                 )
-                image[out_field] = fol.Detections(detections=nms_detections)
 
 
-def _perform_nms(
+def _perform_nms_dicts(
     detections, iou_thresh=0.5, confidence_thresh=None, classwise=True
 ):
-    detections.sort(
-        key=lambda d: (d.confidence is not None, d.confidence),
-        reverse=True,
+    if detections is None:
+        return None
+
+    if detections:
+        boxes = [d["bounding_box"] for d in detections]
+        confidences = [d.get("confidence", None) for d in detections]
+        if classwise:
+            labels = [d.get("label", None) for d in detections]
+        else:
+            labels = None
+
+        inds = _perform_nms_arrays(
+            boxes,
+            confidences,
+            labels=labels,
+            iou_thresh=iou_thresh,
+            confidence_thresh=confidence_thresh,
+        )
+    else:
+        inds = []
+
+    return fol.Detections(
+        detections=[fol.Detection.from_dict(detections[i]) for i in inds]
     )
 
+
+def _perform_nms_arrays(
+    boxes, confidences, labels=None, iou_thresh=0.5, confidence_thresh=None
+):
+    """Performs greedy non-maximum suppression on the given boxes.
+
+    Boxes are visited in descending order of confidence, with boxes whose
+    confidence is None last and ties broken by input order. Each visited box
+    that has not been suppressed is kept and suppresses all remaining boxes
+    with which its IoU, as computed by
+    :func:`fiftyone.utils.iou.compute_bbox_iou`, is at least ``iou_thresh``.
+
+    Args:
+        boxes: a list or ``num_boxes x 4`` array of
+            ``[top-left-x, top-left-y, width, height]`` boxes
+        confidences: a list of confidences, which may contain None values
+        labels (None): an optional list of labels. If provided, boxes only
+            suppress other boxes with the same label
+        iou_thresh (0.5): the IoU threshold to use
+        confidence_thresh (None): an optional minimum confidence. Boxes with
+            lower or None confidence are discarded
+
+    Returns:
+        the indices of the kept boxes, in descending order of confidence
+    """
+    boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+    num_boxes = len(boxes)
+
+    has_conf = np.array([c is not None for c in confidences], dtype=bool)
+    conf = np.array(
+        [c if c is not None else 0 for c in confidences], dtype=float
+    )
+
+    # Stable sort, matching list.sort(reverse=True) on
+    # (confidence is not None, confidence)
+    inds = np.lexsort((-conf, ~has_conf))
+
     if confidence_thresh is not None:
-        detections = [
-            d
-            for d in detections
-            if d.confidence is not None and d.confidence >= confidence_thresh
-        ]
-
-    nms_detections = []
-    while detections:
-        # Pick the detection with highest confidence
-        d0 = detections.pop(0)
-        nms_detections.append(d0)
-
-        # Compare with other detections for NMS
-        rm_inds = []
-        for i, d in enumerate(detections):
-            if classwise and d.label != d0.label:
-                continue
+        inds = inds[has_conf[inds] & (conf[inds] >= confidence_thresh)]
+
+    if labels is not None:
+        # Map labels to integer class IDs so that suppression is restricted to
+        # each class by a cheap array comparison
+        class_ids = {}
+        classes = np.array(
+            [class_ids.setdefault(l, len(class_ids)) for l in labels],
+            dtype=int,
+        )
+    else:
+        classes = None
+
+    # These operations mirror compute_bbox_iou() exactly so that results are
+    # identical, including in borderline cases
+    x1 = boxes[:, 0]
+    y1 = boxes[:, 1]
+    x2 = x1 + boxes[:, 2]
+    y2 = y1 + boxes[:, 3]
+    areas = boxes[:, 3] * boxes[:, 2]
+
+    keep = []
+    while inds.size > 0:
+        i = inds[0]
+        keep.append(i)
+
+        rest = inds[1:]
+        if rest.size == 0:
+            break
+
+        w = np.minimum(x2[rest], x2[i]) - np.maximum(x1[rest], x1[i])
+        h = np.minimum(y2[rest], y2[i]) - np.maximum(y1[rest], y1[i])
+        inter = h * w
+        union = areas[rest] + areas[i] - inter
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            iou = np.where(union != 0, inter / union, 0)
+
+        iou = np.minimum(iou, 1)
+        iou[(w <= 0) | (h <= 0)] = 0
 
-            iou = foui.compute_bbox_iou(d0, d)
-            if iou >= iou_thresh:
-                rm_inds.append(i)
+        suppress = iou >= iou_thresh
+        if classes is not None:
+            suppress &= classes[rest] == classes[i]
 
-        for i in reversed(rm_inds):
-            del detections[i]
+        inds = rest[~suppress]
 
-    return nms_detections
+    return keep
@@ -483,6 +483,7 @@ def compute_orthographic_projection_images(
     subsampling_rate=None,
     projection_normal=None,
     bounds=None,
+    num_workers=None,
     skip_failures=False,
     progress=None,
 ):
@@ -548,6 +549,7 @@ def compute_orthographic_projection_images(
             to generate each map. Either element of the tuple or any/all of its
             values can be None, in which case a tight crop of the point cloud
             along the missing dimension(s) are used
+        num_workers (None): a suggested number of worker processes to use
         skip_failures (False): whether to gracefully continue without raising
             an error if a projection fails
         progress (None): whether to render a progress bar (True/False), use the
@@ -561,55 +563,92 @@ def compute_orthographic_projection_images(
         fov.validate_collection(samples, media_type=fom.GROUP)
         group_field = samples.group_field
 
-        view = samples.select_group_slices(in_group_slice).select_fields(
-            group_field
-        )
+        in_samples = samples.select_group_slices(in_group_slice)
+        view = in_samples.select_fields(group_field)
     else:
+        group_field = None
+        in_samples = samples
         view = samples.select_fields()
 
     fov.validate_collection(view, media_type={fom.POINT_CLOUD, fom.THREE_D})
 
+    kwargs = dict(
+        shading_mode=shading_mode,
+        colormap=colormap,
+        subsampling_rate=subsampling_rate,
+        projection_normal=projection_normal,
+        bounds=bounds,
+    )
+
+    num_workers = fou.recommend_process_pool_workers(num_workers)
+
+    if num_workers <= 1:
+        out_samples = _compute_orthographic_projection_images_single(
+            view,
+            size,
+            output_dir,
+            rel_dir,
+            out_group_slice,
+            group_field,
+            metadata_field,
+            kwargs,
+            skip_failures,
+            progress,
+        )
+    else:
+        out_samples = _compute_orthographic_projection_images_multi(
+            in_samples,
+            view,
+            size,
+            output_dir,
+            rel_dir,
+            out_group_slice,
+            group_field,
+            metadata_field,
+            kwargs,
+            num_workers,
+            skip_failures,
+            progress,
+        )
+
+    if out_group_slice is not None:
+        samples._root_dataset.add_samples(out_samples)
+
+
+def _compute_orthographic_projection_images_single(
+    view,
+    size,
+    output_dir,
+    rel_dir,
+    out_group_slice,
+    group_field,
+    metadata_field,
+    kwargs,
+    skip_failures,
+    progress,
+):
     filename_maker = fou.UniqueFilenameMaker(
         output_dir=output_dir, rel_dir=rel_dir
     )
 
-    if out_group_slice is not None:
-        out_samples = []
+    out_samples = []
 
     for sample in view.iter_samples(autosave=True, progress=progress):
-        projection_pcd_filepath = sample.filepath
-
-        if view.media_type == fom.THREE_D:
-            projection_pcd_filepath = _get_pcd_filepath_from_fo3d_scene(
-                Scene.from_fo3d(sample.filepath), sample.filepath
-            )
+        projection_pcd_filepath = _get_projection_pcd_filepath(
+            sample.filepath, view.media_type
+        )
 
         image_path = filename_maker.get_output_path(
             projection_pcd_filepath, output_ext=".png"
         )
 
-        try:
-            img, metadata = compute_orthographic_projection_image(
-                projection_pcd_filepath,
-                size,
-                shading_mode=shading_mode,
-                colormap=colormap,
-                subsampling_rate=subsampling_rate,
-                projection_normal=projection_normal,
-                bounds=bounds,
-            )
-        except Exception as e:
-            if not skip_failures:
-                raise
-
-            if skip_failures != "ignore":
-                logger.warning(e)
+        metadata = _compute_orthographic_projection(
+            projection_pcd_filepath, image_path, size, kwargs, skip_failures
+        )
 
+        if metadata is None:
             continue
 
-        foui.write(img, image_path)
-        metadata.filepath = image_path
-
         sample[metadata_field] = metadata
 
         if out_group_slice is not None:
@@ -618,8 +657,122 @@ def compute_orthographic_projection_images(
             s[metadata_field] = metadata
             out_samples.append(s)
 
-    if out_group_slice is not None:
-        samples._root_dataset.add_samples(out_samples)
+    return out_samples
+
+
+def _compute_orthographic_projection_images_multi(
+    in_samples,
+    view,
+    size,
+    output_dir,
+    rel_dir,
+    out_group_slice,
+    group_field,
+    metadata_field,
+    kwargs,
+    num_workers,
+    skip_failures,
+    progress,
+):
+    filename_maker = fou.UniqueFilenameMaker(
+        output_dir=output_dir, rel_dir=rel_dir
+    )
+
+    if group_field is not None:
+        sample_ids, filepaths, groups = view.values(
+            ["id", "filepath", group_field]
+        )
+    else:
+        sample_ids, filepaths = view.values(["id", "filepath"])
+        groups = itertools.repeat(None)
+
+    inputs = []
+    for sample_id, filepath in zip(sample_ids, filepaths):
+        projection_pcd_filepath = _get_projection_pcd_filepath(
+            filepath, view.media_type
+        )
+
+        image_path = filename_maker.get_output_path(
+            projection_pcd_filepath, output_ext=".png"
+        )
+
+        inputs.append(
+            (
+                sample_id,
+                projection_pcd_filepath,
+                image_path,
+                size,
+                kwargs,
+                skip_failures,
+            )
+        )
+
+    groups = dict(zip(sample_ids, groups))
+
+    out_samples = []
+    metadatas = {}
+
+    try:
+        with fou.ProgressBar(inputs, progress=progress) as pb:
+            with fou.get_multiprocessing_context().Pool(
+                processes=num_workers
+            ) as pool:
+                for sample_id, metadata in pb(
+                    pool.imap_unordered(_do_compute_projection, inputs)
+                ):
+                    if metadata is None:
+                        continue
+
+                    metadatas[sample_id] = metadata
+
+                    if out_group_slice is not None:
+                        group = groups[sample_id]
+                        s = Sample(filepath=metadata.filepath)
+                        s[group_field] = group.element(out_group_slice)
+                        s[metadata_field] = metadata
+                        out_samples.append(s)
+    finally:
+        if metadatas:
+            in_samples.set_values(metadata_field, metadatas, key_field="id")
+
+    return out_samples
+
+
+def _do_compute_projection(args):
+    sample_id = args[0]
+    metadata = _compute_orthographic_projection(*args[1:])
+    return sample_id, metadata
+
+
+def _compute_orthographic_projection(
+    filepath, image_path, size, kwargs, skip_failures
+):
+    try:
+        img, metadata = compute_orthographic_projection_image(
+            filepath, size, **kwargs
+        )
+    except Exception as e:
+        if not skip_failures:
+            raise
+
+        if skip_failures != "ignore":
+            logger.warning(e)
+
+        return None
+
+    foui.write(img, image_path)
+    metadata.filepath = image_path
+
+    return metadata
+
+
+def _get_projection_pcd_filepath(filepath, media_type):
+    if media_type == fom.THREE_D:
+        return _get_pcd_filepath_from_fo3d_scene(
+            Scene.from_fo3d(filepath), filepath
+        )
+
+    return filepath
 
 
 def compute_orthographic_projection_image(
@@ -671,12 +824,6 @@ def compute_orthographic_projection_image(
         -   the orthographic projection image
         -   an :class:`OrthographicProjectionMetadata` instance
     """
-    if colormap is None:
-        colormap = DEFAULT_SHADING_GRADIENT_MAP
-
-    if not isinstance(colormap, dict):
-        colormap = dict(zip(np.linspace(0, 1, len(colormap)), colormap))
-
     points, colors, metadata = _parse_point_cloud(
         filepath,
         size=size,
@@ -685,14 +832,32 @@ def compute_orthographic_projection_image(
         subsampling_rate=subsampling_rate,
     )
 
+    image = _render_orthographic_projection(
+        points,
+        colors,
+        metadata,
+        shading_mode=shading_mode,
+        colormap=colormap,
+    )
+
+    return image, metadata
+
+
+def _render_orthographic_projection(
+    points, colors, metadata, shading_mode=None, colormap=None
+):
     min_bound = metadata.min_bound
     max_bound = metadata.max_bound
     width = metadata.width
     height = metadata.height
 
     # scale and normalize XY points based on width / height and bounds
-    points[:, 0] *= (width - 1) / (max_bound[0] - min_bound[0])
-    points[:, 1] *= (height - 1) / (max_bound[1] - min_bound[1])
+    x = np.int_(points[:, 0] * ((width - 1) / (max_bound[0] - min_bound[0])))
+    y = np.int_(points[:, 1] * ((height - 1) / (max_bound[1] - min_bound[1])))
+    z = points[:, 2]
+
+    # z-buffer: only render the highest point that lands in each pixel
+    inds = _get_highest_points(x * height + y, z, width * height)
 
     image = np.zeros((width, height, 3), dtype=np.uint8)
 
@@ -702,40 +867,67 @@ def compute_orthographic_projection_image(
         and shading_mode != "height"
     ):
         if shading_mode == "rgb":
-            image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = (
-                colors * 255.0
-            )
+            rgbs = colors[inds] * 255.0
         else:
             # use R channel for intensity, discard G and B channels
             min_intensity = np.min(colors[:, 0])
             max_intensity = np.max(colors[:, 1])
-            intensities_normalized_t = (colors[:, 0] - min_intensity) / (
+            intensities_normalized_t = (colors[inds, 0] - min_intensity) / (
                 max_intensity - min_intensity
             )
 
             # map intensity value to RGB
-            rgb_refs = _clamp_to_discrete(
-                intensities_normalized_t, list(colormap.keys())
-            )
-            rgbs = np.array([colormap[v] for v in rgb_refs])
-            image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = rgbs
+            rgbs = _apply_colormap(intensities_normalized_t, colormap)
     elif shading_mode == "height":
         # color by height (z)
-        max_z = np.max(points[:, 2])
-        min_z = np.min(points[:, 2])
-        z_normalized = (points[:, 2] - min_z) / (max_z - min_z)
+        max_z = np.max(z)
+        min_z = np.min(z)
+        z_normalized = (z[inds] - min_z) / (max_z - min_z)
 
         # map z value to color
-        rgb_refs = _clamp_to_discrete(z_normalized, list(colormap.keys()))
-        rgbs = np.array([colormap[v] for v in rgb_refs])
-        image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = rgbs
+        rgbs = _apply_colormap(z_normalized, colormap)
     else:
-        image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = 255.0
+        rgbs = 255
+
+    image[x[inds], y[inds], :] = rgbs
 
     # change axis orientation such that y is up
     image = np.rot90(image, k=1, axes=(0, 1))
 
-    return image, metadata
+    return image
+
+
+def _get_highest_points(pixels, z, num_pixels):
+    # Returns the indices of the highest point in each pixel. Ties are broken
+    # in favor of the last point
+    zbuffer = np.full(num_pixels, -np.inf)
+    np.maximum.at(zbuffer, pixels, z)
+
+    inds = np.flatnonzero(z == zbuffer[pixels])
+    ibuffer = np.full(num_pixels, -1)
+    np.maximum.at(ibuffer, pixels[inds], inds)
+
+    return ibuffer[ibuffer >= 0]
+
+
+def _get_colormap_lut(colormap):
+    if colormap is None:
+        colormap = DEFAULT_SHADING_GRADIENT_MAP
+
+    if not isinstance(colormap, dict):
+        colormap = dict(zip(np.linspace(0, 1, len(colormap)), colormap))
+
+    values = np.array(sorted(colormap.keys()))
+    lut = np.array([colormap[v] for v in values])
+    return values, lut
+
+
+def _apply_colormap(arr, colormap):
+    # Maps each value in ``arr`` to the color of the closest colormap value
+    # that is greater than or equal to it
+    values, lut = _get_colormap_lut(colormap)
+    idx = np.searchsorted(values, arr - 1e-8)
+    return lut[np.clip(idx, 0, len(values) - 1)]
 
 
 def _parse_point_cloud(
@@ -824,15 +1016,6 @@ def _get_3d_slice(samples):
     return slice_name
 
 
-def _clamp_to_discrete(arr, discrete):
-    """Discretize by mapping each continuous value in ``arr`` to the closest
-    value in ``discrete``.
-    """
-    clamp_list = np.sort(np.array(discrete))
-    idx = np.searchsorted(clamp_list, arr - 1e-8)
-    return clamp_list[np.clip(idx, 0, len(clamp_list) - 1)]
-
-
 def _parse_size(size, bounds):
     width, height = size
 
@@ -0,0 +1,74 @@
+"""
+Benchmarking for 3D cuboid IoUs.
+
+Compares computing the IoUs between LiDAR-style cuboids, which are rotated
+about the z-axis, one pair at a time via
+:func:`fiftyone.utils.utils3d.compute_cuboid_iou` against the batched
+computation used by :func:`fiftyone.utils.iou.compute_ious`.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import random
+import time
+import warnings
+
+import numpy as np
+
+import fiftyone as fo
+import fiftyone.utils.iou as foui
+import fiftyone.utils.utils3d as fou3d
+
+
+NUM_OBJECTS = 100
+SCENE_SIZE = 50
+
+
+def make_cuboids(num_objects):
+    return [
+        fo.Detection(
+            location=[
+                random.uniform(0, SCENE_SIZE),
+                random.uniform(0, SCENE_SIZE),
+                random.uniform(0, 2),
+            ],
+            dimensions=[
+                random.uniform(1, 5),
+                random.uniform(1, 3),
+                random.uniform(1, 2),
+            ],
+            rotation=[0, 0, random.uniform(-np.pi, np.pi)],
+        )
+        for _ in range(num_objects)
+    ]
+
+
+def main():
+    random.seed(51)
+    preds = make_cuboids(NUM_OBJECTS)
+    gts = make_cuboids(NUM_OBJECTS)
+
+    print("Predictions: %d, ground truth: %d" % (len(preds), len(gts)))
+
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = np.array(
+            [
+                [fou3d.compute_cuboid_iou(gt, pred) for gt in gts]
+                for pred in preds
+            ]
+        )
+
+    print("  pairwise: %.3fs" % (time.perf_counter() - start))
+
+    start = time.perf_counter()
+    ious = foui.compute_ious(preds, gts)
+    print("  batched:  %.3fs" % (time.perf_counter() - start))
+
+    assert np.allclose(ious, expected)
+
+
+if __name__ == "__main__":
+    main()
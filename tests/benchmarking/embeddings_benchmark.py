@@ -0,0 +1,69 @@
+"""
+Benchmarking for :func:`fiftyone.core.models.get_embeddings`.
+
+Compares loading embeddings stored in the legacy zlib-compressed
+``numpy.save`` format via ``values()`` against bulk loading embeddings
+stored as raw bytes via :func:`fiftyone.core.models.get_embeddings`.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import time
+
+import numpy as np
+from pymongo import UpdateOne
+
+import fiftyone as fo
+import fiftyone.core.utils as fou
+
+
+NUM_SAMPLES = 20000
+NUM_DIMS = 512
+
+
+def make_dataset(embeddings):
+    dataset = fo.Dataset()
+    dataset.add_samples(
+        [fo.Sample(filepath="image%d.jpg" % i) for i in range(NUM_SAMPLES)]
+    )
+    dataset.set_values("embedding", embeddings)
+
+    # Also store a copy of the embeddings in the legacy format
+    ids = dataset.values("_id")
+    ops = [
+        UpdateOne(
+            {"_id": _id}, {"$set": {"legacy": fou.serialize_numpy_array(e)}}
+        )
+        for _id, e in zip(ids, embeddings)
+    ]
+    dataset._sample_collection.bulk_write(ops, ordered=False)
+    dataset.add_sample_field("legacy", fo.VectorField)
+
+    return dataset
+
+
+def main():
+    embeddings = np.random.randn(NUM_SAMPLES, NUM_DIMS).astype(np.float32)
+    dataset = make_dataset(embeddings)
+
+    print("Samples: %d, dimensions: %d" % (NUM_SAMPLES, NUM_DIMS))
+
+    start = time.perf_counter()
+    legacy = np.stack(dataset.values("legacy"))
+    print("  values(), legacy format: %.3fs" % (time.perf_counter() - start))
+
+    start = time.perf_counter()
+    raw = fo.get_embeddings(dataset, "embedding")
+    print(
+        "  get_embeddings(), raw format: %.3fs" % (time.perf_counter() - start)
+    )
+
+    assert np.array_equal(legacy, embeddings)
+    assert np.array_equal(raw, embeddings)
+
+    dataset.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmarking for bounding box IoU computations in
+:mod:`fiftyone.utils.iou`.
+
+Compares the batch IoU implementation used by
+:func:`fiftyone.utils.iou.compute_ious` against a per-pair loop over
+:func:`fiftyone.utils.iou.compute_bbox_iou`.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import random
+import time
+
+import numpy as np
+
+import fiftyone as fo
+import fiftyone.utils.iou as foui
+
+
+NUM_IMAGES = 10
+
+
+def make_detections(num_objects):
+    detections = []
+    for _ in range(num_objects):
+        x, y = 0.9 * random.random(), 0.9 * random.random()
+        w, h = 0.1 * random.random(), 0.1 * random.random()
+        detections.append(
+            fo.Detection(
+                label=random.choice(["cat", "dog"]),
+                bounding_box=[x, y, w, h],
+            )
+        )
+
+    return detections
+
+
+def compute_pairwise_ious(preds, gts):
+    ious = np.zeros((len(preds), len(gts)))
+    for j, gt in enumerate(gts):
+        for i, pred in enumerate(preds):
+            ious[i, j] = foui.compute_bbox_iou(gt, pred)
+
+    return ious
+
+
+def time_it(fcn, pairs):
+    start = time.perf_counter()
+    results = [fcn(preds, gts) for preds, gts in pairs]
+    return time.perf_counter() - start, results
+
+
+random.seed(51)
+
+for num_boxes in [10, 100, 1000]:
+    pairs = [
+        (make_detections(num_boxes), make_detections(num_boxes))
+        for _ in range(NUM_IMAGES)
+    ]
+
+    pairwise_time, expected = time_it(compute_pairwise_ious, pairs)
+    batch_time, actual = time_it(foui.compute_ious, pairs)
+
+    assert all(np.array_equal(a, e) for a, e in zip(actual, expected))
+
+    print(
+        "%4d boxes/image: pairwise %.4fs, batch %.4fs (%.1fx speedup)"
+        % (
+            num_boxes,
+            pairwise_time / NUM_IMAGES,
+            batch_time / NUM_IMAGES,
+            pairwise_time / batch_time,
+        )
+    )
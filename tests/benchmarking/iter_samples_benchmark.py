@@ -0,0 +1,86 @@
+"""
+Benchmarking for
+:meth:`fiftyone.core.collections.SampleCollection.iter_samples`.
+
+Compares iterating over :class:`fiftyone.core.sample.Sample` instances
+against iterating over read-only
+:class:`fiftyone.core.sample.SampleRecord` instances via
+``iter_samples(read_only=True)``.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import random
+import time
+import tracemalloc
+
+import fiftyone as fo
+
+
+NUM_SAMPLES = 2000
+NUM_OBJECTS = 10
+
+
+def make_dataset():
+    dataset = fo.Dataset()
+    dataset.add_sample_dicts(
+        [
+            {
+                "filepath": "image%d.jpg" % i,
+                "uniqueness": random.random(),
+                "ground_truth": fo.Detections(
+                    detections=[
+                        fo.Detection(
+                            label=random.choice(["cat", "dog"]),
+                            bounding_box=[0.1, 0.1, 0.5, 0.5],
+                        )
+                        for _ in range(NUM_OBJECTS)
+                    ]
+                ).to_dict(),
+            }
+            for i in range(NUM_SAMPLES)
+        ],
+        dynamic=True,
+    )
+
+    return dataset
+
+
+def run(dataset, read_only, access_labels):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    samples = []
+    for sample in dataset.iter_samples(read_only=read_only):
+        sample.uniqueness
+        if access_labels:
+            sample.ground_truth
+
+        samples.append(sample)
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak / len(samples)
+
+
+def main():
+    dataset = make_dataset()
+
+    print("Samples: %d, objects per sample: %d" % (NUM_SAMPLES, NUM_OBJECTS))
+    for access_labels in (False, True):
+        print("\nAccessing labels: %s" % access_labels)
+        for read_only in (False, True):
+            elapsed, mem = run(dataset, read_only, access_labels)
+            print(
+                "  read_only=%s: %.3fs, %.1f KB/sample"
+                % (read_only, elapsed, mem / 1024)
+            )
+
+    dataset.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmarking for :func:`fiftyone.utils.labels.perform_nms`.
+
+Compares the vectorized NMS implementation against the original pure
+Python implementation, which popped from the front of a list and called
+:func:`fiftyone.utils.iou.compute_bbox_iou` for each pair of detections.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import random
+import time
+
+import fiftyone as fo
+import fiftyone.utils.iou as foui
+import fiftyone.utils.labels as foul
+
+
+NUM_IMAGES = 5
+
+
+def make_detections(num_objects):
+    detections = []
+    for _ in range(num_objects):
+        x, y = 0.9 * random.random(), 0.9 * random.random()
+        w, h = 0.1 * random.random(), 0.1 * random.random()
+        detections.append(
+            fo.Detection(
+                label=random.choice(["cat", "dog", "bird"]),
+                bounding_box=[x, y, w, h],
+                confidence=random.random(),
+            )
+        )
+
+    return detections
+
+
+def perform_nms_loop(detections, iou_thresh=0.5, classwise=True):
+    detections = sorted(
+        detections,
+        key=lambda d: (d.confidence is not None, d.confidence),
+        reverse=True,
+    )
+
+    nms_detections = []
+    while detections:
+        d0 = detections.pop(0)
+        nms_detections.append(d0)
+
+        rm_inds = []
+        for i, d in enumerate(detections):
+            if classwise and d.label != d0.label:
+                continue
+
+            iou = foui.compute_bbox_iou(d0, d)
+            if iou >= iou_thresh:
+                rm_inds.append(i)
+
+        for i in reversed(rm_inds):
+            del detections[i]
+
+    return [d.id for d in nms_detections]
+
+
+def perform_nms_vectorized(detections, iou_thresh=0.5, classwise=True):
+    inds = foul._perform_nms_arrays(
+        [d.bounding_box for d in detections],
+        [d.confidence for d in detections],
+        labels=[d.label for d in detections] if classwise else None,
+        iou_thresh=iou_thresh,
+    )
+    return [detections[i].id for i in inds]
+
+
+def time_it(fcn, images):
+    start = time.perf_counter()
+    results = [fcn(detections) for detections in images]
+    return time.perf_counter() - start, results
+
+
+def main():
+    fo.config.show_progress_bars = False
+    random.seed(51)
+
+    for num_boxes in [100, 1000, 5000]:
+        images = [make_detections(num_boxes) for _ in range(NUM_IMAGES)]
+
+        loop_time, expected = time_it(perform_nms_loop, images)
+        vectorized_time, actual = time_it(perform_nms_vectorized, images)
+
+        assert actual == expected
+
+        print(
+            "%4d boxes/image: loop %.4fs, vectorized %.4fs (%.1fx speedup)"
+            % (
+                num_boxes,
+                loop_time / NUM_IMAGES,
+                vectorized_time / NUM_IMAGES,
+                loop_time / vectorized_time,
+            )
+        )
+
+    dataset = fo.Dataset()
+    dataset.add_samples(
+        [
+            fo.Sample(
+                filepath="image%d.jpg" % i,
+                predictions=fo.Detections(detections=make_detections(1000)),
+            )
+            for i in range(100)
+        ]
+    )
+
+    start = time.perf_counter()
+    foul.perform_nms(dataset, "predictions", out_field="nms")
+    print(
+        "perform_nms() on 100 samples x 1000 boxes: %.2fs"
+        % (time.perf_counter() - start)
+    )
+
+    dataset.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmarking for :func:`fiftyone.core.utils.serialize_numpy_array`.
+
+Compares the encode/decode throughput and serialized size of the legacy
+``numpy.save`` + zlib format against the available codecs for embeddings,
+segmentation masks, and heatmaps.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import importlib
+import time
+
+import numpy as np
+
+import fiftyone.core.utils as fou
+
+
+NUM_ITERS = 200
+
+
+def make_arrays():
+    rng = np.random.default_rng(0)
+
+    embedding = rng.standard_normal(512).astype(np.float32)
+
+    mask = np.zeros((512, 512), dtype=np.uint8)
+    for _ in range(10):
+        y, x = rng.integers(0, 400, size=2)
+        mask[y : y + 100, x : x + 120] = rng.integers(1, 10)
+
+    heatmap = rng.random((256, 256)).astype(np.float32)
+
+    return {"embedding": embedding, "mask": mask, "heatmap": heatmap}
+
+
+def get_codecs():
+    codecs = [None, "raw", "zlib", "rle", "auto"]
+    for codec, module_name in (("lz4", "lz4.frame"), ("zstd", "zstandard")):
+        try:
+            importlib.import_module(module_name)
+            codecs.append(codec)
+        except ImportError:
+            pass
+
+    return codecs
+
+
+def run(array, codec):
+    start = time.perf_counter()
+    for _ in range(NUM_ITERS):
+        data = fou.serialize_numpy_array(array, codec=codec)
+
+    encode = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(NUM_ITERS):
+        fou.deserialize_numpy_array(data)
+
+    decode = time.perf_counter() - start
+
+    mb = NUM_ITERS * array.nbytes / 1024**2
+    return len(data), mb / encode, mb / decode
+
+
+def main():
+    for name, array in make_arrays().items():
+        print("\n%s: %s %s" % (name, array.dtype, array.shape))
+        for codec in get_codecs():
+            size, encode, decode = run(array, codec)
+            print(
+                "  %-8s %8d bytes, encode: %8.1f MB/s, decode: %8.1f MB/s"
+                % (codec or "legacy", size, encode, decode)
+            )
+
+
+if __name__ == "__main__":
+    main()
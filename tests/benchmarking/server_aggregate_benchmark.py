@@ -0,0 +1,142 @@
+"""
+Load test for the App server's ``/aggregate`` route.
+
+Simulates concurrent App users that post aggregation requests while a probe
+repeatedly requests a lightweight route, and reports latency percentiles
+for both. Since aggregations no longer block the event loop, probe latency
+should stay low under load, and identical concurrent requests are coalesced
+into a single database execution.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import asyncio
+import os
+import random
+import time
+
+import httpx
+import numpy as np
+
+# Mimic the App server's environment
+os.environ["FIFTYONE_SERVER"] = "1"
+
+import fiftyone as fo
+from fiftyone.server.app import app
+from fiftyone.server.cache import results_cache
+
+
+NUM_SAMPLES = 20000
+NUM_USERS = 20
+NUM_REQUESTS = 5
+
+
+def make_dataset():
+    dataset = fo.Dataset()
+    dataset.add_samples(
+        [
+            fo.Sample(
+                filepath="image%d.jpg" % i,
+                value=random.random(),
+                ground_truth=fo.Detections(
+                    detections=[
+                        fo.Detection(label=random.choice(["cat", "dog"]))
+                        for _ in range(5)
+                    ]
+                ),
+            )
+            for i in range(NUM_SAMPLES)
+        ]
+    )
+
+    return dataset
+
+
+def make_request(dataset, thresh):
+    view = dataset.match(fo.ViewField("value") > thresh)
+    return {
+        "dataset": dataset.name,
+        "view": view._serialize(),
+        "aggregations": [
+            fo.Count()._serialize(),
+            fo.CountValues("ground_truth.detections.label")._serialize(),
+            fo.Bounds("value")._serialize(),
+        ],
+    }
+
+
+async def user(client, requests, latencies):
+    for data in requests:
+        start = time.perf_counter()
+        response = await client.post("/aggregate", json=data)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+
+
+async def probe(client, latencies, done):
+    while not done.is_set():
+        start = time.perf_counter()
+        await client.get("/fiftyone")
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.01)
+
+
+async def run(dataset, identical):
+    results_cache.clear()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://localhost"
+    ) as client:
+        agg_latencies = []
+        probe_latencies = []
+        done = asyncio.Event()
+
+        probe_task = asyncio.create_task(probe(client, probe_latencies, done))
+
+        users = []
+        for i in range(NUM_USERS):
+            requests = [
+                make_request(
+                    dataset, 0.5 if identical else (i * NUM_REQUESTS + j) / 1e3
+                )
+                for j in range(NUM_REQUESTS)
+            ]
+            users.append(user(client, requests, agg_latencies))
+
+        start = time.perf_counter()
+        await asyncio.gather(*users)
+        elapsed = time.perf_counter() - start
+
+        done.set()
+        await probe_task
+
+    return elapsed, agg_latencies, probe_latencies
+
+
+def _summarize(latencies):
+    p50, p99 = np.percentile(np.array(latencies) * 1000, [50, 99])
+    return "p50 %7.1fms, p99 %7.1fms" % (p50, p99)
+
+
+def main():
+    dataset = make_dataset()
+
+    print(
+        "Samples: %d, users: %d, requests per user: %d"
+        % (NUM_SAMPLES, NUM_USERS, NUM_REQUESTS)
+    )
+    for identical in (True, False):
+        elapsed, agg_latencies, probe_latencies = asyncio.run(
+            run(dataset, identical)
+        )
+        print("\nIdentical requests: %s (%.2fs)" % (identical, elapsed))
+        print("  /aggregate: %s" % _summarize(agg_latencies))
+        print("  /fiftyone:  %s" % _summarize(probe_latencies))
+
+    dataset.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -415,6 +415,92 @@ class DatasetTests(unittest.TestCase):
         schema = d.schema("ground_truth.info")
         self.assertEqual(len(schema), 7)
 
+    @drop_datasets
+    def test_approx_quantiles(self):
+        d = fo.Dataset()
+        d.add_sample_field("numeric_field", fo.IntField)
+        self.assertIsNone(
+            d.aggregate(fo.ApproxQuantiles("numeric_field", 0.5))
+        )
+        self.assertListEqual(
+            d.aggregate(fo.ApproxQuantiles("numeric_field", [0.5])), [None]
+        )
+
+        d.add_samples(
+            [
+                fo.Sample(filepath="image1.jpeg", numeric_field=1),
+                fo.Sample(filepath="image2.jpeg", numeric_field=2),
+                fo.Sample(filepath="image3.jpeg"),
+            ]
+        )
+
+        q = np.linspace(0, 1, 11)
+        results = d.aggregate(fo.ApproxQuantiles("numeric_field", q))
+        self.assertListEqual(results, d.quantiles("numeric_field", q))
+
+        results = d.aggregate(
+            fo.ApproxQuantiles(2.0 * (F("numeric_field") + 1), q)
+        )
+        self.assertListEqual(
+            results, d.quantiles(2.0 * (F("numeric_field") + 1), q)
+        )
+
+        values = np.random.default_rng(0).random(2000)
+        d.add_samples(
+            [
+                fo.Sample(filepath="image.jpeg", float_list=list(v))
+                for v in values.reshape(-1, 4)
+            ]
+        )
+
+        q = [0.25, 0.5, 0.75]
+        count, results = d.aggregate(
+            [fo.Count("float_list"), fo.ApproxQuantiles("float_list", q, k=50)]
+        )
+        self.assertEqual(count, len(values))
+        ranks = np.searchsorted(np.sort(values), results) / len(values)
+        self.assertLess(np.abs(ranks - q).max(), 0.1)
+
+    @drop_datasets
+    def test_approx_histogram(self):
+        d = fo.Dataset()
+        d.add_sample_field("numeric_field", fo.FloatField)
+        self.assertTupleEqual(
+            d.aggregate(fo.ApproxHistogram("numeric_field")), ([], [], 0)
+        )
+
+        values = np.random.default_rng(0).standard_normal(300)
+        d.add_samples(
+            [
+                fo.Sample(filepath="image%d.jpg" % i, numeric_field=v)
+                for i, v in enumerate(values)
+            ]
+        )
+
+        # Sketches that are larger than the stream are exact
+        counts, edges, other = d.aggregate(
+            fo.ApproxHistogram("numeric_field", bins=5, k=1000)
+        )
+        counts2, edges2, _ = d.histogram_values("numeric_field", bins=5)
+        self.assertListEqual(counts, counts2)
+        self.assertEqual(len(edges), 6)
+        for e1, e2 in zip(edges, edges2):
+            self.assertAlmostEqual(e1, e2)
+        self.assertEqual(other, 0)
+
+        counts, _, _ = d.aggregate(fo.ApproxHistogram("numeric_field", bins=5))
+        self.assertEqual(sum(counts), len(values))
+        self.assertLess(np.abs(np.array(counts) - counts2).max(), 10)
+
+        counts, edges, other = d.aggregate(
+            fo.ApproxHistogram("numeric_field", bins=4, range=[-1, 1])
+        )
+        counts2, _, _ = d.histogram_values(
+            "numeric_field", bins=4, range=[-1, 1]
+        )
+        self.assertListEqual(counts, counts2)
+        self.assertEqual(other, len(values) - sum(counts))
+
     @drop_datasets
     def test_quantiles(self):
         d = fo.Dataset()
@@ -591,6 +677,64 @@ class DatasetTests(unittest.TestCase):
             ["found", "found", "found", "found", "found", "found", "missing"],
         )
 
+    @drop_datasets
+    def test_iter_values(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    int=i,
+                    ground_truth=fo.Detections(
+                        detections=[
+                            fo.Detection(
+                                label=str(j),
+                                bounding_box=[0.1, 0.1, 0.1 * j, 0.1],
+                            )
+                            for j in range(i % 3)
+                        ]
+                    ),
+                )
+                for i in range(7)
+            ]
+            + [fo.Sample(filepath="image7.jpg")]
+        )
+
+        path = "ground_truth.detections.label"
+        chunks = list(dataset.iter_values(path, batch_size=3))
+        self.assertListEqual([len(c) for c in chunks], [3, 3, 2])
+        self.assertListEqual(
+            [v for c in chunks for v in c], dataset.values(path)
+        )
+
+        chunks = list(
+            dataset.iter_values(["int", "filepath"], array_format="numpy")
+        )
+        self.assertEqual(len(chunks), 1)
+        ints, filepaths = chunks[0]
+        self.assertIsInstance(ints, np.ndarray)
+        self.assertListEqual(ints.tolist(), dataset.values("int"))
+        self.assertListEqual(filepaths.tolist(), dataset.values("filepath"))
+
+        path = "ground_truth.detections.bounding_box"
+        boxes = []
+        for values, offsets in dataset.iter_values(
+            path, batch_size=3, array_format="ragged"
+        ):
+            self.assertEqual(len(offsets), 1)
+            for start, end in zip(offsets[0][:-1], offsets[0][1:]):
+                boxes.append(values[start:end].tolist())
+
+        self.assertListEqual(
+            boxes, [b if b is not None else [] for b in dataset.values(path)]
+        )
+
+        with self.assertRaises(ValueError):
+            list(dataset.iter_values(path, array_format="numpy"))
+
+        with self.assertRaises(ValueError):
+            list(dataset.iter_values(["int", "ground_truth.detections[]"]))
+
     @drop_datasets
     def test_values_unwind(self):
         sample1 = fo.Sample(filepath="video1.mp4")
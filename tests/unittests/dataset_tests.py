@@ -12,6 +12,7 @@ import os
 import random
 import string
 import unittest
+from unittest import mock
 
 from bson import ObjectId
 from mongoengine import ValidationError
@@ -21,6 +22,7 @@ import pytz
 import eta.core.utils as etau
 
 import fiftyone as fo
+import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
 import fiftyone.core.odm as foo
 import fiftyone.utils.data as foud
@@ -457,7 +459,7 @@ class DatasetTests(unittest.TestCase):
         info = dataset.get_index_information()
         indexes = dataset.list_indexes()
 
-        default_indexes = {"id", "filepath"}
+        default_indexes = {"id", "filepath", "_rand", "_last_modified_at"}
         self.assertSetEqual(set(info.keys()), default_indexes)
         self.assertSetEqual(set(indexes), default_indexes)
 
@@ -529,6 +531,155 @@ class DatasetTests(unittest.TestCase):
 
         self.assertTupleEqual(dataset.bounds("int"), (4, 53))
 
+        for idx, sample in enumerate(
+            dataset.iter_samples(autosave=True, prefetch=8)
+        ):
+            sample["int"] = idx + 5
+
+        self.assertTupleEqual(dataset.bounds("int"), (5, 54))
+
+        view = dataset.match(F("int") > 10)
+        samples = list(view.iter_samples(prefetch=8))
+        self.assertListEqual([s.id for s in samples], view.values("id"))
+
+        # Stopping early
+        for idx, sample in enumerate(dataset.iter_samples(prefetch=2)):
+            if idx == 3:
+                break
+
+        self.assertEqual(sample.int, 8)
+
+    @drop_datasets
+    def test_iter_samples_read_only(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    int=i,
+                    ground_truth=fo.Detections(
+                        detections=[fo.Detection(label="cat")]
+                    ),
+                )
+                for i in range(10)
+            ]
+        )
+
+        records = list(dataset.iter_samples(read_only=True))
+        self.assertEqual(len(records), 10)
+        self.assertListEqual([r.id for r in records], dataset.values("id"))
+        self.assertListEqual([r.int for r in records], dataset.values("int"))
+        self.assertListEqual(
+            [r["filepath"] for r in records], dataset.values("filepath")
+        )
+
+        record = records[0]
+        self.assertIsInstance(record.ground_truth, fo.Detections)
+        self.assertEqual(record.ground_truth.detections[0].label, "cat")
+        self.assertEqual(record.media_type, "image")
+        self.assertTrue(record.has_field("int"))
+        self.assertIn("ground_truth", record.field_names)
+
+        with self.assertRaises(AttributeError):
+            record.int = 100
+
+        with self.assertRaises(TypeError):
+            record["int"] = 100
+
+        with self.assertRaises(AttributeError):
+            record.missing_field
+
+        with self.assertRaises(ValueError):
+            list(dataset.iter_samples(read_only=True, autosave=True))
+
+        view = dataset.match(F("int") > 4).select_fields("int")
+        records = list(view.iter_samples(read_only=True, prefetch=2))
+        self.assertListEqual([r.int for r in records], view.values("int"))
+        self.assertFalse(records[0].has_field("ground_truth"))
+
+    @drop_datasets
+    def test_last_modified_at(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(3)]
+        )
+        dataset.add_sample_dicts([{"filepath": "image3.jpg"}])
+
+        def get_last_modified_at(coll):
+            d = {
+                doc["_id"]: doc["_last_modified_at"]
+                for doc in coll.find({}, {"_last_modified_at": True})
+            }
+            return [d[_id] for _id in sorted(d.keys())]
+
+        for last_modified_at in get_last_modified_at(
+            dataset._sample_collection
+        ):
+            self.assertIsInstance(last_modified_at, datetime)
+
+        epoch = datetime(2000, 1, 1)
+
+        def reset():
+            dataset._sample_collection.update_many(
+                {}, {"$set": {"_last_modified_at": epoch}}
+            )
+
+        def modified():
+            return [
+                d > epoch
+                for d in get_last_modified_at(dataset._sample_collection)
+            ]
+
+        reset()
+        sample = dataset.first()
+        sample["int"] = 1
+        sample.save()
+        self.assertListEqual(modified(), [True, False, False, False])
+
+        reset()
+        dataset.skip(2).set_values("int", [2, 3])
+        self.assertListEqual(modified(), [False, False, True, True])
+
+        reset()
+        dataset.take(1).tag_samples("test")
+        self.assertEqual(sum(modified()), 1)
+
+        reset()
+        with dataset.save_context() as ctx:
+            for sample in dataset.skip(1).limit(1):
+                sample["int"] = 4
+                ctx.save(sample)
+
+        self.assertListEqual(modified(), [False, True, False, False])
+
+        reset()
+        dataset.limit(2).set_field("int", 5).save()
+        self.assertListEqual(modified(), [True, True, False, False])
+
+        video_dataset = fo.Dataset()
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame()
+        sample.frames[2] = fo.Frame()
+        video_dataset.add_sample(sample)
+
+        for last_modified_at in get_last_modified_at(
+            video_dataset._frame_collection
+        ):
+            self.assertIsInstance(last_modified_at, datetime)
+
+        video_dataset._frame_collection.update_many(
+            {}, {"$set": {"_last_modified_at": epoch}}
+        )
+        video_dataset.set_values("frames.int", [{2: 1}])
+
+        self.assertListEqual(
+            [
+                d > epoch
+                for d in get_last_modified_at(video_dataset._frame_collection)
+            ],
+            [False, True],
+        )
+
     @drop_datasets
     def test_date_fields(self):
         dataset = fo.Dataset()
@@ -558,6 +709,149 @@ class DatasetTests(unittest.TestCase):
         self.assertEqual(type(sample.date), date)
         self.assertEqual(int((sample.date - date1).total_seconds()), 0)
 
+    @drop_datasets
+    def test_add_samples_num_workers(self):
+        default_batcher = fo.config.default_batcher
+        batcher_static_size = fo.config.batcher_static_size
+        fo.config.default_batcher = "static"
+        fo.config.batcher_static_size = 7
+
+        try:
+            samples = [
+                fo.Sample(filepath="image%d.png" % i, int_field=i)
+                for i in range(50)
+            ]
+
+            # Schema expansion in a later batch
+            samples[-1]["str_field"] = "hello"
+
+            dataset = fo.Dataset()
+            sample_ids = dataset.add_samples(samples, num_workers=2)
+
+            self.assertEqual(len(dataset), 50)
+            self.assertListEqual(sample_ids, dataset.values("id"))
+            self.assertListEqual(sample_ids, [s.id for s in samples])
+            self.assertListEqual(dataset.values("int_field"), list(range(50)))
+            self.assertIn("str_field", dataset.get_field_schema())
+            self.assertTrue(all(s.in_dataset for s in samples))
+
+            # Validation errors are raised
+            samples = [
+                fo.Sample(filepath="image%d.png" % i, int_field=i)
+                for i in range(50)
+            ]
+            samples[30]["int_field"] = "not an int"
+
+            dataset = fo.Dataset()
+            dataset.add_sample_field("int_field", fo.IntField)
+            with self.assertRaises(ValueError):
+                dataset.add_samples(
+                    samples, expand_schema=False, num_workers=2
+                )
+
+            # Batches before the invalid sample were added
+            self.assertEqual(len(dataset), 28)
+
+            # Errors raised while iterating over the samples
+            def _iter_samples():
+                for i in range(30):
+                    yield fo.Sample(filepath="image%d.png" % i)
+
+                raise ValueError("oops")
+
+            dataset = fo.Dataset()
+            with self.assertRaises(ValueError):
+                dataset.add_samples(_iter_samples(), num_workers=2)
+
+            # Batches that were serialized before the error were added
+            self.assertEqual(len(dataset), 28)
+
+            # Serialization errors
+            samples = [
+                fo.Sample(filepath="image%d.png" % i) for i in range(50)
+            ]
+            make_dicts = fod.Dataset._make_dicts
+
+            def _make_dicts(self, samples):
+                if any(s.filepath.endswith("image10.png") for s in samples):
+                    raise ValueError("oops")
+
+                return make_dicts(self, samples)
+
+            dataset = fo.Dataset()
+            with mock.patch.object(fod.Dataset, "_make_dicts", _make_dicts):
+                with self.assertRaises(ValueError):
+                    dataset.add_samples(samples, num_workers=2)
+
+            # Batches after the one that failed were not added
+            self.assertEqual(len(dataset), 7)
+        finally:
+            fo.config.default_batcher = default_batcher
+            fo.config.batcher_static_size = batcher_static_size
+
+    @drop_datasets
+    def test_add_sample_dicts(self):
+        samples = [
+            fo.Sample(
+                filepath="image%d.png" % i,
+                int_field=i,
+                ground_truth=fo.Detections(
+                    detections=[fo.Detection(label="cat", foo="bar")]
+                ),
+            )
+            for i in range(10)
+        ]
+        samples[-1]["str_field"] = "hello"
+
+        dicts = [sample.to_mongo_dict() for sample in samples]
+        dicts.append({"filepath": "image10.png", "int_field": None})
+
+        dataset = fo.Dataset()
+        sample_ids = dataset.add_sample_dicts(dicts, dynamic=True)
+
+        self.assertEqual(len(dataset), 11)
+        self.assertListEqual(sample_ids, dataset.values("id"))
+        self.assertNotIn("_id", dicts[0])
+        self.assertEqual(dataset.media_type, "image")
+        self.assertListEqual(
+            dataset.values("int_field"), list(range(10)) + [None]
+        )
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.foo", unwind=True),
+            ["bar"] * 10,
+        )
+
+        schema = dataset.get_field_schema(flat=True)
+        self.assertIsInstance(schema["int_field"], fo.IntField)
+        self.assertIsInstance(schema["str_field"], fo.StringField)
+        self.assertIsInstance(
+            schema["ground_truth.detections.foo"], fo.StringField
+        )
+
+        sample = dataset.last()
+        self.assertListEqual(sample.tags, [])
+        self.assertEqual(sample.media_type, "image")
+
+        dataset = fo.Dataset()
+        dataset.add_sample_dicts(
+            [{"filepath": "image.png", "float_field": 1}],
+            schema={"float_field": fo.FloatField()},
+        )
+        self.assertIsInstance(dataset.get_field("float_field"), fo.FloatField)
+
+        with self.assertRaises(ValueError):
+            dataset.add_sample_dicts(
+                [{"filepath": "image.png", "new_field": 1}],
+                expand_schema=False,
+            )
+
+        with self.assertRaises(ValueError):
+            dataset.add_sample_dicts(
+                [{"filepath": "image.png", "float_field": "not a float"}]
+            )
+
+        self.assertEqual(len(dataset), 1)
+
     @drop_datasets
     def test_datetime_fields(self):
         dataset = fo.Dataset()
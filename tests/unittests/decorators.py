@@ -5,6 +5,7 @@ Decorator utils for unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
 from functools import wraps
 import platform
 import unittest
@@ -17,6 +18,15 @@ def drop_datasets(func):
     before running a test.
     """
 
+    if asyncio.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            fo.delete_non_persistent_datasets()
+            return await func(*args, **kwargs)
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         fo.delete_non_persistent_datasets()
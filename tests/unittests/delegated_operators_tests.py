@@ -5,6 +5,7 @@ FiftyOne delegated operator related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from concurrent.futures import ThreadPoolExecutor
 import time
 import unittest
 from unittest import mock
@@ -1063,3 +1064,164 @@ class DelegatedOperationServiceTests(unittest.TestCase):
 
         doc = self.svc.get(doc.id)
         self.assertEqual(doc.label, "this is my delegated operation run.")
+
+    @patch(
+        "fiftyone.core.odm.utils.load_dataset",
+    )
+    def test_claim_operation(
+        self, mock_load_dataset, mock_get_operator, mock_operator_exists
+    ):
+        dataset_id = ObjectId()
+        mock_load_dataset.return_value.name = f"test_dataset_{dataset_id}"
+        mock_load_dataset.return_value._doc.id = dataset_id
+
+        delegation_target = f"test_target_{ObjectId()}"
+        for _ in range(10):
+            doc = self.svc.queue_operation(
+                operator="@voxelfiftyone/operator/foo",
+                delegation_target=delegation_target,
+                context=ExecutionContext(request_params={"foo": "bar"}),
+            )
+            self.docs_to_delete.append(doc)
+
+        # Concurrent claims never return the same operation
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            docs = list(
+                executor.map(
+                    lambda _: self.svc.claim_operation(
+                        delegation_target=delegation_target
+                    ),
+                    range(12),
+                )
+            )
+
+        ids = [doc.id for doc in docs if doc is not None]
+        self.assertEqual(len(ids), 10)
+        self.assertEqual(len(set(ids)), 10)
+
+        for doc_id in ids:
+            doc = self.svc.get(doc_id=doc_id)
+            self.assertEqual(doc.run_state, ExecutionRunState.RUNNING)
+            self.assertIsNotNone(doc.started_at)
+            self.assertIsNotNone(doc.heartbeat_at)
+
+    @patch(
+        "fiftyone.core.odm.utils.load_dataset",
+    )
+    def test_claim_operation_max_running_per_dataset(
+        self, mock_load_dataset, mock_get_operator, mock_operator_exists
+    ):
+        delegation_target = f"test_target_{ObjectId()}"
+        dataset_ids = [ObjectId(), ObjectId()]
+        for dataset_id in dataset_ids * 2:
+            dataset_name = f"test_dataset_{dataset_id}"
+            mock_load_dataset.return_value.name = dataset_name
+            mock_load_dataset.return_value._doc.id = dataset_id
+            doc = self.svc.queue_operation(
+                operator="@voxelfiftyone/operator/foo",
+                delegation_target=delegation_target,
+                context=ExecutionContext(
+                    request_params={"foo": "bar", "dataset_name": dataset_name}
+                ),
+            )
+            self.docs_to_delete.append(doc)
+
+        docs = []
+        while True:
+            doc = self.svc.claim_operation(
+                delegation_target=delegation_target,
+                max_running_per_dataset=1,
+            )
+            if doc is None:
+                break
+
+            docs.append(doc)
+
+        self.assertEqual(len(docs), 2)
+        self.assertSetEqual({doc.dataset_id for doc in docs}, set(dataset_ids))
+
+    @patch(
+        "fiftyone.core.odm.utils.load_dataset",
+    )
+    def test_requeue_expired_operations(
+        self, mock_load_dataset, mock_get_operator, mock_operator_exists
+    ):
+        mock_load_dataset.return_value = MockDataset()
+
+        delegation_target = f"test_target_{ObjectId()}"
+        doc = self.svc.queue_operation(
+            operator="@voxelfiftyone/operator/foo",
+            delegation_target=delegation_target,
+            context=ExecutionContext(request_params={"foo": "bar"}),
+        )
+        self.docs_to_delete.append(doc)
+
+        doc = self.svc.claim_operation(delegation_target=delegation_target)
+        self.assertEqual(doc.run_state, ExecutionRunState.RUNNING)
+        claim_token = doc.claim_token
+        self.assertIsNotNone(claim_token)
+
+        # Live leases are not requeued
+        self.svc.requeue_expired_operations(lease_duration=60)
+        doc = self.svc.get(doc_id=doc.id)
+        self.assertEqual(doc.run_state, ExecutionRunState.RUNNING)
+        self.assertListEqual(
+            self.svc._repo.heartbeat({doc.id: claim_token}), []
+        )
+
+        time.sleep(0.1)
+
+        self.svc.requeue_expired_operations(lease_duration=0.05)
+        doc = self.svc.get(doc_id=doc.id)
+        self.assertEqual(doc.run_state, ExecutionRunState.QUEUED)
+        self.assertIsNone(doc.started_at)
+        self.assertIsNone(doc.heartbeat_at)
+        self.assertIsNone(doc.claim_token)
+
+        # Expired claims can no longer record heartbeats or results
+        self.assertListEqual(
+            self.svc._repo.heartbeat({doc.id: claim_token}), [doc.id]
+        )
+        self.assertIsNone(
+            self.svc.set_completed(doc_id=doc.id, claim_token=claim_token)
+        )
+        doc = self.svc.get(doc_id=doc.id)
+        self.assertEqual(doc.run_state, ExecutionRunState.QUEUED)
+
+        self.svc.execute_queued_operations(delegation_target=delegation_target)
+        doc = self.svc.get(doc_id=doc.id)
+        self.assertEqual(doc.run_state, ExecutionRunState.COMPLETED)
+
+    @patch(
+        "fiftyone.core.odm.utils.load_dataset",
+    )
+    def test_execute_queued_operations_concurrently(
+        self, mock_load_dataset, mock_get_operator, mock_operator_exists
+    ):
+        mock_get_operator.return_value = MockProgressiveOperator()
+        mock_load_dataset.return_value = MockDataset()
+
+        delegation_target = f"test_target_{ObjectId()}"
+        for _ in range(4):
+            doc = self.svc.queue_operation(
+                operator="@voxelfiftyone/operator/foo",
+                delegation_target=delegation_target,
+                context=ExecutionContext(request_params={"foo": "bar"}),
+            )
+            self.docs_to_delete.append(doc)
+
+        start = time.time()
+        self.svc.execute_queued_operations(
+            delegation_target=delegation_target,
+            num_workers=4,
+            lease_duration=0.2,
+        )
+        elapsed = time.time() - start
+
+        # Each operation takes ~1s
+        self.assertLess(elapsed, 3)
+
+        for doc in self.docs_to_delete:
+            doc = self.svc.get(doc_id=doc.id)
+            self.assertEqual(doc.run_state, ExecutionRunState.COMPLETED)
+            self.assertEqual(doc.status.progress, 0.9)
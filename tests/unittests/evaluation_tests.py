@@ -10,6 +10,7 @@ import random
 import string
 import sys
 import unittest
+from unittest import mock
 import warnings
 
 import numpy as np
@@ -24,6 +25,7 @@ import fiftyone.utils.eval.regression as four
 import fiftyone.utils.eval.segmentation as fous
 import fiftyone.utils.labels as foul
 import fiftyone.utils.iou as foui
+import fiftyone.utils.utils3d as fou3d
 
 from decorators import drop_datasets
 
@@ -1696,6 +1698,240 @@ class DetectionsTests(unittest.TestCase):
 
         self._evaluate_coco(dataset, kwargs)
 
+    @drop_datasets
+    def test_evaluate_detections_coco_crowds(self):
+        dataset = fo.Dataset()
+        dataset.add_sample(
+            fo.Sample(
+                filepath="image.jpg",
+                ground_truth=fo.Detections(
+                    detections=[
+                        fo.Detection(
+                            label="person",
+                            bounding_box=[0.1, 0.1, 0.8, 0.8],
+                            iscrowd=True,
+                        ),
+                        fo.Detection(
+                            label="person",
+                            bounding_box=[0.1, 0.1, 0.2, 0.2],
+                        ),
+                    ]
+                ),
+                predictions=fo.Detections(
+                    detections=[
+                        fo.Detection(
+                            label="person",
+                            bounding_box=[0.1, 0.1, 0.2, 0.2],
+                            confidence=0.9,
+                        ),
+                        fo.Detection(
+                            label="person",
+                            bounding_box=[0.1, 0.1, 0.2, 0.2],
+                            confidence=0.8,
+                        ),
+                        fo.Detection(
+                            label="person",
+                            bounding_box=[0.5, 0.5, 0.2, 0.2],
+                            confidence=0.7,
+                        ),
+                    ]
+                ),
+            )
+        )
+
+        results = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval",
+            method="coco",
+            compute_mAP=True,
+        )
+
+        sample = dataset.first()
+        crowd, gt = sample.ground_truth.detections
+        pred1, pred2, pred3 = sample.predictions.detections
+
+        # Highest confidence prediction matches the non-crowd object
+        self.assertEqual(pred1.eval, "tp")
+        self.assertEqual(pred1.eval_id, gt.id)
+        self.assertEqual(gt.eval_id, pred1.id)
+
+        # Remaining predictions match the crowd, which records the first
+        self.assertEqual(pred2.eval, "tp")
+        self.assertEqual(pred2.eval_id, crowd.id)
+        self.assertEqual(pred3.eval, "tp")
+        self.assertEqual(pred3.eval_id, crowd.id)
+        self.assertEqual(crowd.eval_id, pred2.id)
+
+        self.assertEqual(sample.eval_tp, 3)
+        self.assertEqual(sample.eval_fp, 0)
+        self.assertEqual(sample.eval_fn, 0)
+
+        # Crowd matches are omitted from precision-recall
+        self.assertAlmostEqual(results.mAP(), 1.0)
+
+    @drop_datasets
+    def test_evaluate_detections_num_workers(self):
+        dataset = self._make_detections_dataset()
+
+        results1 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval1",
+            compute_mAP=True,
+        )
+
+        results2 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval2",
+            compute_mAP=True,
+            num_workers=2,
+        )
+
+        for field in ("tp", "fp", "fn"):
+            self.assertListEqual(
+                dataset.values("eval1_%s" % field),
+                dataset.values("eval2_%s" % field),
+            )
+
+        for field in ("ground_truth", "predictions"):
+            path = field + ".detections.%s"
+            self.assertListEqual(
+                dataset.values(path % "eval1"),
+                dataset.values(path % "eval2"),
+            )
+            self.assertListEqual(
+                dataset.values(path % "eval1_id"),
+                dataset.values(path % "eval2_id"),
+            )
+
+        self.assertDictEqual(results1.metrics(), results2.metrics())
+        self.assertAlmostEqual(results1.mAP(), results2.mAP())
+        self.assertTrue(
+            np.array_equal(
+                results1.confusion_matrix(), results2.confusion_matrix()
+            )
+        )
+
+    @drop_datasets
+    def test_evaluate_detections_num_workers_patches(self):
+        dataset = self._make_detections_dataset()
+
+        dataset.evaluate_detections(
+            "predictions", gt_field="ground_truth", eval_key="eval"
+        )
+        patches = dataset.to_evaluation_patches("eval")
+
+        results1 = patches.evaluate_detections(
+            "predictions", gt_field="ground_truth"
+        )
+
+        # Generated views can't be rebuilt by workers, so they are always
+        # evaluated in the main process
+        with mock.patch.object(foud, "_evaluate_detections_multi") as multi:
+            results2 = patches.evaluate_detections(
+                "predictions", gt_field="ground_truth", num_workers=2
+            )
+
+        multi.assert_not_called()
+        self.assertDictEqual(results1.metrics(), results2.metrics())
+
+    @drop_datasets
+    def test_evaluate_detections_columnar(self):
+        dataset = self._make_detections_dataset()
+
+        results1 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval1",
+            compute_mAP=True,
+        )
+
+        results2 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval2",
+            compute_mAP=True,
+            columnar=True,
+        )
+
+        for field in ("tp", "fp", "fn"):
+            self.assertListEqual(
+                dataset.values("eval1_%s" % field),
+                dataset.values("eval2_%s" % field),
+            )
+
+        for field in ("ground_truth", "predictions"):
+            path = field + ".detections.%s"
+            for key in ("", "_id", "_iou"):
+                self.assertListEqual(
+                    dataset.values(path % ("eval1" + key)),
+                    dataset.values(path % ("eval2" + key)),
+                )
+
+        self.assertDictEqual(results1.metrics(), results2.metrics())
+        self.assertAlmostEqual(results1.mAP(), results2.mAP())
+        self.assertTrue(
+            np.array_equal(
+                results1.confusion_matrix(), results2.confusion_matrix()
+            )
+        )
+
+        # The IoU sweep is columnar even when workers evaluate the shards
+        with mock.patch.object(
+            coco,
+            "_iter_columnar_iou_sweep",
+            wraps=coco._iter_columnar_iou_sweep,
+        ) as sweep:
+            results3 = dataset.evaluate_detections(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval3",
+                compute_mAP=True,
+                columnar=True,
+                num_workers=2,
+            )
+
+        sweep.assert_called_once()
+        self.assertAlmostEqual(results1.mAP(), results3.mAP())
+
+        with self.assertRaises(ValueError):
+            dataset.evaluate_detections(
+                "predictions",
+                gt_field="ground_truth",
+                use_masks=True,
+                columnar=True,
+            )
+
+        # Crowd attributes may be stored in the legacy `attributes` dict
+        for sample in dataset.iter_samples(autosave=True):
+            if sample.ground_truth is not None:
+                for detection in sample.ground_truth.detections:
+                    detection.attributes["iscrowd"] = fo.Attribute(value=True)
+
+        results1 = dataset.evaluate_detections(
+            "predictions", gt_field="ground_truth", compute_mAP=True
+        )
+        results2 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            compute_mAP=True,
+            columnar=True,
+        )
+        self.assertDictEqual(results1.metrics(), results2.metrics())
+        self.assertAlmostEqual(results1.mAP(), results2.mAP())
+
+        # 3D cuboids are not supported
+        sample = dataset.exists("ground_truth").first()
+        sample.ground_truth.detections[0].dimensions = [1, 1, 1]
+        sample.save()
+
+        with self.assertRaises(ValueError):
+            dataset.evaluate_detections(
+                "predictions", gt_field="ground_truth", columnar=True
+            )
+
     @drop_datasets
     def test_evaluate_instances_coco(self):
         dataset = self._make_instances_dataset()
@@ -1981,6 +2217,145 @@ class CuboidTests(unittest.TestCase):
         self._check_iou(dataset, "test4_box1", "test4_box4", expected_iou)
 
 
+class CuboidIoUTests(unittest.TestCase):
+    def _make_cuboids(self, num_objects, axis):
+        detections = []
+        for _ in range(num_objects):
+            rotation = [0.0, 0.0, 0.0]
+            rotation[axis] = random.uniform(-np.pi, np.pi)
+            detections.append(
+                fo.Detection(
+                    label=random.choice(["cat", "dog", "rabbit"]),
+                    location=[random.uniform(0, 4) for _ in range(3)],
+                    dimensions=[random.uniform(0.5, 3) for _ in range(3)],
+                    rotation=rotation,
+                    iscrowd=random.random() < 0.25,
+                )
+            )
+
+        return detections
+
+    def _compute_pairwise_ious(self, preds, gts, iscrowd, classwise):
+        is_symmetric = preds is gts
+        ious = np.zeros((len(preds), len(gts)))
+        for j, gt in enumerate(gts):
+            gt_crowd = iscrowd(gt) if iscrowd is not None else False
+            for i, pred in enumerate(preds):
+                if is_symmetric and i < j:
+                    ious[i, j] = ious[j, i]
+                elif is_symmetric and i == j:
+                    ious[i, j] = 1
+                elif classwise and pred.label != gt.label:
+                    continue
+                else:
+                    ious[i, j] = fou3d.compute_cuboid_iou(
+                        gt, pred, gt_crowd=gt_crowd
+                    )
+
+        return ious
+
+    def test_batch_ious(self):
+        random.seed(51)
+        iscrowd = lambda l: bool(l.get_attribute_value("iscrowd", False))
+
+        for axis in range(3):
+            for _ in range(5):
+                preds = self._make_cuboids(random.randint(1, 10), axis)
+                gts = self._make_cuboids(random.randint(1, 10), axis)
+
+                for classwise in (False, True):
+                    for _iscrowd in (None, iscrowd):
+                        ious = foui.compute_ious(
+                            preds, gts, iscrowd=_iscrowd, classwise=classwise
+                        )
+                        expected = self._compute_pairwise_ious(
+                            preds, gts, _iscrowd, classwise
+                        )
+                        self.assertTrue(np.allclose(ious, expected))
+
+                        ious = foui.compute_ious(
+                            preds, preds, iscrowd=_iscrowd, classwise=classwise
+                        )
+                        expected = self._compute_pairwise_ious(
+                            preds, preds, _iscrowd, classwise
+                        )
+                        self.assertTrue(np.allclose(ious, expected))
+
+    def test_mixed_rotation_axes(self):
+        gt = fo.Detection(
+            location=[0, 0, 0], dimensions=[1, 1, 1], rotation=[0.2, 0, 0.3]
+        )
+        pred = fo.Detection(
+            location=[0, 0, 0], dimensions=[1, 1, 1], rotation=[0, 0, 0]
+        )
+
+        ious = foui.compute_ious([pred], [gt])
+        expected = fou3d.compute_cuboid_iou(gt, pred)
+        self.assertTrue(np.isclose(ious[0, 0], expected))
+
+
+class BoxIoUTests(unittest.TestCase):
+    def _make_detections(self, num_objects):
+        detections = []
+        for _ in range(num_objects):
+            x, y = random.random(), random.random()
+            w, h = random.choice([0.0, 0.5 * random.random()]), random.random()
+            detections.append(
+                fo.Detection(
+                    label=random.choice(["cat", "dog", "rabbit"]),
+                    bounding_box=[x, y, w, h],
+                    iscrowd=random.random() < 0.25,
+                )
+            )
+
+        return detections
+
+    def _compute_pairwise_ious(self, preds, gts, iscrowd, classwise):
+        is_symmetric = preds is gts
+        ious = np.zeros((len(preds), len(gts)))
+        for j, gt in enumerate(gts):
+            gt_crowd = iscrowd(gt) if iscrowd is not None else False
+            for i, pred in enumerate(preds):
+                if is_symmetric and i < j:
+                    ious[i, j] = ious[j, i]
+                elif is_symmetric and i == j:
+                    ious[i, j] = 1
+                elif classwise and pred.label != gt.label:
+                    continue
+                else:
+                    ious[i, j] = foui.compute_bbox_iou(
+                        gt, pred, gt_crowd=gt_crowd
+                    )
+
+        return ious
+
+    def test_batch_ious(self):
+        random.seed(51)
+        iscrowd = lambda l: bool(l.get_attribute_value("iscrowd", False))
+
+        for _ in range(20):
+            preds = self._make_detections(random.randint(1, 25))
+            gts = self._make_detections(random.randint(1, 25))
+
+            for classwise in (False, True):
+                for _iscrowd in (None, iscrowd):
+                    ious = foui.compute_ious(
+                        preds, gts, iscrowd=_iscrowd, classwise=classwise
+                    )
+                    expected = self._compute_pairwise_ious(
+                        preds, gts, _iscrowd, classwise
+                    )
+                    self.assertTrue(np.array_equal(ious, expected))
+
+                    ious = foui.compute_ious(
+                        preds, preds, iscrowd=_iscrowd, classwise=classwise
+                    )
+                    expected = self._compute_pairwise_ious(
+                        preds, preds, _iscrowd, classwise
+                    )
+                    self.assertTrue(np.array_equal(ious, expected))
+
+
 class VideoDetectionsTests(unittest.TestCase):
     def _make_video_detections_dataset(self):
         dataset = fo.Dataset()
@@ -253,6 +253,29 @@ class GroupTests(unittest.TestCase):
         self.assertNotIn("ego", group)
         self.assertIn("right", group)
 
+    @drop_datasets
+    def test_iter_groups_prefetch(self):
+        dataset = _make_group_dataset()
+
+        groups = list(dataset.iter_groups(prefetch=1))
+        self.assertEqual(len(groups), 2)
+        self.assertListEqual(
+            [g["ego"].id for g in groups], dataset.values("id")
+        )
+
+        for group in dataset.iter_groups(autosave=True, prefetch=1):
+            for sample in group.values():
+                sample["new_field"] = 1
+
+        self.assertEqual(
+            len(
+                dataset.select_group_slices(_allow_mixed=True).exists(
+                    "new_field"
+                )
+            ),
+            6,
+        )
+
     @drop_datasets
     def test_one_fo3d_group_slice(self):
         dataset = fo.Dataset()
@@ -1358,8 +1381,11 @@ class GroupImportExportTests(unittest.TestCase):
         group_indexes = {
             "id",
             "filepath",
+            "_rand",
+            "_last_modified_at",
             "frames.id",
             "frames._sample_id_1_frame_number_1",
+            "frames._last_modified_at",
             "group_field.id",
             "group_field.name",
         }
@@ -1614,7 +1640,7 @@ class DynamicGroupTests(unittest.TestCase):
         self.assertEqual(len(view1), 2)
         self.assertSetEqual(
             set(dataset.list_indexes()),
-            {"id", "filepath", "sample_id"},
+            {"id", "filepath", "_rand", "_last_modified_at", "sample_id"},
         )
 
         sample = view1.first()
@@ -1676,7 +1702,14 @@ class DynamicGroupTests(unittest.TestCase):
         self.assertEqual(len(view1), 2)
         self.assertSetEqual(
             set(dataset.list_indexes()),
-            {"id", "filepath", "_sample_id_1_frame_number_-1"},
+            {
+                "id",
+                "filepath",
+                "_rand",
+                "_last_modified_at",
+                "_last_modified_at",
+                "_sample_id_1_frame_number_-1",
+            },
         )
 
         sample = view1.first()
@@ -1765,7 +1798,14 @@ class DynamicGroupTests(unittest.TestCase):
         self.assertEqual(len(view), 4)
         self.assertSetEqual(
             set(dataset.list_indexes()),
-            {"id", "filepath", "_sample_id_1_device_id_1"},
+            {
+                "id",
+                "filepath",
+                "_rand",
+                "_last_modified_at",
+                "_last_modified_at",
+                "_sample_id_1_device_id_1",
+            },
         )
 
         also_view = fo.DatasetView._build(dataset, view._serialize())
@@ -1779,7 +1819,14 @@ class DynamicGroupTests(unittest.TestCase):
         self.assertEqual(len(view2), 4)
         self.assertSetEqual(
             set(dataset2.list_indexes()),
-            {"id", "filepath", "_sample_id_1_device_id_1"},
+            {
+                "id",
+                "filepath",
+                "_rand",
+                "_last_modified_at",
+                "_last_modified_at",
+                "_sample_id_1_device_id_1",
+            },
         )
 
         also_view2 = fo.DatasetView._build(dataset2, view2._serialize())
@@ -1787,7 +1834,14 @@ class DynamicGroupTests(unittest.TestCase):
         self.assertEqual(len(also_view2), 4)
         self.assertSetEqual(
             set(dataset2.list_indexes()),
-            {"id", "filepath", "_sample_id_1_device_id_1"},
+            {
+                "id",
+                "filepath",
+                "_rand",
+                "_last_modified_at",
+                "_last_modified_at",
+                "_sample_id_1_device_id_1",
+            },
         )
 
     @drop_datasets
@@ -28,6 +28,14 @@ class ServerIndexTests(unittest.TestCase):
                 name="filepath",
                 key=[IndexFields(field="filepath", type="asc")],
             ),
+            Index(
+                name="_rand",
+                key=[IndexFields(field="_rand", type="asc")],
+            ),
+            Index(
+                name="_last_modified_at",
+                key=[IndexFields(field="_last_modified_at", type="asc")],
+            ),
         ], []
         sample_result, frame_result = from_dict(
             dataset.get_index_information()
@@ -48,6 +56,14 @@ class ServerIndexTests(unittest.TestCase):
                 name="filepath",
                 key=[IndexFields(field="filepath", type="asc")],
             ),
+            Index(
+                name="_rand",
+                key=[IndexFields(field="_rand", type="asc")],
+            ),
+            Index(
+                name="_last_modified_at",
+                key=[IndexFields(field="_last_modified_at", type="asc")],
+            ),
             Index(
                 name="group.id",
                 key=[IndexFields(field="group._id", type="asc")],
@@ -76,6 +92,14 @@ class ServerIndexTests(unittest.TestCase):
                 name="filepath",
                 key=[IndexFields(field="filepath", type="asc")],
             ),
+            Index(
+                name="_rand",
+                key=[IndexFields(field="_rand", type="asc")],
+            ),
+            Index(
+                name="_last_modified_at",
+                key=[IndexFields(field="_last_modified_at", type="asc")],
+            ),
         ], [
             Index(
                 name="id",
@@ -89,6 +113,10 @@ class ServerIndexTests(unittest.TestCase):
                 ],
                 unique=True,
             ),
+            Index(
+                name="_last_modified_at",
+                key=[IndexFields(field="_last_modified_at", type="asc")],
+            ),
         ]
         sample_result, frame_result = from_dict(
             dataset.get_index_information()
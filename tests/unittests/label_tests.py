@@ -13,6 +13,7 @@ import numpy.testing as nptest
 
 import fiftyone as fo
 import fiftyone.core.labels as focl
+import fiftyone.utils.iou as fouiou
 import fiftyone.utils.labels as foul
 from fiftyone import ViewField as F
 
@@ -560,6 +561,188 @@ class LabelUtilsTests(unittest.TestCase):
         ids3 = dataset.values("nms3.detections.id", unwind=True)
         self.assertListEqual(ids3, [id2])
 
+        self.assertIsNone(dataset.last().nms1)
+
+        foul.perform_nms(dataset, "predictions", iou_thresh=0.5)
+        ids4 = dataset.values("predictions.detections.id", unwind=True)
+        self.assertListEqual(ids4, [id2, id3])
+
+    @drop_datasets
+    def test_perform_nms_filtered_view(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image1.jpg",
+                    predictions=fo.Detections(
+                        detections=[
+                            fo.Detection(
+                                label="cat",
+                                bounding_box=[0, 0, 0.30, 0.30],
+                                confidence=0.9,
+                            ),
+                            fo.Detection(
+                                label="cat",
+                                bounding_box=[0, 0, 0.29, 0.29],
+                                confidence=0.8,
+                            ),
+                            fo.Detection(
+                                label="dog",
+                                bounding_box=[0.5, 0.5, 0.3, 0.3],
+                                confidence=0.3,
+                            ),
+                        ]
+                    ),
+                ),
+                fo.Sample(filepath="image2.jpg"),
+            ]
+        )
+
+        view = dataset.filter_labels(
+            "predictions", F("confidence") > 0.5, only_matches=False
+        )
+
+        foul.perform_nms(view, "predictions", out_field="nms")
+        self.assertListEqual(
+            dataset.values("nms.detections.confidence"), [[0.9], []]
+        )
+
+        foul.perform_nms(view, "predictions")
+        self.assertListEqual(
+            view.values("predictions.detections.confidence"), [[0.9], None]
+        )
+
+    @drop_datasets
+    def test_perform_nms_dense(self):
+        rng = np.random.default_rng(51)
+
+        samples = []
+        for _ in range(5):
+            detections = []
+            for _ in range(300):
+                x, y = rng.random(2) * 0.8
+                w, h = rng.random(2) * 0.2
+
+                # Include ties and missing confidences
+                confidence = rng.choice([None, 0.5, rng.random()])
+                if confidence is not None:
+                    confidence = float(confidence)
+
+                detections.append(
+                    fo.Detection(
+                        label=rng.choice(["cat", "dog", "bird"]),
+                        bounding_box=[x, y, w, h],
+                        confidence=confidence,
+                    )
+                )
+
+            samples.append(
+                fo.Sample(
+                    filepath="image%d.jpg" % len(samples),
+                    predictions=fo.Detections(detections=detections),
+                )
+            )
+
+        dataset = fo.Dataset()
+        dataset.add_samples(samples)
+
+        for classwise, iou_thresh, confidence_thresh, batch_size in (
+            (True, 0.5, None, 1000),
+            (False, 0.3, None, 2),
+            (True, 0.1, 0.4, 1000),
+            (False, 0.0, None, 1),
+        ):
+            foul.perform_nms(
+                dataset,
+                "predictions",
+                out_field="nms",
+                iou_thresh=iou_thresh,
+                confidence_thresh=confidence_thresh,
+                classwise=classwise,
+                batch_size=batch_size,
+            )
+
+            for sample in dataset:
+                expected = _perform_nms_reference(
+                    sample.predictions.detections,
+                    iou_thresh=iou_thresh,
+                    confidence_thresh=confidence_thresh,
+                    classwise=classwise,
+                )
+                self.assertListEqual(
+                    [d.id for d in sample.nms.detections],
+                    [d.id for d in expected],
+                )
+
+    @drop_datasets
+    def test_perform_nms_video(self):
+        detections = [
+            fo.Detection(
+                label="cat", bounding_box=[0, 0, 0.30, 0.30], confidence=0.9
+            ),
+            fo.Detection(
+                label="cat", bounding_box=[0, 0, 0.29, 0.29], confidence=1
+            ),
+        ]
+
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(
+            predictions=fo.Detections(detections=detections)
+        )
+        sample.frames[2] = fo.Frame()
+        sample.frames[3] = fo.Frame(predictions=fo.Detections())
+
+        dataset = fo.Dataset()
+        dataset.add_sample(sample)
+
+        foul.perform_nms(dataset, "frames.predictions", out_field="frames.nms")
+
+        self.assertListEqual(
+            dataset.values("frames.nms.detections.id", unwind=True),
+            [detections[1].id],
+        )
+        self.assertListEqual(
+            [f.nms is None for f in dataset.first().frames.values()],
+            [False, True, False],
+        )
+
+
+def _perform_nms_reference(
+    detections, iou_thresh=0.5, confidence_thresh=None, classwise=True
+):
+    # The original pure Python implementation of NMS
+    detections = sorted(
+        detections,
+        key=lambda d: (d.confidence is not None, d.confidence),
+        reverse=True,
+    )
+
+    if confidence_thresh is not None:
+        detections = [
+            d
+            for d in detections
+            if d.confidence is not None and d.confidence >= confidence_thresh
+        ]
+
+    nms_detections = []
+    while detections:
+        d0 = detections.pop(0)
+        nms_detections.append(d0)
+
+        rm_inds = []
+        for i, d in enumerate(detections):
+            if classwise and d.label != d0.label:
+                continue
+
+            iou = fouiou.compute_bbox_iou(d0, d)
+            if iou >= iou_thresh:
+                rm_inds.append(i)
+
+        for i in reversed(rm_inds):
+            del detections[i]
+
+    return nms_detections
+
 
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
@@ -16,6 +16,7 @@ import eta.core.utils as etau
 import eta.core.video as etav
 
 import fiftyone as fo
+import fiftyone.core.models as fomo
 import fiftyone.utils.image as foui
 
 from decorators import drop_datasets
@@ -59,6 +60,20 @@ class MockBatchImageModel(MockImageModel):
         return False  # allow batching
 
 
+class MockImageSizeModel(MockBatchImageModel):
+    def predict(self, arg):
+        return fo.Classification(label=str(arg.shape[1]))
+
+    def predict_all(self, args):
+        return [self.predict(arg) for arg in args]
+
+    def embed(self, arg):
+        return np.full(4, arg.shape[1])
+
+    def embed_all(self, args):
+        return np.stack([self.embed(arg) for arg in args])
+
+
 class ImageDatasetTests(unittest.TestCase):
     def setUp(self):
         temp_dir = etau.TempDir()
@@ -141,6 +156,21 @@ class ImageModelTests(ImageDatasetTests):
         )
         self.assertEqual(len(dataset.exists("embeddings")), 5)
 
+        embeddings = np.stack(dataset.values("embeddings"))
+        _embeddings = fo.get_embeddings(dataset, "embeddings")
+        self.assertTrue(np.array_equal(_embeddings, embeddings))
+        self.assertTrue(
+            np.array_equal(
+                fo.get_embeddings(dataset[1:3], "embeddings"), embeddings[1:3]
+            )
+        )
+
+        sample = dataset.first()
+        sample.clear_field("embeddings")
+        sample.save()
+        with self.assertRaises(ValueError):
+            fo.get_embeddings(dataset, "embeddings")
+
         # Patch embeddings
 
         embeddings = dataset.compute_patch_embeddings(
@@ -168,6 +198,119 @@ class ImageModelTests(ImageDatasetTests):
         model = MockBatchImageModel()
         self._test_model(model, batch_size=2)
 
+    @drop_datasets
+    def test_image_model_prefetch(self):
+        filepaths = []
+        for width in range(10, 20):
+            filepath = os.path.join(self.images_dir, "%d.png" % width)
+            img = np.zeros((8, width, 3), dtype=np.uint8)
+            foui.write(img, filepath)
+            filepaths.append(filepath)
+
+        filepaths.append(os.path.join(self.images_dir, "missing.png"))
+
+        dataset = fo.Dataset()
+        dataset.add_samples([fo.Sample(filepath=f) for f in filepaths])
+
+        expected = [str(w) for w in range(10, 20)] + [None]
+        model = MockImageSizeModel()
+
+        for num_workers in (0, 3):
+            dataset.apply_model(
+                model, label_field="single", num_workers=num_workers
+            )
+            self.assertListEqual(dataset.values("single.label"), expected)
+
+            embeddings = dataset.compute_embeddings(
+                model, num_workers=num_workers
+            )
+            self.assertListEqual(
+                [e[0] if e is not None else None for e in embeddings],
+                list(range(10, 20)) + [None],
+            )
+
+            # The batch containing the missing image fails as a whole
+            dataset.apply_model(
+                model,
+                label_field="batch",
+                batch_size=3,
+                num_workers=num_workers,
+            )
+            self.assertListEqual(
+                dataset.values("batch.label"), expected[:9] + [None, None]
+            )
+
+            dataset.delete_sample_fields(["single", "batch"])
+
+        with self.assertRaises(Exception):
+            dataset.apply_model(
+                model, num_workers=3, batch_size=3, skip_failures=False
+            )
+
+    @drop_datasets
+    def test_async_sample_writer(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(5)]
+        )
+
+        labels = [
+            {
+                "cls": fo.Classification(label=str(i), confidence=i / 4),
+                "none": None,
+            }
+            for i in range(5)
+        ]
+
+        for batching_strategy, batch_size in (
+            ("static", 2),
+            ("size", 1),
+            ("latency", 0.01),
+        ):
+            with fomo._AsyncSampleWriter(
+                dataset,
+                batch_size=batch_size,
+                batching_strategy=batching_strategy,
+                max_queue_size=2,
+            ) as writer:
+                for sample, _labels in zip(dataset, labels):
+                    writer.add_labels(
+                        sample,
+                        _labels,
+                        label_field="pred",
+                        confidence_thresh=0.5,
+                    )
+                    writer.set_values(
+                        sample.id, {"embedding": np.full(3, len(sample.id))}
+                    )
+
+            self.assertListEqual(
+                dataset.values("pred_cls.label"),
+                [None, None, "2", "3", "4"],
+            )
+            self.assertFalse(dataset.has_field("pred_none"))
+            self.assertEqual(len(dataset.values("embedding")[0]), 3)
+            self.assertIsInstance(
+                dataset.get_field("pred_cls"), fo.EmbeddedDocumentField
+            )
+
+            # In-memory samples are reloaded
+            sample = dataset.last()
+            self.assertEqual(sample.pred_cls.label, "4")
+
+            dataset.delete_sample_fields(["pred_cls", "embedding"])
+
+        sample = dataset.first()
+        with self.assertRaises(ValueError):
+            with fomo._AsyncSampleWriter(dataset) as writer:
+                writer.add_labels(sample, fo.Classification(label="cat"))
+
+        with self.assertRaises(ValueError):
+            with fomo._AsyncSampleWriter(
+                dataset, skip_failures=False
+            ) as writer:
+                writer.set_values(sample.id, {"filepath": 1})
+
 
 class VideoDatasetTests(unittest.TestCase):
     def setUp(self):
@@ -96,7 +96,13 @@ class PatchesTests(unittest.TestCase):
         index_info = view.get_index_information()
         indexes = view.list_indexes()
 
-        default_indexes = {"id", "filepath", "sample_id"}
+        default_indexes = {
+            "id",
+            "filepath",
+            "_rand",
+            "_last_modified_at",
+            "sample_id",
+        }
         self.assertSetEqual(set(index_info.keys()), default_indexes)
         self.assertSetEqual(set(indexes), default_indexes)
 
@@ -318,6 +324,94 @@ class PatchesTests(unittest.TestCase):
         self.assertTrue(still_view.is_saved)
         self.assertEqual(still_view, view)
 
+    @drop_datasets
+    def test_to_patches_incremental_reload(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    ground_truth=fo.Detections(
+                        detections=[
+                            fo.Detection(label="cat") for _ in range(i % 3)
+                        ]
+                    ),
+                )
+                for i in range(10)
+            ]
+        )
+
+        view = dataset.to_patches("ground_truth")
+        patches_dataset = view._patches_dataset
+        self.assertEqual(view.count(), 9)
+
+        sample = dataset.skip(1).first()
+        sample.ground_truth.detections[0].label = "dog"
+        sample.ground_truth.detections.append(fo.Detection(label="bird"))
+        sample.save()
+
+        dataset.delete_samples(dataset.skip(2).first())
+        dataset.add_sample(
+            fo.Sample(
+                filepath="image10.jpg",
+                ground_truth=fo.Detections(
+                    detections=[fo.Detection(label="fox")]
+                ),
+            )
+        )
+
+        view.reload()
+
+        # The patches dataset was updated in-place
+        self.assertIs(view._patches_dataset, patches_dataset)
+
+        also_view = dataset.to_patches("ground_truth")
+        self.assertEqual(view.count(), also_view.count())
+        self.assertSetEqual(
+            set(view.values("id")), set(also_view.values("id"))
+        )
+        self.assertDictEqual(
+            view.count_values("ground_truth.label"),
+            also_view.count_values("ground_truth.label"),
+        )
+        self.assertDictEqual(
+            view.count_values("ground_truth.label"),
+            {"cat": 6, "dog": 1, "bird": 1, "fox": 1},
+        )
+
+        # Schema changes to the source collection require a full rebuild
+        dataset.add_sample_field(
+            "ground_truth.detections.hello", fo.StringField
+        )
+        view.reload()
+
+        self.assertIn("ground_truth.hello", view.get_field_schema(flat=True))
+
+        # Deleting a sample shifts unmodified samples into positional views
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    ground_truth=fo.Detections(
+                        detections=[fo.Detection(label="cat")]
+                    ),
+                )
+                for i in range(10)
+            ]
+        )
+
+        view = dataset.limit(5).to_patches("ground_truth")
+        dataset.delete_samples(dataset.first())
+        view.reload()
+
+        also_view = dataset.limit(5).to_patches("ground_truth")
+        self.assertEqual(view.count(), 5)
+        self.assertSetEqual(
+            set(view.values("ground_truth.id")),
+            set(also_view.values("ground_truth.id")),
+        )
+
     @drop_datasets
     def test_to_evaluation_patches(self):
         dataset = fo.Dataset()
@@ -393,7 +487,13 @@ class PatchesTests(unittest.TestCase):
         index_info = view.get_index_information()
         indexes = view.list_indexes()
 
-        default_indexes = {"id", "filepath", "sample_id"}
+        default_indexes = {
+            "id",
+            "filepath",
+            "_rand",
+            "_last_modified_at",
+            "sample_id",
+        }
         self.assertSetEqual(set(index_info.keys()), default_indexes)
         self.assertSetEqual(set(indexes), default_indexes)
 
@@ -5,16 +5,21 @@ FiftyOne sample-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import itertools
 import os
 import tempfile
 import unittest
+from unittest import mock
 
 from bson import Binary, ObjectId
 import numpy as np
 from PIL import ExifTags, Image
 
+import eta.core.utils as etau
+
 import fiftyone as fo
 from fiftyone import ViewField as F
+import fiftyone.core.metadata as fom
 import fiftyone.core.odm as foo
 import fiftyone.core.sample as fos
 
@@ -224,6 +229,45 @@ class SampleTests(unittest.TestCase):
             self.assertEqual(sample.metadata.height, height)
             self.assertEqual(sample.metadata.num_channels, 3)
 
+    def test_get_image_info(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            for ext, mode in itertools.product(
+                (".jpg", ".png", ".webp", ".tif", ".bmp"),
+                ("L", "RGB", "RGBA"),
+            ):
+                if ext == ".jpg" and mode == "RGBA":
+                    continue
+
+                for orientation in (None, 1, 6):
+                    if orientation is not None and ext == ".bmp":
+                        continue
+
+                    img = Image.new(mode, (40, 30))
+                    kwargs = {}
+                    if orientation is not None:
+                        exif = img.getexif()
+                        exif[ExifTags.Base.Orientation] = orientation
+                        kwargs["exif"] = exif
+
+                    path = os.path.join(tmp_dir, "image" + ext)
+                    img.save(path, **kwargs)
+
+                    with open(path, "rb") as f:
+                        info = fom.get_image_info(f)
+
+                    with Image.open(path) as img:
+                        flipped = img.getexif().get(0x0112) in {5, 6, 7, 8}
+                        width, height = img.size
+                        if flipped:
+                            width, height = height, width
+
+                        expected = (width, height, len(img.getbands()))
+
+                    self.assertEqual(info, expected, msg=(ext, mode))
+        finally:
+            etau.delete_dir(tmp_dir)
+
 
 class SampleInDatasetTests(unittest.TestCase):
     @drop_datasets
@@ -567,6 +611,67 @@ class SampleCollectionTests(unittest.TestCase):
         self.assertIsInstance(dataset.view().first(), fos.SampleView)
         self.assertIsInstance(dataset.view().last(), fos.SampleView)
 
+    @drop_datasets
+    def test_compute_metadata(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            filepaths = []
+            for i in range(4):
+                filepath = os.path.join(tmp_dir, "image%d.png" % i)
+                Image.new("RGB", (10 + i, 20)).save(filepath)
+                filepaths.append(filepath)
+
+            cache_path = os.path.join(tmp_dir, "cache.db")
+
+            dataset = fo.Dataset()
+            dataset.add_samples([fo.Sample(filepath=f) for f in filepaths])
+
+            dataset.compute_metadata(
+                num_workers=2, use_processes=True, cache=cache_path
+            )
+            self.assertListEqual(
+                dataset.values("metadata.width"), [10, 11, 12, 13]
+            )
+            self.assertListEqual(
+                dataset.values("metadata.height"), [20, 20, 20, 20]
+            )
+
+            # Cached metadata is reused for unchanged files
+            inputs = list(zip(dataset.values("id"), filepaths, ["image"] * 4))
+            cache = fom._MetadataCache(cache_path)
+            misses, hits = cache.lookup(inputs)
+            cache.close()
+
+            self.assertEqual(len(misses), 0)
+            self.assertEqual(len(hits), 4)
+
+            # Cached metadata is not rewritten
+            with mock.patch.object(fom._MetadataCache, "add") as add:
+                dataset.compute_metadata(overwrite=True, cache=cache_path)
+
+            add.assert_not_called()
+
+            # Modified files are recomputed
+            Image.new("RGB", (50, 60)).save(filepaths[0])
+            os.utime(filepaths[0], ns=(0, 0))
+
+            dataset.compute_metadata(overwrite=True, cache=cache_path)
+            self.assertListEqual(
+                dataset.values("metadata.width"), [50, 11, 12, 13]
+            )
+            self.assertListEqual(
+                dataset.values("metadata.height"), [60, 20, 20, 20]
+            )
+
+            cache = fom._MetadataCache(cache_path)
+            misses, hits = cache.lookup(inputs)
+            cache.close()
+
+            self.assertEqual(len(misses), 0)
+            self.assertEqual(hits[0][2].width, 50)
+        finally:
+            etau.delete_dir(tmp_dir)
+
 
 class VideoSampleTests(unittest.TestCase):
     @drop_datasets
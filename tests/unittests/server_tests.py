@@ -5,14 +5,24 @@ FiftyOne server-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
+import json
 import math
+import struct
+import time
 import unittest
 
+from bson import ObjectId
+import numpy as np
+
 import fiftyone as fo
+from fiftyone import ViewField as F
 import fiftyone.core.dataset as fod
 import fiftyone.core.labels as fol
 import fiftyone.core.odm as foo
 import fiftyone.core.sample as fos
+import fiftyone.server.cache as fosc
+import fiftyone.server.routes.embeddings as fose
 from fiftyone.server.query import Dataset
 from fiftyone.server.samples import paginate_samples
 import fiftyone.server.view as fosv
@@ -896,6 +906,329 @@ class AysncServerViewTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(second_samples.edges), 1)
         self.assertEqual(second_samples.edges[0].node.id, second._id)
 
+    @drop_datasets
+    async def test_keyset_pagination(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.png" % i,
+                    value=None if i % 4 == 0 else i % 3,
+                )
+                for i in range(25)
+            ]
+        )
+
+        async def _paginate(view, cursors):
+            ids = []
+            after = None
+            while True:
+                results = await paginate_samples(
+                    dataset.name,
+                    view._serialize(),
+                    {},
+                    first=10,
+                    after=after,
+                    pagination_data=True,
+                )
+                ids.extend(str(e.node.id) for e in results.edges)
+                if not results.page_info.has_next_page or len(ids) > 100:
+                    return ids
+
+                after = results.edges[-1].cursor
+                cursors.append(after)
+
+        for view in (
+            dataset.view(),
+            dataset.match(F("value") != 1),
+            dataset.sort_by("value"),
+            dataset.sort_by("value", reverse=True),
+            dataset.sort_by("filepath", reverse=True).exists("value"),
+        ):
+            cursors = []
+            ids = await _paginate(view, cursors)
+
+            self.assertListEqual(sorted(ids), sorted(view.values("id")))
+            if view._stages and isinstance(view._stages[0], fo.SortBy):
+                values = view.select(ids, ordered=True).values("value")
+                self.assertListEqual(values, view.values("value"))
+            else:
+                self.assertListEqual(ids, view.values("id"))
+
+            for cursor in cursors:
+                self.assertFalse(cursor.isdigit())
+
+        # Views that exclude their sort field are paginated via $skip
+        view = dataset.sort_by("value").exclude_fields("value")
+        cursors = []
+        ids = await _paginate(view, cursors)
+        self.assertListEqual(ids, view.values("id"))
+        self.assertListEqual(cursors, ["9", "19"])
+
+        # Integer offsets and views without a stable ordering are paginated
+        # via $skip
+        view = dataset.sort_by("filepath").limit(20)
+        cursors = []
+        ids = await _paginate(view, cursors)
+        self.assertListEqual(ids, view.values("id"))
+        self.assertListEqual(cursors, ["9"])
+
+        results = await paginate_samples(
+            dataset.name, [], {}, first=10, after="19", pagination_data=True
+        )
+        self.assertListEqual(
+            [str(e.node.id) for e in results.edges],
+            dataset.skip(20).values("id"),
+        )
+
+    @drop_datasets
+    async def test_results_cache(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.png" % i, value=i) for i in range(5)]
+        )
+
+        cache = fosc.ResultCache()
+        num_computes = [0]
+
+        async def _count(view):
+            async def compute():
+                num_computes[0] += 1
+                return view.count("value")
+
+            return await cache.get_or_compute(view, ["value"], compute)
+
+        def _view(stages):
+            # Views are rebuilt from serialized stages, like the App does
+            return fosv.get_view(dataset.name, stages=stages)
+
+        view = dataset.match(F("value") > 1)
+
+        self.assertEqual(await _count(_view(view._serialize())), 3)
+        self.assertEqual(await _count(_view(view._serialize())), 3)
+        self.assertEqual(await _count(dataset), 5)
+        self.assertEqual(num_computes[0], 2)
+
+        # Writes invalidate cached results
+        dataset.set_values("value", [None] * 5)
+        self.assertEqual(await _count(_view([])), 0)
+        self.assertEqual(num_computes[0], 3)
+
+        with dataset.save_context() as ctx:
+            for sample in dataset:
+                sample["value"] = 1
+                ctx.save(sample)
+
+        self.assertEqual(await _count(_view([])), 5)
+
+        sample = dataset.first()
+        sample["value"] = None
+        sample.save()
+        self.assertEqual(await _count(_view([])), 4)
+
+        dataset.delete_samples(dataset.last())
+        self.assertEqual(await _count(_view([])), 3)
+        self.assertEqual(num_computes[0], 6)
+
+        # Field-level writes invalidate cached results
+        dataset.clone_sample_field("value", "other")
+        self.assertEqual(await _count(_view([])), 3)
+        dataset.rename_sample_field("other", "another")
+        self.assertEqual(await _count(_view([])), 3)
+        dataset.delete_sample_field("another")
+        self.assertEqual(await _count(_view([])), 3)
+        self.assertEqual(num_computes[0], 9)
+
+        # Results expire
+        cache = fosc.ResultCache(ttl=0.01)
+        self.assertEqual(await _count(dataset), 3)
+        time.sleep(0.02)
+        self.assertEqual(await _count(dataset), 3)
+        self.assertEqual(num_computes[0], 11)
+
+        # Least recently used results are evicted
+        cache = fosc.ResultCache(max_size=2)
+        for limit in range(3):
+            await _count(dataset.limit(limit))
+
+        self.assertEqual(len(cache), 2)
+
+    @drop_datasets
+    async def test_results_cache_coalescing(self):
+        dataset = fo.Dataset()
+        dataset.add_sample(fo.Sample(filepath="image.png"))
+
+        cache = fosc.ResultCache()
+        num_computes = [0]
+
+        async def compute():
+            num_computes[0] += 1
+            result = num_computes[0]
+            await asyncio.sleep(0.1)
+            return result
+
+        results = await asyncio.gather(
+            *[cache.get_or_compute(dataset, ["a"], compute) for _ in range(5)]
+        )
+        self.assertListEqual(results, [1] * 5)
+
+        results = await asyncio.gather(
+            cache.get_or_compute(dataset, ["b"], compute),
+            cache.get_or_compute(dataset, ["c"], compute),
+        )
+        self.assertListEqual(sorted(results), [2, 3])
+
+        async def fail():
+            await asyncio.sleep(0.1)
+            raise ValueError("failed")
+
+        results = await asyncio.gather(
+            *[cache.get_or_compute(dataset, ["d"], fail) for _ in range(3)],
+            return_exceptions=True,
+        )
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+        # Failures are not cached
+        self.assertEqual(
+            await cache.get_or_compute(dataset, ["d"], compute), 4
+        )
+
+        # Cancelling the computing request doesn't cancel the others
+        started = asyncio.Event()
+
+        async def compute_and_notify():
+            started.set()
+            return await compute()
+
+        tasks = [
+            asyncio.create_task(
+                cache.get_or_compute(dataset, ["e"], compute_and_notify)
+            )
+        ]
+        await started.wait()
+        tasks.extend(
+            asyncio.create_task(
+                cache.get_or_compute(dataset, ["e"], compute_and_notify)
+            )
+            for _ in range(2)
+        )
+        await asyncio.sleep(0.05)
+        tasks[0].cancel()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertIsInstance(results[0], asyncio.CancelledError)
+        self.assertListEqual(results[1:], [6, 6])
+        self.assertEqual(num_computes[0], 6)
+
+
+class ServerEmbeddingsTests(unittest.TestCase):
+    def test_get_visible_inds(self):
+        points = np.random.rand(1000, 2)
+
+        inds, visible_count = fose._get_visible_inds(points)
+        self.assertIsNone(inds)
+        self.assertEqual(visible_count, 1000)
+
+        bounds = [[0, 0], [0.5, 0.5]]
+        inds, visible_count = fose._get_visible_inds(points, bounds=bounds)
+        expected = np.flatnonzero(np.all(points <= 0.5, axis=1))
+        self.assertListEqual(inds.tolist(), expected.tolist())
+        self.assertEqual(visible_count, len(expected))
+
+        inds, visible_count = fose._get_visible_inds(
+            points, bounds=bounds, max_points=16
+        )
+        self.assertEqual(visible_count, len(expected))
+        self.assertLessEqual(len(inds), 16)
+        self.assertTrue(set(inds.tolist()).issubset(expected.tolist()))
+
+        # One point per occupied cell
+        cells = np.floor(points[inds] / 0.125).astype(int)
+        self.assertEqual(len(set(map(tuple, cells))), len(inds))
+
+    def test_encode_plot(self):
+        points = np.random.rand(3, 2)
+        ids = [str(ObjectId()) for _ in range(3)]
+        sample_ids = [str(ObjectId()) for _ in range(3)]
+
+        def decode(response, count, has_labels=True):
+            content = response.body
+            self.assertEqual(content[:4], b"FOEP")
+            (header_len,) = struct.unpack("<I", content[4:8])
+            info = json.loads(content[8 : 8 + header_len])
+            offset = 8 + header_len
+            self.assertEqual(offset % 4, 0)
+            self.assertEqual(info["count"], count)
+
+            _points = np.frombuffer(
+                content, dtype="<f4", count=2 * count, offset=offset
+            )
+            offset += 8 * count
+
+            _ids = [
+                content[offset + 12 * i : offset + 12 * (i + 1)].hex()
+                for i in range(count)
+            ]
+            offset += 12 * count
+
+            if info["has_sample_ids"]:
+                _sample_ids = [
+                    content[offset + 12 * i : offset + 12 * (i + 1)].hex()
+                    for i in range(count)
+                ]
+                offset += 12 * count
+            else:
+                _sample_ids = None
+
+            if info["labels_type"] == "float":
+                labels = np.frombuffer(
+                    content, dtype="<f4", count=count, offset=offset
+                ).tolist()
+                offset += 4 * count
+            elif info["labels_type"] == "codes":
+                codes = np.frombuffer(
+                    content, dtype="<i4", count=count, offset=offset
+                )
+                labels = [
+                    info["categories"][c] if c >= 0 else None for c in codes
+                ]
+                offset += 4 * count
+            else:
+                labels = None
+
+            self.assertEqual(offset, len(content))
+            return info, _points.reshape(count, 2), _ids, _sample_ids, labels
+
+        info = {"style": "categorical", "patches_field": "ground_truth"}
+        labels = ["cat", None, "cat"]
+        response = fose._encode_plot(info, points, ids, sample_ids, labels)
+        _info, _points, _ids, _sample_ids, _labels = decode(response, 3)
+        self.assertEqual(_info["patches_field"], "ground_truth")
+        self.assertListEqual(_info["categories"], ["cat"])
+        self.assertTrue(np.allclose(_points, points))
+        self.assertListEqual(_ids, ids)
+        self.assertListEqual(_sample_ids, sample_ids)
+        self.assertListEqual(_labels, labels)
+
+        info = {"style": "continuous", "patches_field": None}
+        labels = [1, None, 2.5]
+        response = fose._encode_plot(info, points, ids, None, labels)
+        _info, _, _ids, _sample_ids, _labels = decode(response, 3)
+        self.assertEqual(_info["labels_type"], "float")
+        self.assertListEqual(_ids, ids)
+        self.assertIsNone(_sample_ids)
+        self.assertEqual(_labels[0], 1)
+        self.assertTrue(math.isnan(_labels[1]))
+        self.assertEqual(_labels[2], 2.5)
+
+        info = {"style": "uncolored", "patches_field": None}
+        response = fose._encode_plot(info, points[:0], [], None, None)
+        _info, _, _ids, _, _labels = decode(response, 0)
+        self.assertIsNone(_info["labels_type"])
+        self.assertListEqual(_ids, [])
+        self.assertIsNone(_labels)
+
 
 class ServerDocTests(unittest.TestCase):
     def test_dataset_doc(self):
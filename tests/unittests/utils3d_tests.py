@@ -238,6 +238,18 @@ class OrthographicProjectionTests(BaseOrthographicProjectionTests):
             get_abs_path("specs/3d/100x100_seed_10_height.png"),
         )
 
+        fou3d.compute_orthographic_projection_images(
+            dataset,
+            size=(100, -1),
+            output_dir=self.temp_dir.name,
+            shading_mode="height",
+            num_workers=2,
+        )
+        self.assertValidProjection(
+            dataset.first()["orthographic_projection_metadata"],
+            get_abs_path("specs/3d/100x100_seed_10_height.png"),
+        )
+
 
 class ParsePointCloudTests(BaseOrthographicProjectionTests):
     def test_rotation_matrix_from_projection_normal(self):
@@ -310,16 +322,69 @@ class DataModelTests(unittest.TestCase):
 
 
 class HelperMethodTests(unittest.TestCase):
-    def test_clamp_to_discrete(self):
+    def test_apply_colormap(self):
+        # Values map to the color of the closest colormap value that is
+        # greater than or equal to them
         discrete = [0.111, 0.222, 0.333, 0.444, 0.555, 1.0]
+        colormap = {v: (i, i, i) for i, v in enumerate(discrete)}
         arr = np.array([0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
 
         expected = np.array(
-            [0.111, 0.111, 0.222, 0.333, 0.444, 0.555, 1.0, 1.0, 1.0, 1.0]
+            [(i, i, i) for i in [0, 0, 1, 2, 3, 4, 5, 5, 5, 5]]
         )
-        actual = fou3d._clamp_to_discrete(arr, discrete)
+        actual = fou3d._apply_colormap(arr, colormap)
         self.assertTrue(np.array_equal(expected, actual))
 
+        actual = fou3d._apply_colormap(
+            np.array([np.nan, 0.555, 2.0]), colormap
+        )
+        self.assertTrue(
+            np.array_equal(actual, [(5, 5, 5), (4, 4, 4), (5, 5, 5)])
+        )
+
+        colors = [(0, 0, 0), (255, 255, 255)]
+        actual = fou3d._apply_colormap(np.array([0.0, 0.5, 1.0]), colors)
+        self.assertTrue(np.array_equal(actual, [colors[0]] + [colors[1]] * 2))
+
+    def test_render_orthographic_projection(self):
+        metadata = fou3d.OrthographicProjectionMetadata(
+            min_bound=(0, 0, 0), max_bound=(1, 1, 1), width=2, height=2
+        )
+
+        # the first three points fall in the same pixel
+        points = np.array(
+            [
+                [0.0, 0.0, 0.5],
+                [0.1, 0.1, 1.0],
+                [0.2, 0.2, 0.0],
+                [1.0, 1.0, 0.0],
+            ]
+        )
+        colors = np.array(
+            [
+                [1.0, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 0.0, 1.0],
+                [1.0, 1.0, 1.0],
+            ]
+        )
+
+        image = fou3d._render_orthographic_projection(
+            points, colors, metadata, shading_mode="rgb"
+        )
+
+        # the highest point is rendered
+        self.assertListEqual(image[1, 0].tolist(), [0, 255, 0])
+        self.assertListEqual(image[0, 1].tolist(), [255, 255, 255])
+        self.assertListEqual(image[0, 0].tolist(), [0, 0, 0])
+
+        image = fou3d._render_orthographic_projection(
+            points, colors, metadata, shading_mode="height"
+        )
+        colormap = fou3d.DEFAULT_SHADING_GRADIENT_MAP
+        self.assertListEqual(image[1, 0].tolist(), list(colormap[1.0]))
+        self.assertListEqual(image[0, 1].tolist(), list(colormap[0.0]))
+
 
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
@@ -5,6 +5,8 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import itertools
+import struct
 import time
 import unittest
 from unittest.mock import MagicMock, patch
@@ -221,6 +223,165 @@ class CoreUtilsTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             fou.to_slug("a" * 101)  # too long
 
+    def test_iter_prefetched(self):
+        self.assertListEqual(
+            list(fou.iter_prefetched(range(100), 3)), list(range(100))
+        )
+        self.assertListEqual(list(fou.iter_prefetched([], 3)), [])
+
+        def _gen():
+            yield 1
+            raise ValueError("error")
+
+        it = fou.iter_prefetched(_gen(), 3)
+        self.assertEqual(next(it), 1)
+        with self.assertRaises(ValueError):
+            next(it)
+
+        closed = []
+
+        def _gen():
+            try:
+                for i in itertools.count():
+                    yield i
+            finally:
+                closed.append(True)
+
+        it = fou.iter_prefetched(_gen(), 3)
+        self.assertEqual(next(it), 0)
+        it.close()
+        self.assertListEqual(closed, [True])
+
+    def test_kll_sketch(self):
+        sketch = fou.KLLSketch()
+        self.assertTrue(np.isnan(sketch.quantiles([0.5])).all())
+
+        # Small streams are summarized exactly
+        sketch.update([3, 1, 2])
+        self.assertListEqual(sketch.quantiles([0, 0.5, 1]).tolist(), [1, 2, 3])
+        self.assertListEqual(sketch.ranks([1, 2.5, 4]).tolist(), [0, 2, 3])
+
+        rng = np.random.default_rng(0)
+        values = rng.standard_normal(200000)
+        sorted_values = np.sort(values)
+        q = np.linspace(0, 1, 11)
+
+        sketch1 = fou.KLLSketch(seed=0)
+        for chunk in np.array_split(values[:100000], 10):
+            sketch1.update(chunk)
+
+        sketch2 = fou.KLLSketch(seed=1).update(values[100000:])
+        sketch1.merge(sketch2)
+
+        self.assertEqual(len(sketch1), len(values))
+        self.assertEqual(sketch1.min, values.min())
+        self.assertEqual(sketch1.max, values.max())
+        self.assertLess(sketch1.num_retained, 1000)
+
+        ranks = np.searchsorted(sorted_values, sketch1.quantiles(q))
+        self.assertLess(np.abs(ranks / len(values) - q).max(), 0.03)
+
+    def test_serialize_numpy_array(self):
+        mask = np.zeros((60, 80), dtype=np.uint8)
+        mask[10:30, 20:50] = 3
+        arrays = [
+            np.random.rand(8).astype(np.float32),
+            np.arange(12, dtype=">i4").reshape(3, 4),
+            np.zeros((2, 0, 3), dtype=bool),
+            np.float64(3.5),
+            np.array([np.nan] * 10 + [1.0] * 10),
+            mask,
+            np.random.randint(0, 255, size=(20, 30), dtype=np.uint8),
+        ]
+        codecs = [None, "raw", "zlib", "rle", "compress", "auto"]
+
+        for array in arrays:
+            for codec, ascii in itertools.product(codecs, (False, True)):
+                data = fou.serialize_numpy_array(
+                    array, ascii=ascii, codec=codec
+                )
+                _array = fou.deserialize_numpy_array(data, ascii=ascii)
+                self.assertEqual(_array.shape, np.shape(array))
+                self.assertEqual(
+                    _array.dtype.newbyteorder("="),
+                    np.asarray(array).dtype.newbyteorder("="),
+                )
+                self.assertTrue(np.array_equal(_array, array, equal_nan=True))
+
+        self.assertLess(
+            len(fou.serialize_numpy_array(mask, codec="rle")),
+            len(fou.serialize_numpy_array(mask)),
+        )
+
+        with self.assertRaises(ValueError):
+            fou.serialize_numpy_array(np.array([{}]), codec="raw")
+
+        with self.assertRaises(ValueError):
+            fou.serialize_numpy_array(mask, codec="foo")
+
+        vectors = np.random.rand(5, 4)
+        for codec in (None, "raw"):
+            data = [fou.serialize_numpy_array(v, codec=codec) for v in vectors]
+            _vectors = fou.deserialize_numpy_arrays(data)
+            self.assertTrue(np.array_equal(_vectors, vectors))
+            self.assertTrue(_vectors.flags.c_contiguous)
+
+        # Arrays serialized with version 1 headers, which have no codec ID
+        header = (
+            b"\x93FOARR\x01"
+            + struct.pack("<BB", 3, 1)
+            + b"<f8"
+            + struct.pack("<Q", 4)
+        )
+        data = [header + v.astype("<f8").tobytes() for v in vectors]
+        self.assertTrue(
+            np.array_equal(fou.deserialize_numpy_array(data[0]), vectors[0])
+        )
+        self.assertTrue(
+            np.array_equal(fou.deserialize_numpy_arrays(data), vectors)
+        )
+
+        # Mixed formats and dtypes fall back to per-array decoding
+        data = [
+            fou.serialize_numpy_array(vectors[0], codec="raw"),
+            fou.serialize_numpy_array(
+                vectors[1].astype(np.float32), codec="raw"
+            ),
+            fou.serialize_numpy_array(vectors[2], codec="zlib"),
+            fou.serialize_numpy_array(vectors[3]),
+        ]
+        _vectors = fou.deserialize_numpy_arrays(data)
+        self.assertTrue(np.allclose(_vectors, vectors[:4]))
+
+    @drop_datasets
+    def test_array_field_codecs(self):
+        mask = np.zeros((60, 80), dtype=np.uint8)
+        mask[10:30, 20:50] = 3
+        heatmap = np.random.rand(30, 40)
+
+        dataset = fo.Dataset()
+        dataset.add_sample(
+            fo.Sample(
+                filepath="image.jpg",
+                segmentation=fo.Segmentation(mask=mask),
+                heatmap=fo.Heatmap(map=heatmap),
+                embedding=np.random.rand(16),
+            )
+        )
+
+        d = dataset._sample_collection.find_one({})
+        self.assertEqual(
+            fou._parse_array_header(d["segmentation"]["mask"])[0], "rle"
+        )
+        self.assertEqual(
+            fou._parse_array_header(d["heatmap"]["map"])[0], "raw"
+        )
+        self.assertEqual(fou._parse_array_header(d["embedding"])[0], "raw")
+
+        sample = dataset.first()
+        self.assertTrue(np.array_equal(sample.segmentation.mask, mask))
+        self.assertTrue(np.array_equal(sample.heatmap.map, heatmap))
+
 
 class LabelsTests(unittest.TestCase):
     @drop_datasets
@@ -132,8 +132,11 @@ class VideoTests(unittest.TestCase):
         default_indexes = {
             "id",
             "filepath",
+            "_rand",
+            "_last_modified_at",
             "frames.id",
             "frames._sample_id_1_frame_number_1",
+            "frames._last_modified_at",
         }
         self.assertSetEqual(set(info.keys()), default_indexes)
         self.assertSetEqual(set(indexes), default_indexes)
@@ -1503,9 +1506,12 @@ class VideoTests(unittest.TestCase):
         default_indexes = {
             "id",
             "filepath",
+            "_rand",
+            "_last_modified_at",
             "sample_id",
             "frames.id",
             "frames._sample_id_1_frame_number_1",
+            "frames._last_modified_at",
         }
         self.assertSetEqual(set(index_info.keys()), default_indexes)
         self.assertSetEqual(set(indexes), default_indexes)
@@ -1901,6 +1907,8 @@ class VideoTests(unittest.TestCase):
         default_indexes = {
             "id",
             "filepath",
+            "_rand",
+            "_last_modified_at",
             "sample_id",
             "_sample_id_1_frame_number_1",
         }
@@ -2101,6 +2109,50 @@ class VideoTests(unittest.TestCase):
         self.assertTrue(still_view.is_saved)
         self.assertEqual(still_view, view)
 
+    @drop_datasets
+    def test_to_frames_incremental_reload(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="video%d.mp4" % i, metadata=fo.VideoMetadata()
+                )
+                for i in range(2)
+            ]
+        )
+        for sample in dataset:
+            for frame_number in range(1, 9):
+                sample.frames[frame_number] = fo.Frame(
+                    filepath="frame%d.jpg" % frame_number,
+                    gt=fo.Detections(detections=[fo.Detection(label="cat")]),
+                )
+            sample.save()
+
+        frames = dataset.to_frames()
+        self.assertEqual(len(frames), 16)
+
+        # No-op reloads don't regenerate any frames
+        with self.assertNoLogs("fiftyone.core.video"):
+            frames.reload()
+
+        self.assertEqual(len(frames), 16)
+
+        frame = dataset.first().frames.first()
+        frame.gt.detections.append(fo.Detection(label="dog"))
+        frame.save()
+
+        # The patches are generated from the frames before they are synced
+        patches = frames.to_patches("gt")
+        self.assertEqual(len(patches), 16)
+
+        # Views generated from generated views see synced frames
+        patches.reload()
+
+        self.assertEqual(len(patches), 17)
+        self.assertEqual(
+            len(patches), len(dataset.to_frames().to_patches("gt"))
+        )
+
     @drop_datasets
     def test_to_frames_schema(self):
         sample = fo.Sample(filepath="video.mp4")
@@ -2298,6 +2350,8 @@ class VideoTests(unittest.TestCase):
         default_indexes = {
             "id",
             "filepath",
+            "_rand",
+            "_last_modified_at",
             "sample_id",
             "_sample_id_1_frame_number_1",
         }
@@ -2544,6 +2598,8 @@ class VideoTests(unittest.TestCase):
         default_indexes = {
             "id",
             "filepath",
+            "_rand",
+            "_last_modified_at",
             "sample_id",
             "frame_id",
             "_sample_id_1_frame_number_1",
@@ -4249,6 +4249,47 @@ class ViewStageTests(unittest.TestCase):
         result = list(self.dataset.take(1))
         self.assertIs(len(result), 1)
 
+    @drop_datasets
+    def test_take_seed(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, i=i) for i in range(50)]
+        )
+
+        for seed in (1, 2, 51):
+            ids = dataset.take(10, seed=seed).values("i")
+            self.assertEqual(len(set(ids)), 10)
+            self.assertListEqual(dataset.take(10, seed=seed).values("i"), ids)
+
+            # Indexed and unindexed strategies select the same samples
+            self.assertListEqual(
+                dataset.match({}).take(10, seed=seed).values("i"), ids
+            )
+
+        # Wraps around the collection
+        self.assertSetEqual(
+            set(dataset.take(50, seed=51).values("i")), set(range(50))
+        )
+        self.assertEqual(len(dataset.take(100, seed=51)), 50)
+
+        view = dataset.take(10, seed=51)
+        also_view = fo.DatasetView._build(dataset, view._serialize())
+        self.assertListEqual(also_view.values("i"), view.values("i"))
+
+        # Existing views reflect samples that are deleted
+        view = dataset.take(10, seed=51)
+        self.assertListEqual(view.values("i"), ids)
+
+        dataset.delete_samples(dataset.sort_by("_rand").limit(25))
+
+        self.assertListEqual(
+            view.values("i"), dataset.take(10, seed=51).values("i")
+        )
+
+        # Stages serialized without a pivot use the legacy strategy
+        stage = fosg.Take(10, _randint=12345)
+        self.assertEqual(len(set(dataset.add_stage(stage).values("i"))), 10)
+
     def test_uuids(self):
         stage = fosg.Take(1)
         stage_dict = stage._serialize()